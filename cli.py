@@ -55,6 +55,7 @@ def _discover_games():
             # try to read declared minimum terminal size from the game file
             min_cols = None
             min_rows = None
+            order = None
             try:
                 with open(file_to_check, 'r', encoding='utf-8') as fh:
                     src = fh.read()
@@ -79,13 +80,16 @@ def _discover_games():
                         min_cols = int(m1.group(1))
                     if m2:
                         min_rows = int(m2.group(1))
+                mo = re.search(r'MENU_ORDER\s*=\s*(\d+)', src)
+                if mo:
+                    order = int(mo.group(1))
             except Exception:
                 min_cols = None
                 min_rows = None
             # use directory name as the display name
             name = entry.replace('_', ' ').title()
             rel = os.path.relpath(file_to_check, base).replace('\\', '/')
-            games.append((name, rel))
+            games.append((order, name, rel))
             try:
                 # store extracted description by slug (directory name)
                 if desc_text:
@@ -96,7 +100,10 @@ def _discover_games():
                 GAME_MINS[rel] = (min_cols, min_rows)
             except Exception:
                 pass
-    return games
+    # games declaring MENU_ORDER keep their index; the rest follow by name,
+    # so adding a game never renumbers the existing ones
+    games.sort(key=lambda g: (g[0] is None, g[0] or 0))
+    return [(name, rel) for _, name, rel in games]
 
 
 GAME_MINS = {}
@@ -371,8 +378,12 @@ def _menu(stdscr):
             top = sel - avail + 1
 
 
-def _run_game_by_index(choice, from_menu=False):
-    """Load and run the game given by numeric index in GAMES."""
+def _run_game_by_index(choice, from_menu=False, bot=None, bot_budget=None):
+    """Load and run the game given by numeric index in GAMES.
+
+    With `bot` (a 'module:name' policy spec) the menu is skipped and the
+    policy plays the game, restarting after each game over until ESC.
+    """
     name, relpath = GAMES[choice]
     base = os.path.dirname(__file__)
     path = os.path.join(base, relpath)
@@ -420,7 +431,25 @@ def _run_game_by_index(choice, from_menu=False):
             except Exception:
                 pass
 
-            ptk.wrapper(mod.main)
+            if bot:
+                from game_classes.bot import BotDriver, bot_main
+                from game_classes.headless import resolve_policy
+                try:
+                    if os.getcwd() not in sys.path:
+                        sys.path.insert(0, os.getcwd())
+                    driver = BotDriver(resolve_policy(bot), bot_budget)
+                except Exception as e:
+                    print(f"  [ERROR] Failed to load bot {bot}: {e}")
+                    return
+                try:
+                    ptk.wrapper(bot_main(mod, driver))
+                finally:
+                    rep = driver.report()
+                    budget = f"{rep['budget_ms']} ms" if rep['budget_ms'] is not None else '1/4 tick'
+                    print(f"  [BOT] games: {rep['games']}, ticks: {rep['calls']}, overruns: {rep['overruns']} "
+                          f"(budget {budget}, mean {rep['mean_ms']} ms, worst {rep['worst_ms']} ms)")
+            else:
+                ptk.wrapper(mod.main)
             # If launched via `clia run`, exit the process after the game ends.
             if not from_menu:
                 try:
@@ -439,18 +468,22 @@ def _reset_game_by_index(choice, yes=False):
     game_dir = os.path.dirname(os.path.join(base, relpath))
     # find highscores files (common pattern in project) and user-data highscores
     files = glob.glob(os.path.join(game_dir, 'highscores*.json'))
+    slug = os.path.basename(game_dir)
+    store = None
+    rows = 0
     # try user-data location via HighScores
     try:
         from game_classes.highscores import HighScores
-        slug = os.path.basename(game_dir)
         hs = HighScores(slug)
-        user_path = hs._path()
-        if user_path and os.path.exists(user_path):
-            files.append(user_path)
+        store = hs.store
+        # snapshot plus any journal/history/lock files next to it
+        files.extend(store.files(hs._path()))
+        # rows in the scores database (sqlite backend)
+        rows = store.count(slug)
     except Exception:
         # if import fails or path not available, ignore
         pass
-    if not files:
+    if not files and not rows:
         print(f"  [INFO] No highscore files found for '{name}' ({game_dir}).")
         return
     # dedupe and present
@@ -458,6 +491,8 @@ def _reset_game_by_index(choice, yes=False):
     print(f"  [INFO] Found {len(files)} highscore file(s) for '{name}':")
     for f in files:
         print(f'    [{choice}] {f}')
+    if rows:
+        print(f"  [INFO] Found {rows:,} score row(s) for '{name}' in {store.db().path}")
     if not yes:
         ans = input(f"  [ACTION] Delete these files for '{name}'? [y/N]: ")
         if not ans.lower().startswith('y'):
@@ -469,11 +504,19 @@ def _reset_game_by_index(choice, yes=False):
             print(f"  [DELETED] {f}")
         except Exception as e:
             print(f"  [ERROR] Failed to delete {f}: {e}")
+    if rows:
+        try:
+            print(f"  [DELETED] {store.clear(slug):,} score row(s) for '{name}'")
+        except Exception as e:
+            print(f"  [ERROR] Failed to delete score rows for '{name}': {e}")
 
 
 def _reset_all_games(yes=False):
     base = os.path.dirname(__file__)
     all_files = []
+    # slug -> rows in the scores database (sqlite backend)
+    db_rows = {}
+    store = None
     for name, rel in GAMES:
         game_dir = os.path.dirname(os.path.join(base, rel))
         all_files.extend(glob.glob(os.path.join(game_dir, 'highscores*.json')))
@@ -482,12 +525,14 @@ def _reset_all_games(yes=False):
             from game_classes.highscores import HighScores
             slug = os.path.basename(game_dir)
             hs = HighScores(slug)
-            user_path = hs._path()
-            if user_path and os.path.exists(user_path):
-                all_files.append(user_path)
+            store = hs.store
+            all_files.extend(store.files(hs._path()))
+            rows = store.count(slug)
+            if rows:
+                db_rows[slug] = rows
         except Exception:
             pass
-    if not all_files:
+    if not all_files and not db_rows:
         print('  [INFO] No highscore files found for any game.')
         return
     # dedupe list before showing
@@ -495,6 +540,8 @@ def _reset_all_games(yes=False):
     print(f'  [INFO] Found {len(all_files)} highscore file(s):')
     for i, f in enumerate(all_files):
         print(f'    [{i}] {f}')
+    if db_rows:
+        print(f'  [INFO] Found {sum(db_rows.values()):,} score row(s) for {len(db_rows)} game(s) in {store.db().path}')
     if not yes:
         ans = input('  [ACTION] Delete all these highscore files? [y/N]: ')
         if not ans.lower().startswith('y'):
@@ -506,6 +553,48 @@ def _reset_all_games(yes=False):
             print(f"  [DELETED] {f}")
         except Exception as e:
             print(f"  [ERROR] Failed to delete {f}: {e}")
+    for slug in db_rows:
+        try:
+            print(f"  [DELETED] {store.clear(slug):,} score row(s) for '{slug}'")
+        except Exception as e:
+            print(f"  [ERROR] Failed to delete score rows for '{slug}': {e}")
+
+
+def _parse_since(text):
+    """Epoch seconds for `--since`: an ISO date/time, or an age like 30m, 12h, 7d."""
+    text = str(text).strip()
+    m = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([smhdw])', text.lower())
+    if m:
+        unit = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}[m.group(2)]
+        return time.time() - float(m.group(1)) * unit
+    from datetime import datetime
+    return datetime.fromisoformat(text).timestamp()
+
+def _resolve_game(token, exact=False):
+    """Resolve a zero-based index or (partial) game name to an index in GAMES.
+
+    With `exact` only an index or the full name (any case) matches, for
+    destructive commands.
+    """
+    try:
+        idx = int(token)
+        if 0 <= idx < len(GAMES):
+            return idx
+        print(f"  [INFO] Index out of range: {idx}")
+    except Exception:
+        lowered = token.lower()
+        for i, (name, _) in enumerate(GAMES):
+            if name.lower() == lowered:
+                return i
+        if not exact:
+            for i, (name, _) in enumerate(GAMES):
+                if lowered in name.lower():
+                    return i
+        print(f"  [INFO] Game not found: {token}")
+    for i, (name, rel) in enumerate(GAMES):
+        print(f"    [{i}] {name}")
+    return None
+
 
 # CLI version: read from setup.cfg to keep a single source of truth
 def _read_version_from_setupcfg():
@@ -526,9 +615,11 @@ def main():
         'Commands:',
         f'  %(prog)s [-h|--help] [-v|--version]',
         f'  %(prog)s list [-h]',
-        f'  %(prog)s run [-h] <index|name>',
+        f'  %(prog)s run [-h] <index|name> [--bot module:Policy] [--bot-budget MS]',
         f'  %(prog)s reset [-h] [<index|name>] [-y|--yes]',
-        f'  %(prog)s scores [-h] [<index|name>] [-r|--raw]',
+        f'  %(prog)s scores [-h] [<index|name>] [-r|--raw] [--export-since WATERMARK] [--lock-stats]',
+        f'  %(prog)s bench [-h] [<index|name>] [-t|--ticks N] [--size COLSxROWS] [-o|--output FILE]',
+        f'  %(prog)s batch [-h] <index|name> [-n|--sessions N] [-w|--workers N] [--policy module:name]',
     ]
     aliases = _read_console_aliases()
     if aliases:
@@ -555,10 +646,12 @@ def main():
         'run',
         help='Run a game by name or zero-based index',
         description='Run a game directly without the menu.',
-        epilog='Examples:\n  %(prog)s 0\n  %(prog)s "Byte Bouncer"\n',
+        epilog='Examples:\n  %(prog)s 0\n  %(prog)s "Byte Bouncer"\n  %(prog)s "Star Ship" --bot mybots:Greedy --bot-budget 5\n',
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     runp.add_argument('game', help='Game name or zero-based index')
+    runp.add_argument('--bot', default=None, help="Let a policy play: 'module:Policy' (see game_classes.bot)")
+    runp.add_argument('--bot-budget', type=float, default=None, help='Per-tick bot time budget in ms (default: 1/4 of the game tick)')
     resetp = sub.add_parser(
         'reset',
         help='Reset highscores (delete highscore files)',
@@ -573,15 +666,58 @@ def main():
         'scores',
         help='Show highscores for games',
         description='Print highscores for all games or a specific game. Optionally output raw JSON.',
-        epilog='Examples:\n  %(prog)s scores\n  %(prog)s scores 0\n  %(prog)s scores "Byte Bouncer"\n  %(prog)s scores -r\n',
+        epilog='Examples:\n  %(prog)s scores\n  %(prog)s scores 0\n  %(prog)s scores "Byte Bouncer"\n  %(prog)s scores -r\n'
+               '  %(prog)s scores 0 --top 10\n  %(prog)s scores --player Alice\n  %(prog)s scores --since 7d --top 5\n'
+               '  %(prog)s scores --export-since 0 > delta.jsonl\n  %(prog)s scores --lock-stats\n',
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     scoresp.add_argument('game', nargs='?', help='Optional game name or zero-based index')
     scoresp.add_argument('-raw', '--raw', action='store_true', help='Output raw JSON string')
+    scoresp.add_argument('-player', '--player', help="Only this player's scores")
+    scoresp.add_argument('-top', '--top', type=int, help='Show the top N entries of each leaderboard')
+    scoresp.add_argument('-since', '--since', help='Only scores set since an ISO date/time or an age like 7d, 12h (sqlite backend)')
+    scoresp.add_argument('--export-since', metavar='WATERMARK',
+                         help="Print entries changed since WATERMARK ('0' for all) as JSON lines, ending with the next watermark")
+    scoresp.add_argument('--lock-stats', action='store_true',
+                         help='Print how often highscore writers waited on each other (all runs so far)')
+
+    benchp = sub.add_parser(
+        'bench',
+        help='Benchmark games headlessly and print JSON results',
+        description='Run each game headlessly with a fixed seed and scripted input for a fixed number of ticks '
+                    'at several terminal sizes, and report ticks/s, frames/s, bytes/frame, peak RSS and allocations as JSON.',
+        epilog='Examples:\n  %(prog)s\n  %(prog)s 0 -t 2000\n  %(prog)s --size 120x40 --size 250x70 -o bench.json\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    benchp.add_argument('game', nargs='?', help='Optional game name or zero-based index (omit to benchmark all)')
+    benchp.add_argument('-ticks', '--ticks', type=int, default=500, help='Ticks to run per game and size (default: 500)')
+    benchp.add_argument('-seed', '--seed', type=int, default=1234, help='Random seed for the game and the input script (default: 1234)')
+    benchp.add_argument('-size', '--size', action='append', help='Terminal size COLSxROWS; repeatable (default: 80x24, 120x40, 250x70)')
+    benchp.add_argument('-output', '--output', help='Write the JSON report to this file instead of stdout')
+    benchp.add_argument('--inproc', action='store_true', help='Run all cases in this process (faster, but RSS is not per case)')
+
+    batchp = sub.add_parser(
+        'batch',
+        help='Run many headless game sessions in parallel',
+        description='Run full headless sessions of one game across a process pool and print aggregated '
+                    'scores, ticks survived and crashes as JSON.',
+        epilog='Examples:\n  %(prog)s 0 -n 1000\n  %(prog)s "Star Ship" -n 5000 -w 32 --policy mybots:Greedy --results runs.jsonl\n',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    batchp.add_argument('game', help='Game name or zero-based index')
+    batchp.add_argument('-n', '--sessions', type=int, default=100, help='Number of sessions to run (default: 100)')
+    batchp.add_argument('-w', '--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    batchp.add_argument('--chunksize', type=int, default=None, help='Sessions per work item (default: automatic)')
+    batchp.add_argument('--max-ticks', type=int, default=5000, help='Tick limit per session (default: 5000)')
+    batchp.add_argument('-seed', '--seed', type=int, default=0, help='Seed of the first session; session i uses seed+i (default: 0)')
+    batchp.add_argument('--size', default='120x40', help='Terminal size COLSxROWS (default: 120x40)')
+    batchp.add_argument('--policy', default=None, help="Input policy 'module:name' called once per tick (default: scripted keys)")
+    batchp.add_argument('--results', default=None, help='Stream per-session results to this file as JSON lines')
 
     # Hidden commands for devs
     syncp = sub.add_parser('sync')
-    syncp.add_argument('scores')
+    syncp.add_argument('scores', nargs='?')
+    syncp.add_argument('-file', '--file', help="JSON lines of scores to merge ('-' for stdin)")
     newp = sub.add_parser('new')
     newp.add_argument('name')
     findp = sub.add_parser('find')
@@ -591,8 +727,25 @@ def main():
     # Hidden dev commands
     if args.cmd == 'sync':
         import json
-        from game_classes.highscores import merge_update_highscores
+        from game_classes.highscores import merge_update_highscores, sync_score_lines
         scores_str = getattr(args, 'scores', None)
+        source = getattr(args, 'file', None)
+        if source is None and not scores_str and not sys.stdin.isatty():
+            source = '-'
+        if source is not None:
+            # stream JSON lines: one pass, then one merge per game
+            try:
+                if source == '-':
+                    batch, updated = sync_score_lines(sys.stdin)
+                else:
+                    with open(source, 'r', encoding='utf-8') as fh:
+                        batch, updated = sync_score_lines(fh)
+            except OSError as e:
+                print(f'Failed to read scores: {e}')
+                return
+            print(f'Read {batch.lines} lines ({batch.skipped} skipped).')
+            print(f'Synced games: {updated}')
+            return
         if not scores_str:
             print('No scores string provided.')
             return
@@ -674,6 +827,8 @@ def main():
                     p = hs._path()
                     if p:
                         user_paths.add(p)
+                        # journal, history and lock files next to it
+                        user_paths.update(hs.store.files(p))
                 except Exception:
                     pass
         except Exception:
@@ -685,6 +840,14 @@ def main():
                 print(f'  {p}')
         else:
             print('  [INFO] No user highscore files found.')
+        try:
+            from game_classes.highscores import get_store
+            store = get_store()
+            if store.backend == 'sqlite':
+                print('Highscores database:')
+                print(f'  {store.db().path}')
+        except Exception:
+            pass
 
         # Executable information: try to resolve installed console_scripts
         try:
@@ -751,38 +914,12 @@ def main():
         selected_dir = None
         selected_display = None
         if token is not None:
-            # Try integer index
-            try:
-                idx = int(token)
-                if 0 <= idx < len(games):
-                    # store both display name and directory name
-                    selected_display, rel = games[idx]
-                    selected_dir = os.path.basename(os.path.dirname(rel))
-                else:
-                    print(f"  [INFO] Index out of range: {idx}")
-                    for i, (name, rel) in enumerate(games):
-                        print(f"    [{i}] {name}")
-                    return
-            except Exception:
-                # Match by exact name (case-insensitive)
-                lowered = token.lower()
-                for i, (name, rel) in enumerate(games):
-                    if name.lower() == lowered:
-                        selected_display = name
-                        selected_dir = os.path.basename(os.path.dirname(rel))
-                        break
-                # Substring match
-                if selected_dir is None:
-                    for i, (name, rel) in enumerate(games):
-                        if lowered in name.lower():
-                            selected_display = name
-                            selected_dir = os.path.basename(os.path.dirname(rel))
-                            break
-                if selected_dir is None:
-                    print(f"  [INFO] Game not found: {token}")
-                    for i, (name, rel) in enumerate(games):
-                        print(f"    [{i}] {name}")
-                    return
+            choice = _resolve_game(token)
+            if choice is None:
+                return
+            # store both display name and directory name
+            selected_display, rel = games[choice]
+            selected_dir = os.path.basename(os.path.dirname(rel))
         def pretty_print_scores(game, scores, tab=''):
             # Convert snake_case dir names (e.g. byte_bouncer_2) to Title Case
             print(f"{tab}{game.replace('_', ' ').title()}")
@@ -805,6 +942,87 @@ def main():
                 else:
                     print(f"{tab}  {key}: {value}")
 
+        if getattr(args, 'lock_stats', False):
+            # lock contention between processes sharing the data directory
+            from game_classes.highscores import get_store
+            stats = get_store().saved_lock_stats()
+            if raw:
+                print(json.dumps(stats))
+                return
+            share = 100.0 * stats['contended'] / stats['acquired'] if stats['acquired'] else 0.0
+            print("Highscore locks")
+            print(f"  acquired: {stats['acquired']:,}")
+            print(f"  contended: {stats['contended']:,} ({share:.1f}%)")
+            print(f"  wait: total {stats['wait_total']:.3f}s, avg {stats['wait_avg'] * 1000:.2f}ms, "
+                  f"max {stats['wait_max'] * 1000:.2f}ms")
+            return
+
+        export_token = getattr(args, 'export_since', None)
+        if export_token is not None:
+            # delta export: one compact {game: scores} line per changed game, then the watermark
+            from game_classes.highscores import export_since
+            try:
+                changes, watermark = export_since(export_token, selected_dir)
+            except ValueError as e:
+                print(f"  [ERROR] Invalid --export-since: {e}")
+                return
+            for game, scores in changes.items():
+                print(json.dumps({game: scores}, ensure_ascii=False, separators=(',', ':')))
+            print(json.dumps({'watermark': watermark}))
+            return
+
+        player = getattr(args, 'player', None)
+        top = getattr(args, 'top', None)
+        since_arg = getattr(args, 'since', None)
+        if player is not None or top is not None or since_arg is not None:
+            # leaderboard queries: one ranked list per metric
+            from game_classes.highscores import get_store
+            since = None
+            if since_arg is not None:
+                try:
+                    since = _parse_since(since_arg)
+                except Exception:
+                    print(f"  [ERROR] Invalid --since: {since_arg} (use an ISO date/time or an age like 7d, 12h)")
+                    return
+            if top is not None and top < 1:
+                print('  [ERROR] --top must be at least 1')
+                return
+            store = get_store()
+            if selected_dir:
+                targets = [(selected_dir, selected_display or selected_dir)]
+            else:
+                targets = [(os.path.basename(os.path.dirname(rel)), name) for name, rel in games]
+            mapping = {}
+            for slug, disp in targets:
+                boards = store.query(slug, player=player, top=top, since=since)
+                if boards is None:
+                    print(f"  [INFO] --since needs the sqlite scores backend ({store.backend} does not record when scores were set)")
+                    return
+                if boards:
+                    mapping[slug] = boards
+            if raw:
+                out = json.dumps({
+                    slug: {metric: [{'player': p, 'value': v} for p, v in rows] for metric, rows in boards.items()}
+                    for slug, boards in mapping.items()
+                })
+                print(out.replace('"', '\\"'))
+                return
+            if not mapping:
+                print("  [INFO] No matching highscores")
+                return
+            print("Leaderboard")
+            for slug, boards in mapping.items():
+                print(f"  {slug.replace('_', ' ').title()}")
+                for metric, rows in boards.items():
+                    print(f"    {metric}:")
+                    for rank, (p, v) in enumerate(rows, 1):
+                        try:
+                            val_str = f"{int(float(v)):,}"
+                        except Exception:
+                            val_str = str(v)
+                        print(f"      {rank}. {p} - {val_str}")
+            return
+
         from game_classes.highscores import get_saved_highscores
 
         if selected_dir:
@@ -831,6 +1049,80 @@ def main():
                     pretty_print_scores(r['game'], r['scores'], '  ')
         return
 
+    if args.cmd == 'bench':
+        import json
+        from game_classes.bench import DEFAULT_SIZES, parse_size, run_benchmarks
+        base = os.path.dirname(__file__)
+        if args.game is None:
+            selected = list(range(len(GAMES)))
+        else:
+            choice = _resolve_game(args.game)
+            if choice is None:
+                return
+            selected = [choice]
+        try:
+            sizes = [parse_size(s) for s in args.size] if args.size else list(DEFAULT_SIZES)
+        except Exception as e:
+            print(f"  [ERROR] Invalid --size: {e}")
+            return
+        paths = [os.path.join(base, GAMES[i][1]) for i in selected]
+        report = run_benchmarks(paths, sizes=sizes, ticks=max(1, args.ticks), seed=args.seed, isolate=not args.inproc)
+        report['version'] = _read_version_from_setupcfg()
+        out = json.dumps(report, indent=2)
+        if args.output:
+            try:
+                with open(args.output, 'w', encoding='utf-8') as fh:
+                    fh.write(out + '\n')
+                print(f"  [INFO] Benchmark results written to {args.output}")
+            except Exception as e:
+                print(f"  [ERROR] Failed to write {args.output}: {e}")
+        else:
+            print(out)
+        return
+
+    if args.cmd == 'batch':
+        import json
+        from game_classes.bench import parse_size
+        from game_classes.batch import run_batch
+        from game_classes.headless import resolve_policy
+        choice = _resolve_game(args.game)
+        if choice is None:
+            return
+        try:
+            cols, rows = parse_size(args.size)
+        except Exception as e:
+            print(f"  [ERROR] Invalid --size: {e}")
+            return
+        if args.policy:
+            # fail fast here instead of once per session in the workers
+            try:
+                if os.getcwd() not in sys.path:
+                    sys.path.insert(0, os.getcwd())
+                resolve_policy(args.policy)
+            except Exception as e:
+                print(f"  [ERROR] Failed to load policy {args.policy}: {e}")
+                return
+        path = os.path.join(os.path.dirname(__file__), GAMES[choice][1])
+        stream = None
+        if args.results:
+            try:
+                stream = open(args.results, 'w', encoding='utf-8')
+            except Exception as e:
+                print(f"  [ERROR] Failed to open {args.results}: {e}")
+                return
+        try:
+            summary = run_batch(
+                path, args.sessions, workers=args.workers, chunksize=args.chunksize,
+                max_ticks=max(1, args.max_ticks), seed=args.seed, policy=args.policy,
+                cols=cols, rows=rows,
+                on_result=(lambda r: stream.write(json.dumps(r) + '\n')) if stream else None,
+            )
+        finally:
+            if stream:
+                stream.close()
+        print(json.dumps(summary, indent=2))
+        return
+
     if args.cmd == 'list':
         base = os.path.dirname(__file__)
         for i, (name, rel) in enumerate(GAMES):
@@ -838,39 +1130,13 @@ def main():
         return
 
     if args.cmd == 'run':
-        token = args.game
-        choice = None
-        # try integer (zero-based index)
-        try:
-            idx = int(token)
-            if 0 <= idx < len(GAMES):
-                choice = idx
-            else:
-                print(f"  [INFO] Index out of range: {idx}")
-                for i, (name, rel) in enumerate(GAMES):
-                    print(f"    [{i}] {name}")
-                return
-        except Exception:
-            # match by exact name (case-insensitive)
-            lowered = token.lower()
-            for i, (name, _) in enumerate(GAMES):
-                if name.lower() == lowered:
-                    choice = i
-                    break
-            # fallback: substring match
-            if choice is None:
-                for i, (name, _) in enumerate(GAMES):
-                    if lowered in name.lower():
-                        choice = i
-                        break
-            if choice is None:
-                print(f"  [INFO] Game not found: {token}")
-                for i, (name, rel) in enumerate(GAMES):
-                    print(f"    [{i}] {name}")
-                return
+        choice = _resolve_game(args.game)
+        if choice is None:
+            return
         # run the selected game (skip menu)
         try:
-            _run_game_by_index(choice, from_menu=False)
+            budget = args.bot_budget / 1000.0 if args.bot_budget is not None else None
+            _run_game_by_index(choice, from_menu=False, bot=args.bot, bot_budget=budget)
         except Exception as e:
             print(f"  [ERROR] Error running game: {e}")
         return
@@ -881,24 +1147,10 @@ def main():
         if token is None:
             _reset_all_games(yes=yes)
             return
-        # resolve token to index similar to 'run'
-        choice = None
-        try:
-            idx = int(token)
-            if 0 <= idx < len(GAMES):
-                choice = idx
-            else:
-                print(f"  [INFO] Index out of range: {idx}")
-                return
-        except Exception:
-            lowered = token.lower()
-            for i, (name, _) in enumerate(GAMES):
-                if name.lower() == lowered:
-                    choice = i
-                    break
-            if choice is None:
-                print(f"  [INFO] Game not found: {token}")
-                return
+        # no partial names: a typo must not delete another game's scores
+        choice = _resolve_game(token, exact=True)
+        if choice is None:
+            return
         _reset_game_by_index(choice, yes=yes)
         return
 
@@ -0,0 +1,170 @@
+"""Fan headless game sessions out over a process pool (`clia batch`)."""
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from game_classes.headless import load_game_module, game_slug, resolve_policy, run_session
+
+# per-worker state set up by `_init_worker`
+_WORKER = {}
+
+
+def _init_worker(path, policy):
+    # import the game (and policy) once per worker, not once per session
+    _WORKER['mod'] = load_game_module(path)
+    _WORKER['policy_spec'] = policy
+
+
+def _run_chunk(seeds, max_ticks, cols, rows):
+    mod = _WORKER['mod']
+    results = []
+    for seed in seeds:
+        try:
+            # a fresh policy per session so stateful policies start clean
+            policy = resolve_policy(_WORKER['policy_spec'])
+            stats = run_session(mod, max_ticks, seed=seed, cols=cols, rows=rows,
+                                render=False, restart=False, policy=policy, draw=False)
+            results.append({
+                'seed': seed,
+                'ticks': stats['ticks'],
+                'over': stats['over'],
+                'scores': stats['scores'],
+                'bot_overruns': stats['bot']['overruns'] if stats['bot'] else 0,
+                'crashed': False,
+            })
+        except Exception as e:
+            results.append({
+                'seed': seed,
+                'ticks': 0,
+                'over': True,
+                'scores': {},
+                'crashed': True,
+                'error': f'{type(e).__name__}: {e}',
+                'traceback': traceback.format_exc(limit=5),
+            })
+    return results
+
+
+class BatchStats:
+    """Streaming aggregate of session results (no per-session storage)."""
+
+    def __init__(self):
+        self.sessions = 0
+        self.crashes = 0
+        self.games_over = 0
+        self.ticks_total = 0
+        self.ticks_min = None
+        self.ticks_max = None
+        self.bot_overruns = 0
+        self.metrics = {}
+        self.errors = {}
+
+    def add(self, result):
+        self.sessions += 1
+        if result.get('crashed'):
+            self.crashes += 1
+            err = result.get('error', 'unknown')
+            self.errors[err] = self.errors.get(err, 0) + 1
+            return
+        if result.get('over'):
+            self.games_over += 1
+        self.bot_overruns += int(result.get('bot_overruns', 0))
+        ticks = int(result.get('ticks', 0))
+        self.ticks_total += ticks
+        self.ticks_min = ticks if self.ticks_min is None else min(self.ticks_min, ticks)
+        self.ticks_max = ticks if self.ticks_max is None else max(self.ticks_max, ticks)
+        for metric, value in result.get('scores', {}).items():
+            try:
+                value = float(value)
+            except Exception:
+                continue
+            agg = self.metrics.get(metric)
+            if agg is None:
+                self.metrics[metric] = [1, value, value, value]
+            else:
+                agg[0] += 1
+                agg[1] += value
+                agg[2] = min(agg[2], value)
+                agg[3] = max(agg[3], value)
+
+    def summary(self):
+        completed = self.sessions - self.crashes
+        return {
+            'sessions': self.sessions,
+            'crashes': self.crashes,
+            'games_over': self.games_over,
+            'bot_overruns': self.bot_overruns,
+            'ticks_survived': {
+                'mean': round(self.ticks_total / completed, 2) if completed else 0,
+                'min': self.ticks_min,
+                'max': self.ticks_max,
+            },
+            'scores': {
+                metric: {'mean': round(total / count, 2), 'min': lo, 'max': hi}
+                for metric, (count, total, lo, hi) in self.metrics.items()
+            },
+            'errors': dict(self.errors),
+        }
+
+
+def run_batch(path, sessions, workers=None, chunksize=None, max_ticks=5000, seed=0,
+              policy=None, cols=120, rows=40, on_result=None):
+    """Run `sessions` headless sessions of the game at `path` in parallel.
+
+    Sessions use seeds `seed .. seed + sessions - 1` and are handed to the
+    workers in chunks of `chunksize` (default: about four chunks per worker,
+    at most 64 sessions each). Only a couple of chunks per worker are kept
+    in flight, so memory stays flat for any session count. `policy` is a
+    `module:name` spec resolved inside each worker (None = scripted keys).
+    `on_result` is called with each session result as chunks complete.
+    Returns the aggregated summary dict.
+    """
+    workers = max(1, int(workers or os.cpu_count() or 1))
+    sessions = max(0, int(sessions))
+    if not chunksize:
+        chunksize = max(1, min(64, sessions // (workers * 4) or 1))
+    if policy is not None and not isinstance(policy, str):
+        raise TypeError("policy must be a 'module:name' string so workers can import it")
+    stats = BatchStats()
+    seeds = iter(range(seed, seed + sessions))
+
+    def next_chunk():
+        chunk = []
+        for s in seeds:
+            chunk.append(s)
+            if len(chunk) >= chunksize:
+                break
+        return chunk
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path, policy)) as pool:
+        pending = set()
+
+        def submit():
+            chunk = next_chunk()
+            if chunk:
+                pending.add(pool.submit(_run_chunk, chunk, max_ticks, cols, rows))
+                return True
+            return False
+
+        for _ in range(workers * 2):
+            if not submit():
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                for result in fut.result():
+                    stats.add(result)
+                    if on_result is not None:
+                        on_result(result)
+                submit()
+
+    out = stats.summary()
+    out.update({
+        'game': game_slug(path),
+        'workers': workers,
+        'chunksize': chunksize,
+        'max_ticks': max_ticks,
+        'seed': seed,
+        'policy': policy,
+    })
+    return out
@@ -0,0 +1,113 @@
+"""Scripted headless benchmarks for `clia bench`."""
+import gc
+import multiprocessing
+import platform
+import sys
+import tracemalloc
+
+from game_classes.headless import load_game_module, game_slug, run_session
+
+try:
+    import resource
+except Exception:
+    resource = None
+
+DEFAULT_SIZES = ((80, 24), (120, 40), (250, 70))
+
+
+def parse_size(text):
+    """Parse a `COLSxROWS` string (e.g. '120x40') into a `(cols, rows)` tuple."""
+    cols, rows = str(text).lower().split('x', 1)
+    cols, rows = int(cols), int(rows)
+    if cols <= 0 or rows <= 0:
+        raise ValueError(f'invalid terminal size: {text}')
+    return cols, rows
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    try:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return None
+    # macOS reports bytes, Linux reports kilobytes
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return int(peak)
+
+
+def bench_case(path, cols, rows, ticks, seed):
+    """Benchmark one game at one terminal size; returns a result dict."""
+    mod = load_game_module(path)
+    min_cols = getattr(mod, 'MIN_COLS', None)
+    min_rows = getattr(mod, 'MIN_ROWS', None)
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    stats = run_session(mod, ticks, seed=seed, cols=cols, rows=rows)
+    blocks = sys.getallocatedblocks() - blocks
+    # replay the same session under tracemalloc for allocation figures;
+    # kept out of the timed run because tracing slows everything down
+    tracemalloc.start()
+    try:
+        run_session(mod, ticks, seed=seed, cols=cols, rows=rows)
+        snapshot = tracemalloc.take_snapshot()
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    live_allocs = sum(stat.count for stat in snapshot.statistics('filename'))
+    frames = stats['frames']
+    return {
+        'game': game_slug(path),
+        'cols': cols,
+        'rows': rows,
+        'min_size_ok': not ((min_cols and cols < min_cols) or (min_rows and rows < min_rows)),
+        'ticks': stats['ticks'],
+        'frames': frames,
+        'games': stats['games'],
+        'step_s': round(stats['step_s'], 6),
+        'draw_s': round(stats['draw_s'], 6),
+        'ticks_per_s': round(stats['ticks'] / stats['step_s'], 1) if stats['step_s'] else None,
+        'frames_per_s': round(frames / stats['draw_s'], 1) if stats['draw_s'] else None,
+        'bytes_per_frame': round(stats['bytes'] / frames, 1) if frames else 0,
+        'peak_rss_kb': _peak_rss_kb(),
+        'allocated_blocks': blocks,
+        'live_allocs': live_allocs,
+        'traced_peak_kb': traced_peak // 1024,
+    }
+
+
+def _safe_case(args):
+    path, cols, rows, ticks, seed = args
+    try:
+        return bench_case(path, cols, rows, ticks, seed)
+    except Exception as e:
+        return {'game': game_slug(path), 'cols': cols, 'rows': rows, 'error': f'{type(e).__name__}: {e}'}
+
+
+def run_benchmarks(paths, sizes=DEFAULT_SIZES, ticks=500, seed=1234, isolate=True):
+    """Benchmark every game file in `paths` at every size in `sizes`.
+
+    With `isolate`, each case runs in a fresh spawned process so that
+    `peak_rss_kb` and the allocation counters belong to that case alone.
+    Returns a JSON-serializable report.
+    """
+    cases = [(p, cols, rows, ticks, seed) for p in paths for cols, rows in sizes]
+    results = None
+    if isolate:
+        try:
+            ctx = multiprocessing.get_context('spawn')
+            with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+                results = [pool.apply(_safe_case, (case,)) for case in cases]
+        except Exception:
+            results = None
+    if results is None:
+        results = [_safe_case(case) for case in cases]
+    return {
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'ticks': ticks,
+        'seed': seed,
+        'isolated': bool(isolate),
+        'results': results,
+    }
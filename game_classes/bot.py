@@ -0,0 +1,150 @@
+"""Bot policies: automated input for unattended and headless play.
+
+A policy is either a `Policy` subclass or a plain callable taking a
+`GameView` and returning key codes for this tick: a single int, an
+iterable of ints, or None/-1 for no input. `BotDriver` calls the policy
+once per game tick under a time budget and feeds the keys to
+`GameBase.events`, exactly like keys read from the terminal.
+"""
+import time
+from collections import deque
+from types import MappingProxyType
+
+from game_classes.grid import GridIndex
+from game_classes.tools import init_ptk
+
+_SCALARS = (int, float, bool, str, bytes, type(None))
+
+
+def _freeze(value):
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, (list, tuple, deque)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, GridIndex):
+        # spatial indexes read like the cell sets they replaced
+        return frozenset(value.cells)
+    if callable(getattr(value, 'tolist', None)):
+        # array.array and NumPy arrays
+        return _freeze(value.tolist())
+    return GameView(value)
+
+
+class GameView:
+    """Read-only view of a game (or any object) for policies.
+
+    Public attributes are returned as immutable copies (tuples, frozensets,
+    mapping proxies) or as nested views; methods and underscore names are
+    hidden, and assignment raises AttributeError.
+    """
+    __slots__ = ('_target',)
+
+    def __init__(self, target):
+        object.__setattr__(self, '_target', target)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        value = getattr(object.__getattribute__(self, '_target'), name)
+        if callable(value) and not isinstance(value, type):
+            raise AttributeError(f'{name} is not readable from a GameView')
+        return _freeze(value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('GameView is read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('GameView is read-only')
+
+
+class Policy:
+    """Base class for bots; override `act` (and optionally `reset`)."""
+
+    def reset(self, view):
+        """Called with a view of each new game before its first tick."""
+        pass
+
+    def act(self, view):
+        """Return the key code(s) to press this tick."""
+        return None
+
+
+class BotDriver:
+    """Call a policy once per tick under a time budget and collect stats.
+
+    `budget` is in seconds; None means a quarter of the game's current
+    tick. A call that takes longer than the budget is an overrun: its keys
+    are dropped (so a slow bot can't act on stale state or stretch the
+    tick) and it is counted in `report()`.
+    """
+
+    def __init__(self, policy, budget=None):
+        self.policy = policy
+        self.budget = budget
+        self.calls = 0
+        self.overruns = 0
+        self.total_s = 0.0
+        self.worst_s = 0.0
+        self.games = 0
+
+    def reset(self, game):
+        self.games += 1
+        reset = getattr(self.policy, 'reset', None)
+        if reset is not None:
+            reset(GameView(game))
+
+    def keys(self, game):
+        budget = self.budget if self.budget is not None else float(getattr(game, 'tick', 0.1)) * 0.25
+        act = getattr(self.policy, 'act', self.policy)
+        start = time.perf_counter()
+        out = act(GameView(game))
+        elapsed = time.perf_counter() - start
+        self.calls += 1
+        self.total_s += elapsed
+        if elapsed > self.worst_s:
+            self.worst_s = elapsed
+        if elapsed > budget:
+            self.overruns += 1
+            return []
+        if out is None:
+            return []
+        if isinstance(out, int):
+            out = (out,)
+        # ESC would quit the game; bots stop by other means
+        return [int(k) for k in out if k is not None and k != -1 and k != 27]
+
+    def report(self):
+        return {
+            'games': self.games,
+            'calls': self.calls,
+            'overruns': self.overruns,
+            'mean_ms': round(self.total_s / self.calls * 1000.0, 3) if self.calls else 0.0,
+            'worst_ms': round(self.worst_s * 1000.0, 3),
+            'budget_ms': round(self.budget * 1000.0, 3) if self.budget is not None else None,
+        }
+
+
+def bot_main(mod, driver, player_name='Bot'):
+    """Return a `main(stdscr)` that plays `mod.Game` with `driver` until ESC.
+
+    Games are restarted after game over so long unattended runs keep
+    going; highscores are not saved for bot games.
+    """
+    def main(stdscr):
+        init_ptk(stdscr)
+        while True:
+            game = mod.Game(stdscr, player_name)
+            try:
+                game.highscores.readonly = True
+            except Exception:
+                pass
+            game.bot = driver
+            driver.reset(game)
+            game.run()
+            if not game.over:
+                break
+    return main
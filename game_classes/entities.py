@@ -0,0 +1,87 @@
+"""Compact entity storage shared by the games.
+
+Entities are rows of integer fields kept column by column: one `array('q')`
+per field, or one NumPy array per field when NumPy is installed, so a tick
+can update every entity in one loop or a few vectorized operations instead
+of touching one object per entity. Removal swaps the last entity into the
+freed slot (O(1)); slot 0 only moves when it is the one removed.
+"""
+from array import array
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+
+class EntityColumns:
+    """Parallel integer columns, one per name in `FIELDS`.
+
+    Subclasses set `FIELDS`; each field is then an attribute holding its
+    column. Only the first `n` entries of a column are live: NumPy columns
+    grow by doubling and keep spare capacity, `array` columns are exactly
+    `n` long.
+    """
+    FIELDS = ()
+
+    def __init__(self, use_numpy=None, capacity=16):
+        self.numpy = np is not None if use_numpy is None else bool(use_numpy and np is not None)
+        self.n = 0
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64) if self.numpy else array('q'))
+
+    def __len__(self):
+        return self.n
+
+    def __bool__(self):
+        return self.n > 0
+
+    def __getitem__(self, i):
+        """The fields of entity `i` as a tuple of plain ints."""
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return tuple(int(getattr(self, name)[i]) for name in self.FIELDS)
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+    def columns(self):
+        return [getattr(self, name) for name in self.FIELDS]
+
+    def spawn(self, *values):
+        """Add an entity with one value per field and return its slot."""
+        if len(values) != len(self.FIELDS):
+            raise TypeError(f'expected {len(self.FIELDS)} values, got {len(values)}')
+        i = self.n
+        if self.numpy:
+            if i >= len(getattr(self, self.FIELDS[0])):
+                size = max(16, i * 2)
+                for name in self.FIELDS:
+                    setattr(self, name, np.resize(getattr(self, name), size))
+            for col, value in zip(self.columns(), values):
+                col[i] = value
+        else:
+            for col, value in zip(self.columns(), values):
+                col.append(value)
+        self.n += 1
+        return i
+
+    def remove(self, i):
+        """Swap-remove entity `i` in O(1); the last entity takes its slot."""
+        last = self.n - 1
+        if not 0 <= i <= last:
+            return False
+        for col in self.columns():
+            col[i] = col[last]
+            if not self.numpy:
+                col.pop()
+        self.n = last
+        return True
+
+    def remove_many(self, slots):
+        """Remove several entities; highest slots first so swaps never move an unvisited one."""
+        for i in sorted(slots, reverse=True):
+            self.remove(i)
@@ -27,6 +27,8 @@ The description will be shown in the menu, so make it enticing!"""
 # minimum terminal size required to run this game (cols, rows)
 MIN_COLS = 70
 MIN_ROWS = 20
+# set MENU_ORDER = <index> to pin the game's place in the list; games
+# without it are listed after the pinned ones, by name
 
 class Game(GameBase):
     def __init__(self, stdscr, player_name='Player'):
@@ -0,0 +1,118 @@
+"""Uniform-grid spatial index shared by the games.
+
+Cells are `(y, x)` tuples mapped to a value (True when the caller only
+needs occupancy). Lookups go through one dict, so occupancy tests cost the
+same at any size. Every cell is also filed in the square bucket that
+contains it, so rectangle queries visit only the buckets overlapping the
+rectangle instead of every occupied cell.
+"""
+
+# side of the square buckets cells are filed under
+BUCKET = 16
+
+
+class GridIndex:
+    """Cell -> value map with O(1) occupancy and bucketed rectangle queries.
+
+    Behaves like a set of cells for `in`, `len`, iteration, `add` and
+    `discard`, so it can replace one directly. `version` changes on every
+    update so derived views (minimaps, caches) know when to rebuild.
+    """
+
+    def __init__(self, cells=(), bucket=BUCKET):
+        self.bucket = max(1, int(bucket))
+        self.cells = {}
+        self.buckets = {}
+        self.version = 0
+        for cell in cells:
+            self.add(cell)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __bool__(self):
+        return bool(self.cells)
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.cells
+
+    def key(self, cell):
+        """Bucket holding `cell`."""
+        return (cell[0] // self.bucket, cell[1] // self.bucket)
+
+    def get(self, cell, default=None):
+        return self.cells.get(cell, default)
+
+    def items(self):
+        return self.cells.items()
+
+    def add(self, cell, value=True):
+        """Occupy `cell` with `value` (replacing any value already there)."""
+        if cell not in self.cells:
+            key = (cell[0] // self.bucket, cell[1] // self.bucket)
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = self.buckets[key] = set()
+            bucket.add(cell)
+        self.cells[cell] = value
+        self.version += 1
+
+    def pop(self, cell, default=None):
+        """Free `cell` and return its value (`default` if it was empty)."""
+        if cell not in self.cells:
+            return default
+        value = self.cells.pop(cell)
+        key = (cell[0] // self.bucket, cell[1] // self.bucket)
+        bucket = self.buckets[key]
+        bucket.discard(cell)
+        if not bucket:
+            del self.buckets[key]
+        self.version += 1
+        return value
+
+    def discard(self, cell):
+        self.pop(cell)
+
+    def move(self, old, new):
+        """Move the value at `old` to `new`; False if `old` is empty or `new` is taken."""
+        if old not in self.cells or new in self.cells:
+            return False
+        if old != new:
+            self.add(new, self.pop(old))
+        return True
+
+    def query(self, y0, x0, y1, x1):
+        """Yield the occupied cells with y0 <= y < y1 and x0 <= x < x1."""
+        if y1 <= y0 or x1 <= x0:
+            return
+        s = self.bucket
+        # a sparse grid can have fewer buckets than the rectangle covers
+        if len(self.buckets) < ((y1 - 1) // s - y0 // s + 1) * ((x1 - 1) // s - x0 // s + 1):
+            keys = [k for k in self.buckets if y0 // s <= k[0] <= (y1 - 1) // s and x0 // s <= k[1] <= (x1 - 1) // s]
+        else:
+            keys = [(cy, cx) for cy in range(y0 // s, (y1 - 1) // s + 1) for cx in range(x0 // s, (x1 - 1) // s + 1)]
+        for cy, cx in keys:
+            bucket = self.buckets.get((cy, cx))
+            if not bucket:
+                continue
+            # buckets fully inside the rectangle need no per-cell test
+            if cy * s >= y0 and (cy + 1) * s <= y1 and cx * s >= x0 and (cx + 1) * s <= x1:
+                yield from bucket
+                continue
+            for cell in bucket:
+                if y0 <= cell[0] < y1 and x0 <= cell[1] < x1:
+                    yield cell
+
+    def any_in(self, y0, x0, y1, x1):
+        """True if any cell in the rectangle is occupied."""
+        for _ in self.query(y0, x0, y1, x1):
+            return True
+        return False
+
+    def clear(self):
+        self.cells = {}
+        self.buckets = {}
+        self.version += 1
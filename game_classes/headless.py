@@ -0,0 +1,159 @@
+"""Run games without a terminal (benchmarks, batch runs, bots)."""
+import importlib
+import importlib.util
+import os
+import random
+import sys
+import time
+
+from game_classes import ptk
+from game_classes.bot import BotDriver
+
+# keys used by the default scripted input stream (never ESC or Backspace,
+# which would quit or pause the game)
+SCRIPT_KEYS = (ptk.KEY_LEFT, ptk.KEY_RIGHT, ptk.KEY_UP, ptk.KEY_DOWN, ord(' '))
+
+# path -> loaded game module, per process
+_MODULES = {}
+
+
+def load_game_module(path):
+    """Import a game file by path, caching the module for this process."""
+    path = os.path.abspath(path)
+    mod = _MODULES.get(path)
+    if mod is not None:
+        return mod
+    game_dir = os.path.dirname(path)
+    proj_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    name = 'cli_game_' + os.path.basename(game_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    inserted = []
+    try:
+        for p in (game_dir, proj_root):
+            if p not in sys.path:
+                sys.path.insert(0, p)
+                inserted.append(p)
+        spec.loader.exec_module(mod)
+    finally:
+        for p in inserted:
+            try:
+                sys.path.remove(p)
+            except Exception:
+                pass
+    _MODULES[path] = mod
+    return mod
+
+
+def game_slug(path):
+    """Return the game directory name (slug) for a game file path."""
+    return os.path.basename(os.path.dirname(os.path.abspath(path)))
+
+
+def scripted_keys(seed, rate=0.3):
+    """Endless deterministic key stream: one key code (or -1) per tick."""
+    rng = random.Random(seed)
+    while True:
+        if rng.random() < rate:
+            yield rng.choice(SCRIPT_KEYS)
+        else:
+            yield -1
+
+
+def resolve_policy(spec):
+    """Resolve a `module:attr` policy spec; classes are instantiated."""
+    if callable(spec) or spec is None:
+        return spec
+    modname, _, attr = str(spec).partition(':')
+    if not modname or not attr:
+        raise ValueError(f"policy must look like 'module:name', got {spec!r}")
+    obj = importlib.import_module(modname)
+    for part in attr.split('.'):
+        obj = getattr(obj, part)
+    if isinstance(obj, type):
+        obj = obj()
+    return obj
+
+
+def new_game(mod, screen, player_name='Player'):
+    """Construct `mod.Game` on `screen` with highscore saving disabled."""
+    game = mod.Game(screen, player_name)
+    try:
+        game.highscores.readonly = True
+    except Exception:
+        pass
+    return game
+
+
+def run_session(mod, ticks, seed=0, cols=80, rows=24, keys=None, render=True, restart=True,
+                policy=None, draw=True, budget=None):
+    """Run a game for up to `ticks` ticks on a `ptk.HeadlessScreen`.
+
+    Every tick feeds the next key from `keys` (default: `scripted_keys(seed)`)
+    through `Game.events`, steps the game with a simulated clock and draws
+    one frame. If `policy` is given (a `bot.Policy`, a callable or a
+    `bot.BotDriver`) it replaces `keys` and is driven through a `BotDriver`
+    with the given budget. With `draw` false no frames are drawn at all.
+    When the game ends it is restarted if `restart` is true, otherwise the
+    session stops. Returns a dict of counters and timings.
+    """
+    random.seed(seed)
+    screen = ptk.HeadlessScreen(cols, rows, render=render)
+    game = new_game(mod, screen)
+    driver = None
+    if policy is None:
+        keys = iter(scripted_keys(seed) if keys is None else keys)
+    else:
+        driver = policy if isinstance(policy, BotDriver) else BotDriver(policy, budget)
+        driver.reset(game)
+    perf = time.perf_counter
+    now = time.time()
+    step_s = 0.0
+    draw_s = 0.0
+    games = 1
+    survived = 0
+    done = 0
+    for _ in range(ticks):
+        if driver is None:
+            ch = next(keys, -1)
+            if ch != -1:
+                screen.feed(ch)
+        elif not game.over and not game.paused:
+            screen.feed(*driver.keys(game))
+        ch = screen.getch()
+        while ch != -1:
+            game.events(ch)
+            ch = screen.getch()
+        now += game.tick
+        if not game.over and not game.paused:
+            t = perf()
+            game.step(now)
+            step_s += perf() - t
+        if draw:
+            t = perf()
+            game.pre_draw()
+            game.draw()
+            game.post_draw()
+            draw_s += perf() - t
+        done += 1
+        survived += 1
+        if game.over:
+            if not restart:
+                break
+            games += 1
+            survived = 0
+            game = new_game(mod, screen)
+            if driver is not None:
+                driver.reset(game)
+    return {
+        'ticks': done,
+        'frames': screen.frames,
+        'bytes': screen.bytes_written,
+        'games': games,
+        'ticks_survived': survived,
+        'over': bool(game.over),
+        'scores': dict(game.scores),
+        'step_s': step_s,
+        'draw_s': draw_s,
+        'bot': driver.report() if driver is not None else None,
+    }
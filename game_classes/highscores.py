@@ -1,111 +1,880 @@
+import atexit
+import base64
+import bisect
+import contextlib
+import copy
 import json
 import os
 import shutil
+import stat
+import tempfile
+import time
 import warnings
+import zlib
 
 try:
     import appdirs
 except Exception:
     appdirs = None
 
+# cross-process file locks: flock on POSIX, msvcrt byte locks on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
-class HighScores:
-    """Per-game highscores stored in a user-writable location.
+# storage backend: 'json' rewrites highscores.json on every save, 'journal'
+# appends record changes to a journal that is folded in on compaction and
+# 'sqlite' keeps every game in one database (see `game_classes.scoredb`)
+BACKEND_ENV = 'CLI_ARCADE_SCORES_BACKEND'
+BACKENDS = ('json', 'journal', 'sqlite')
+# database file (in the user data directory) for the 'sqlite' backend
+DB_NAME = 'highscores.db'
+# journal group commit: pending records are appended together once this
+# many are queued or the oldest has waited this many seconds (and at exit)
+JOURNAL_BATCH = 16
+JOURNAL_INTERVAL = 2.0
+# fold the journal into highscores.json once it holds this many records
+COMPACT_LINES = 256
+# entries kept per metric leaderboard (overridable per store)
+TOP_N = 100
+TOP_N_ENV = 'CLI_ARCADE_TOP_N'
+# lock statistics of every process, accumulated at exit (in the user data directory)
+LOCK_STATS_NAME = 'lockstats.json'
 
-    Constructor is backward-compatible: `HighScores(game, default)` works.
-    If legacy highscores exist under the project `games/<game>/highscores.json`,
-    they will be migrated to the user data directory on first use.
-    """
 
-    def __init__(self, game, default=None, appname='cli-arcade', appauthor=None):
-        if default is None:
-            default = {'score': {'player': 'Player', 'value': 0}}
-        # copy default to avoid shared mutable state
+def journal_path(path):
+    """Journal of record changes kept next to a highscores.json `path`."""
+    return os.path.splitext(path)[0] + '.journal.jsonl'
+
+
+def history_path(path):
+    """Compacted journal records, kept as the full history of record changes."""
+    return os.path.splitext(path)[0] + '.history.jsonl'
+
+
+def lock_path(path):
+    """Lock file serialising writers of the files behind a highscores.json `path`."""
+    return os.path.splitext(path)[0] + '.lock'
+
+
+def _lock(fd, blocking):
+    # exclusive lock on an open lock file; False if busy and not blocking
+    if fcntl is not None:
         try:
-            self.default = {k: v.copy() for k, v in default.items()}
-        except Exception:
-            self.default = dict(default)
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    if msvcrt is not None:
+        while True:
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.005)
+    return True
 
-        self.game = game
+
+def _unlock(fd):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+def _file_mode(path):
+    # mode for a rewritten `path`: the existing file's, else what open() gives under the umask
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        pass
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _number(value):
+    try:
+        num = float(value)
+    except Exception:
+        return None
+    return num if num == num else None
+
+
+class Leaderboard:
+    """Bounded top-N table for one metric: best first, one entry per player.
+
+    Entries are kept sorted by descending value next to a parallel list of
+    negated values, so insertion is a `bisect` and a list insert, and a
+    player -> value map makes the dedup check O(1). Ties keep the earlier
+    entry ahead. Saved as the metric's `top` list of `{player, value}`.
+    """
+
+    def __init__(self, entries=(), size=None, floor=None):
+        self.size = max(1, int(size or TOP_N))
+        # values must beat this to get in, even while the table is not full
+        self.floor = floor
+        self.entries = []
+        self._keys = []
+        self._players = {}
+        for e in entries:
+            if isinstance(e, dict):
+                self.insert(e.get('player'), e.get('value'))
+
+    @classmethod
+    def from_entry(cls, entry, size=None, floor=None):
+        """Board for a saved metric entry; legacy entries count as a single score."""
+        return cls(leaderboard_entries(entry), size, floor)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def cutoff(self):
+        """Value a new player has to beat to get in (None: anything does)."""
+        if len(self.entries) >= self.size:
+            return -self._keys[-1]
+        return self.floor
+
+    def threshold(self, player):
+        """Value `player` has to beat to change the table."""
+        cut = self.cutoff()
+        own = self._players.get(player)
+        if own is not None and (cut is None or own > cut):
+            return own
+        return cut
+
+    def insert(self, player, value):
+        """Record `value` for `player`; returns True if the table changed."""
+        num = _number(value)
+        if num is None:
+            return False
+        old = self._players.get(player)
+        if old is not None:
+            if num <= old:
+                return False
+            # drop the player's previous entry (first of its value's run that is theirs)
+            i = bisect.bisect_left(self._keys, -old)
+            while self.entries[i][1] != player:
+                i += 1
+            del self.entries[i]
+            del self._keys[i]
+        else:
+            cut = self.cutoff()
+            if cut is not None and num <= cut:
+                return False
+        i = bisect.bisect_right(self._keys, -num)
+        self._keys.insert(i, -num)
+        self.entries.insert(i, (value, player))
+        self._players[player] = num
+        if len(self.entries) > self.size:
+            self._keys.pop()
+            _, dropped = self.entries.pop()
+            del self._players[dropped]
+        return True
+
+    def best(self):
+        return self.entries[0] if self.entries else None
+
+    def to_list(self):
+        return [{'player': p, 'value': v} for v, p in self.entries]
+
+    def to_entry(self, placeholder=None):
+        """Saved form: best `player`/`value` (as before) plus the `top` list.
+
+        An empty table keeps the `player`/`value` of `placeholder` (a saved
+        entry), or shows its floor, so every entry has a `value`.
+        """
+        best = self.best()
+        if best is None:
+            if isinstance(placeholder, dict) and 'value' in placeholder:
+                return {'player': placeholder.get('player'), 'value': placeholder.get('value'), 'top': []}
+            return {'player': 'Player', 'value': 0 if self.floor is None else self.floor, 'top': []}
+        return {'player': best[1], 'value': best[0], 'top': self.to_list()}
+
+
+def leaderboard_entries(entry):
+    """`{player, value}` entries of a saved metric, old format or new."""
+    if not isinstance(entry, dict):
+        return []
+    top = entry.get('top')
+    if isinstance(top, list):
+        return [e for e in top if isinstance(e, dict)]
+    if 'value' in entry:
+        return [{'player': entry.get('player'), 'value': entry.get('value')}]
+    return []
+
+
+def merge_entry(entry, incoming, size=None):
+    """Merge two saved metric entries into one top-N entry.
+
+    Falls back to the old rule (the incoming entry replaces a different
+    one) when either value is not a number.
+    """
+    if _number((incoming or {}).get('value')) is None or (
+            isinstance(entry, dict) and 'value' in entry and _number(entry.get('value')) is None):
+        if isinstance(incoming, dict) and 'value' in incoming:
+            return incoming
+        return entry
+    board = Leaderboard.from_entry(entry, size)
+    for e in leaderboard_entries(incoming):
+        board.insert(e.get('player'), e.get('value'))
+    # two placeholders (no leaderboard entries) stay a placeholder
+    return board.to_entry(entry if isinstance(entry, dict) and 'value' in entry else incoming)
+
+
+def _entry_key(entry):
+    # what a metric entry says, whichever format it was saved in
+    return (entry.get('player'), entry.get('value'), leaderboard_entries(entry))
+
+
+def merge_scores(current, incoming, size=None):
+    """Merge saved scores `incoming` into `current` (a new dict).
+
+    Metric entries are merged as leaderboards; any other key takes the
+    incoming value.
+    """
+    data = copy.deepcopy(current) if isinstance(current, dict) else {}
+    for key, val in incoming.items():
+        if isinstance(val, dict) and 'value' in val and isinstance(data.get(key), dict):
+            data[key] = merge_entry(data[key], val, size)
+        else:
+            data[key] = copy.deepcopy(val)
+    return data
+
+
+def apply_record(data, rec, size=None):
+    """Apply one journal record (a score for a metric) to `data`."""
+    if not isinstance(rec, dict) or 'metric' not in rec:
+        return
+    data[rec['metric']] = merge_entry(data.get(rec['metric']), {'player': rec.get('player'), 'value': rec.get('value')}, size)
+
+
+class HighScoreStore:
+    """Process-wide cache of saved highscore files.
+
+    The user data directory is resolved once, legacy migration is checked
+    once per game, and file contents are kept in memory keyed by path.
+    A cached entry is reused while the file's stat signature (mtime, size,
+    inode) is unchanged, so a read costs one `os.stat` and a file written by
+    another process (or deleted by `clia reset`) is picked up on the next
+    read. Callers always get their own copy of the data.
+
+    With the 'journal' backend a save appends one compact JSON line per
+    new leaderboard entry to `highscores.journal.jsonl` instead of rewriting the
+    snapshot; records are group-committed (see `JOURNAL_BATCH`). Reads
+    replay the journal over the snapshot, and only the new tail once it is
+    cached. `compact` folds the journal into `highscores.json` and moves its
+    lines onto `highscores.history.jsonl`. A journal left by either
+    backend is always replayed, so switching backends loses nothing.
+
+    Processes sharing the data directory serialise file writes on a
+    per-game `highscores.lock` (see `lock`): a snapshot write re-reads
+    what is on disk and merges into it, so concurrent saves keep each
+    other's scores, and compaction cannot drop a journal append made
+    while it runs. Time spent waiting is counted in `lock_stats`, and
+    added to the totals in `lockstats.json` at exit (`saved_lock_stats`).
+
+    With the 'sqlite' backend paths only name the game: scores live in
+    one `ScoreDB` in the user data directory, cached per game until another
+    process commits. Existing JSON files are imported once, the first
+    time the database is opened.
+    """
+
+    def __init__(self, appname='cli-arcade', appauthor=None, backend=None):
         self.appname = appname
         self.appauthor = appauthor
+        backend = backend or os.environ.get(BACKEND_ENV, '').strip().lower() or 'json'
+        self.backend = backend if backend in BACKENDS else 'json'
+        try:
+            self.top_n = max(1, int(os.environ.get(TOP_N_ENV, TOP_N)))
+        except Exception:
+            self.top_n = TOP_N
+        self._base = None
+        self._migrated = set()
+        # path -> [snapshot signature, journal inode, journal offset, data, journal records]
+        self._cache = {}
+        # path -> records waiting for the next group commit, and when the oldest was queued
+        self._pending = {}
+        self._pending_since = {}
+        # sqlite backend: connection, game -> (version, data), and our own commits
+        # (PRAGMA data_version only counts other connections')
+        self._db = None
+        self._db_cache = {}
+        self._db_writes = 0
+        # lock files this store holds, and wait statistics
+        self._locks = set()
+        self._lock_stats = {'acquired': 0, 'contended': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+
+    def base_dir(self):
+        if self._base is None:
+            base = None
+            if appdirs is not None:
+                try:
+                    base = appdirs.user_data_dir(self.appname, self.appauthor)
+                except Exception:
+                    base = None
+            if not base:
+                home = os.path.expanduser('~') or os.getcwd()
+                base = os.path.join(home, f'.{self.appname}')
+            self._base = os.path.abspath(base)
+        return self._base
+
+    def path(self, game):
+        """Path of the highscores file for `game`, migrating a legacy file once."""
+        path = os.path.join(self.base_dir(), 'games', game, 'highscores.json')
+        if game not in self._migrated:
+            self._migrated.add(game)
+            self.migrate(game, path)
+        return path
+
+    def db(self):
+        """The `ScoreDB` of the sqlite backend, opened (and JSON imported) on first use."""
+        if self._db is None:
+            from game_classes.scoredb import ScoreDB
+            os.makedirs(self.base_dir(), exist_ok=True)
+            db = ScoreDB(os.path.join(self.base_dir(), DB_NAME))
+            self._import_json(db)
+            self._db = db
+        return self._db
 
-        # determine user-writable base
-        base = None
-        if appdirs is not None:
+    def _import_json(self, db):
+        # one-time import of every highscores.json (and journal) into the database;
+        # checked inside the write transaction so concurrent first runs import once
+        with db.transaction():
+            if db.meta('json_import') is not None:
+                return
+            names = set()
+            proj_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+            for root in (os.path.join(self.base_dir(), 'games'), os.path.join(proj_root, 'games')):
+                try:
+                    names.update(e for e in os.listdir(root) if not e.startswith('__') and os.path.isdir(os.path.join(root, e)))
+                except OSError:
+                    pass
+            for game in sorted(names):
+                path = self.path(game)
+                data = self._read_files(path)
+                if not isinstance(data, dict):
+                    continue
+                try:
+                    created = os.path.getmtime(path)
+                except OSError:
+                    created = time.time()
+                entries, extras = self._changes({}, data)
+                db.insert(game, [(m, p, v, created) for m, p, v in entries],
+                          {k: json.dumps(v, ensure_ascii=False) for k, v in extras.items()})
+            db.set_meta('json_import', repr(time.time()))
+
+    @contextlib.contextmanager
+    def lock(self, path):
+        """Hold the cross-process lock for the files behind `path` (reentrant).
+
+        If the lock file cannot be opened the block runs unlocked, as
+        before locking existed.
+        """
+        lpath = lock_path(path)
+        if lpath in self._locks:
+            yield
+            return
+        try:
+            os.makedirs(os.path.dirname(lpath), exist_ok=True)
+            fd = os.open(lpath, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            warnings.warn(f"HighScores lock unavailable for {path}: {e}")
+            yield
+            return
+        try:
+            start = time.perf_counter()
+            if not _lock(fd, False):
+                self._lock_stats['contended'] += 1
+                _lock(fd, True)
+            wait = time.perf_counter() - start
+            stats = self._lock_stats
+            stats['acquired'] += 1
+            stats['wait_total'] += wait
+            stats['wait_max'] = max(stats['wait_max'], wait)
+            self._locks.add(lpath)
             try:
-                base = appdirs.user_data_dir(self.appname, self.appauthor)
-            except Exception:
-                base = None
+                yield
+            finally:
+                self._locks.discard(lpath)
+                _unlock(fd)
+        finally:
+            os.close(fd)
 
-        if not base:
-            home = os.path.expanduser('~') or os.getcwd()
-            base = os.path.join(home, f'.{self.appname}')
+    def lock_stats(self):
+        """Lock acquisitions, how many had to wait, and wait times (seconds)."""
+        stats = dict(self._lock_stats)
+        stats['wait_avg'] = stats['wait_total'] / stats['acquired'] if stats['acquired'] else 0.0
+        return stats
 
-        self.dir = os.path.abspath(os.path.join(base, 'games', game))
-        self.path = os.path.join(self.dir, 'highscores.json')
+    def saved_lock_stats(self):
+        """`lock_stats` summed over every process that has exited (see `save_lock_stats`)."""
+        stats = {'acquired': 0, 'contended': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+        try:
+            with open(os.path.join(self.base_dir(), LOCK_STATS_NAME), 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            for key in stats:
+                stats[key] = type(stats[key])(saved.get(key, 0))
+        except Exception:
+            pass
+        stats['wait_avg'] = stats['wait_total'] / stats['acquired'] if stats['acquired'] else 0.0
+        return stats
 
-        # attempt migration from project-root location if present
+    def save_lock_stats(self):
+        """Add this process's `lock_stats` to the saved totals and start counting afresh."""
+        stats = dict(self._lock_stats)
+        if not stats['acquired']:
+            return True
+        path = os.path.join(self.base_dir(), LOCK_STATS_NAME)
+        with self.lock(path):
+            totals = self.saved_lock_stats()
+            del totals['wait_avg']
+            for key in ('acquired', 'contended', 'wait_total'):
+                totals[key] += stats[key]
+            totals['wait_max'] = max(totals['wait_max'], stats['wait_max'])
+            ok = self._write_snapshot(path, totals)
+            # the lock taken for this bookkeeping is not counted
+            self._lock_stats = {'acquired': 0, 'contended': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+        return ok
+
+    def files(self, path):
+        """Existing files (snapshot, journal, history, lock) backing `path`."""
+        return [p for p in (path, journal_path(path), history_path(path), lock_path(path)) if os.path.exists(p)]
+
+    def migrate(self, game, path):
+        # copy a legacy project-root file to the user data directory
         try:
             proj_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
             legacy = os.path.join(proj_root, 'games', game, 'highscores.json')
-            if os.path.exists(legacy) and not os.path.exists(self.path):
+            if os.path.exists(legacy) and not os.path.exists(path):
                 try:
-                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
-                    shutil.copy2(legacy, self.path)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    shutil.copy2(legacy, path)
                 except Exception as e:
                     warnings.warn(f"Failed to migrate legacy highscores for {game}: {e}")
         except Exception:
             pass
 
-    def _path(self):
-        return self.path
+    @staticmethod
+    def _signature(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
-    def load(self):
-        path = self._path()
+    def _replay(self, entry, jpath):
+        """Apply journal lines past the entry's offset; returns False if the journal was replaced."""
         try:
-            if os.path.exists(path):
+            with open(jpath, 'rb') as f:
+                f.seek(entry[2])
+                chunk = f.read()
+        except OSError:
+            return True
+        # a line still being appended by another process waits for the next read
+        end = chunk.rfind(b'\n') + 1
+        if end:
+            if entry[3] is None:
+                entry[3] = {}
+            for line in chunk[:end].splitlines():
+                try:
+                    rec = json.loads(line)
+                except Exception:
+                    continue
+                apply_record(entry[3], rec, self.top_n)
+                entry[4] += 1
+            entry[2] += end
+        return True
+
+    def _load(self, path):
+        snap = self._signature(path)
+        jpath = journal_path(path)
+        jsig = self._signature(jpath)
+        entry = self._cache.get(path)
+        if entry is not None and entry[0] == snap and jsig is not None and jsig[2] == entry[1] and jsig[1] >= entry[2]:
+            # same snapshot and journal file: only the new tail needs replaying
+            if jsig[1] > entry[2]:
+                self._replay(entry, jpath)
+            return entry
+        if entry is not None and entry[0] == snap and jsig is None and entry[1] is None:
+            return entry
+        data = None
+        if snap is not None:
+            try:
                 with open(path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    if isinstance(data, dict):
-                        for k, v in self.default.items():
-                            if k not in data or not isinstance(data[k], dict):
-                                data[k] = v.copy()
-                            else:
-                                data[k]['player'] = data[k].get('player', v.get('player'))
-                                data[k]['value'] = data[k].get('value', v.get('value'))
-                        return data
-        except Exception as e:
-            warnings.warn(f"HighScores.load() failed for {path}: {e}")
+            except Exception:
+                # unreadable files are cached too, until they change
+                data = None
+        entry = [snap, jsig[2] if jsig else None, 0, data, 0]
+        if jsig is not None:
+            self._replay(entry, jpath)
+        self._cache[path] = entry
+        return entry
 
-        try:
-            return {k: v.copy() for k, v in self.default.items()}
-        except Exception:
-            return dict(self.default)
+    def read(self, path):
+        """Saved data at `path` (a fresh copy), or None if missing or unreadable."""
+        if self.backend == 'sqlite':
+            return self._read_db(os.path.basename(os.path.dirname(path)))
+        return self._read_files(path)
 
-    def save(self, data):
-        path = self._path()
+    def _read_db(self, game):
+        db = self.db()
+        key = (db.data_version(), self._db_writes)
+        cached = self._db_cache.get(game)
+        if cached is None or cached[0] != key:
+            data = {}
+            for metric in db.metrics(game):
+                rows = db.top(game, metric, self.top_n)
+                if rows:
+                    data[metric] = {'player': rows[0][0], 'value': rows[0][1],
+                                    'top': [{'player': p, 'value': v} for p, v, _ in rows]}
+            for k, raw in db.extras(game).items():
+                try:
+                    data[k] = json.loads(raw)
+                except Exception:
+                    continue
+            cached = self._db_cache[game] = (key, data or None)
+        return copy.deepcopy(cached[1])
+
+    def _read_files(self, path):
+        entry = self._load(path)
+        data = copy.deepcopy(entry[3])
+        pending = self._pending.get(path)
+        if pending:
+            if data is None:
+                data = {}
+            for rec in pending:
+                apply_record(data, rec, self.top_n)
+        if entry[0] is None and entry[1] is None and not pending:
+            self._cache.pop(path, None)
+        return data
+
+    def _changes(self, current, data):
+        """What saving `data` over `current` adds.
+
+        Returns `(metric, player, value)` for every leaderboard entry the
+        saved tables do not have yet, and the non-standard keys that differ.
+        """
+        entries = []
+        extras = {}
+        for key, val in data.items():
+            if not isinstance(val, dict) or _number(val.get('value')) is None:
+                if current.get(key) != val:
+                    extras[key] = val
+                continue
+            board = Leaderboard.from_entry(current.get(key), self.top_n)
+            for e in leaderboard_entries(val):
+                if board.insert(e.get('player'), e.get('value')):
+                    entries.append((key, e.get('player'), e.get('value')))
+        return entries, extras
+
+    def write(self, path, data):
+        """Save `data` for `path` with the store's backend; returns success."""
+        if self.backend == 'sqlite' and isinstance(data, dict):
+            game = os.path.basename(os.path.dirname(path))
+            entries, extras = self._changes(self._read_db(game) or {}, data)
+            if not entries and not extras:
+                return True
+            now = time.time()
+            try:
+                # one transaction for the whole save
+                self.db().record(game, [(m, p, v, now) for m, p, v in entries],
+                                 {k: json.dumps(v, ensure_ascii=False) for k, v in extras.items()})
+            except Exception as e:
+                warnings.warn(f"HighScores.save() database write failed for {game}: {e}")
+                return False
+            finally:
+                self._db_writes += 1
+            return True
+        if self.backend == 'journal' and isinstance(data, dict):
+            entries, extras = self._changes(self.read(path) or {}, data)
+            if extras:
+                # non-standard entries only live in the snapshot
+                return self.compact(path, data)
+            if not entries:
+                return True
+            now = time.time()
+            pending = self._pending.setdefault(path, [])
+            pending.extend({'metric': m, 'player': p, 'value': v, 'time': round(now, 3)} for m, p, v in entries)
+            since = self._pending_since.setdefault(path, now)
+            if len(pending) >= JOURNAL_BATCH or now - since >= JOURNAL_INTERVAL:
+                return self.flush(path)
+            return True
+        return self.compact(path, data)
+
+    def query(self, game, player=None, top=None, since=None):
+        """Leaderboards of `game` as `{metric: [(player, value), ...]}`, best first.
+
+        `player` keeps one player's entries, `top` keeps the first N per
+        metric and `since` (epoch seconds) keeps scores set since then.
+        Only the sqlite backend records when scores were set, so `since`
+        returns None with the file backends.
+        """
+        if self.backend == 'sqlite':
+            db = self.db()
+            out = {}
+            for metric in db.metrics(game):
+                rows = db.top(game, metric, top if top is not None else self.top_n, player=player, since=since)
+                if rows:
+                    out[metric] = [(p, v) for p, v, _ in rows]
+            return out
+        if since is not None:
+            return None
+        out = {}
+        for metric, entry in (self.read(self.path(game)) or {}).items():
+            rows = [(e.get('player'), e.get('value')) for e in leaderboard_entries(entry)
+                    if player is None or e.get('player') == player]
+            if top is not None:
+                rows = rows[:top]
+            if rows:
+                out[metric] = rows
+        return out
+
+    def clear(self, game):
+        """Delete `game`'s rows from the database; returns how many score rows went."""
+        if self.backend != 'sqlite':
+            return 0
+        self._db_cache.pop(game, None)
+        self._db_writes += 1
+        return self.db().delete_game(game)
+
+    def count(self, game):
+        """Score rows stored for `game` in the database (0 with the file backends)."""
+        if self.backend != 'sqlite':
+            return 0
+        return self.db().count(game)
+
+    def flush(self, path=None):
+        """Group-commit pending journal records (for `path`, or every path)."""
+        ok = True
+        for p in ([path] if path is not None else list(self._pending)):
+            records = self._pending.pop(p, None)
+            self._pending_since.pop(p, None)
+            if not records:
+                continue
+            payload = ''.join(
+                json.dumps(rec, ensure_ascii=False, separators=(',', ':')) + '\n' for rec in records
+            ).encode('utf-8')
+            # under the lock so a concurrent compaction cannot retire the
+            # journal between our append and its removal
+            with self.lock(p):
+                try:
+                    os.makedirs(os.path.dirname(p), exist_ok=True)
+                    fd = os.open(journal_path(p), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                    try:
+                        os.write(fd, payload)
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                except Exception as e:
+                    warnings.warn(f"HighScores journal append failed for {p}: {e}")
+                    ok = False
+                    continue
+                if self._load(p)[4] >= COMPACT_LINES:
+                    ok = self.compact(p) and ok
+        return ok
+
+    def _write_snapshot(self, path, data):
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
         except Exception as e:
             warnings.warn(f"HighScores.save() failed to create dir: {e}")
             return False
 
+        tmp = None
         try:
-            tmp = path + '.tmp'
-            with open(tmp, 'w', encoding='utf-8') as f:
+            # a temp name of our own: writers never share (or replace) each other's
+            fd, tmp = tempfile.mkstemp(prefix='.highscores.', suffix='.tmp', dir=os.path.dirname(path))
+            with open(fd, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            # mkstemp files are 0600; keep the snapshot readable as before
+            os.chmod(tmp, _file_mode(path))
             os.replace(tmp, path)
-            return True
         except Exception as e:
             warnings.warn(f"HighScores.save() write failed for {path}: {e}")
+            if tmp is not None:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
             try:
                 with open(path, 'w', encoding='utf-8') as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
-                return True
             except Exception as e2:
                 warnings.warn(f"HighScores.save() fallback write failed for {path}: {e2}")
                 return False
+        return True
+
+    def compact(self, path, data=None):
+        """Fold the journal into the snapshot at `path` and retire it.
+
+        `data` is merged into what is saved now (see `merge_scores`) under
+        the lock, so a save never discards scores another process wrote
+        since we read them. Journal lines are appended to the history file
+        before the journal is removed, so every record change stays on disk.
+        """
+        with self.lock(path):
+            # what is on disk now, including records still pending here
+            current = self._read_files(path)
+            if data is None:
+                data = current
+                if data is None:
+                    return True
+            elif isinstance(data, dict):
+                data = merge_scores(current, data, self.top_n)
+            else:
+                data = copy.deepcopy(data)
+            self._pending.pop(path, None)
+            self._pending_since.pop(path, None)
+            self._cache.pop(path, None)
+            jpath = journal_path(path)
+            try:
+                with open(jpath, 'rb') as f:
+                    chunk = f.read()
+            except OSError:
+                chunk = None
+            if chunk and isinstance(data, dict):
+                for line in chunk.splitlines():
+                    try:
+                        apply_record(data, json.loads(line), self.top_n)
+                    except Exception:
+                        continue
+            if not self._write_snapshot(path, data):
+                return False
+            if chunk is not None:
+                try:
+                    if chunk:
+                        with open(history_path(path), 'ab') as f:
+                            f.write(chunk if chunk.endswith(b'\n') else chunk + b'\n')
+                    os.remove(jpath)
+                except Exception as e:
+                    warnings.warn(f"HighScores journal compaction failed for {path}: {e}")
+            snap = self._signature(path)
+            if snap is not None:
+                self._cache[path] = [snap, None, 0, copy.deepcopy(data), 0]
+        return True
+
+    def invalidate(self, path=None):
+        """Forget the cached copy of `path` (or of every file)."""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+
+# (appname, appauthor) -> HighScoreStore, shared by everything in the process
+_STORES = {}
+
+
+def get_store(appname='cli-arcade', appauthor=None):
+    """Return the process-wide `HighScoreStore` for an application."""
+    key = (appname, appauthor)
+    store = _STORES.get(key)
+    if store is None:
+        store = _STORES[key] = HighScoreStore(appname, appauthor)
+    return store
+
+
+@atexit.register
+def _flush_stores():
+    # commit journal records still waiting for their group, then keep the lock statistics
+    for store in list(_STORES.values()):
+        try:
+            store.flush()
+        except Exception:
+            pass
+        try:
+            store.save_lock_stats()
+        except Exception:
+            pass
+
+
+class HighScores:
+    """Per-game highscores stored in a user-writable location.
+
+    Constructor is backward-compatible: `HighScores(game, default)` works.
+    If legacy highscores exist under the project `games/<game>/highscores.json`,
+    they will be migrated to the user data directory on first use. Reads and
+    writes go through the shared `HighScoreStore`, so constructing one is
+    cheap and repeated loads are served from memory.
+
+    Each metric keeps its best `player`/`value` as before plus a `top`
+    leaderboard of up to `top_n` entries (100 unless `CLI_ARCADE_TOP_N`
+    says otherwise).
+    """
+
+    def __init__(self, game, default=None, appname='cli-arcade', appauthor=None):
+        if default is None:
+            default = {'score': {'player': 'Player', 'value': 0}}
+        # copy default to avoid shared mutable state
+        try:
+            self.default = {k: v.copy() for k, v in default.items()}
+        except Exception:
+            self.default = dict(default)
+
+        self.game = game
+        self.appname = appname
+        self.appauthor = appauthor
+        # when set, save() is a no-op (headless benchmark/bot sessions)
+        self.readonly = False
+
+        self.store = get_store(appname, appauthor)
+        # leaderboard size is per store so every reader and writer agrees on it
+        self.top_n = self.store.top_n
+        self.path = self.store.path(game)
+        self.dir = os.path.dirname(self.path)
+
+    def _path(self):
+        return self.path
+
+    def load(self):
+        path = self._path()
+        data = self.store.read(path)
+        if data is None and os.path.exists(path):
+            warnings.warn(f"HighScores.load() failed for {path}")
+        if isinstance(data, dict):
+            for k, v in self.default.items():
+                if k not in data or not isinstance(data[k], dict):
+                    data[k] = self._default_entry(v)
+                else:
+                    data[k]['player'] = data[k].get('player', v.get('player'))
+                    data[k]['value'] = data[k].get('value', v.get('value'))
+            return data
+
+        try:
+            return {k: self._default_entry(v) for k, v in self.default.items()}
+        except Exception:
+            return dict(self.default)
+
+    @staticmethod
+    def _default_entry(v):
+        # a default is only a placeholder: it shows as the best but is not a leaderboard entry
+        entry = v.copy()
+        entry['top'] = []
+        return entry
+
+    def leaderboard(self, data, metric):
+        """`Leaderboard` for `metric` of loaded `data`; the default value is its floor."""
+        floor = _number((self.default.get(metric) or {}).get('value'))
+        return Leaderboard.from_entry(data.get(metric), self.top_n, floor)
+
+    def save(self, data):
+        if self.readonly:
+            return False
+        return self.store.write(self._path(), data)
 
 
 def get_saved_highscores(game=None, appname='cli-arcade', appauthor=None):
@@ -140,19 +909,12 @@ def get_saved_highscores(game=None, appname='cli-arcade', appauthor=None):
                 continue
             names.append(entry)
 
+    store = get_store(appname, appauthor)
     for name in names:
-        hs = HighScores(name, default=None, appname=appname, appauthor=appauthor)
-        path = hs._path()
-        if not os.path.exists(path):
-            continue
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            if isinstance(data, dict):
-                results.append({'game': name, 'scores': data})
-        except Exception:
-            # ignore unreadable files and continue
-            continue
+        # only actual saved file contents (no defaults), served from the cache
+        data = store.read(store.path(name))
+        if isinstance(data, dict):
+            results.append({'game': name, 'scores': data})
 
     return results
 
@@ -162,10 +924,11 @@ def merge_update_highscores(scores_map, appname='cli-arcade', appauthor=None):
 
     ``scores_map`` should be a mapping from game directory name -> scores dict,
     e.g. ``{'byte_bouncer': {...}, 'star_ship': {...}}``. For each game the
-    function reads the actual saved `highscores.json` (if present), compares
-    each key's `value` and replaces the lower value with the higher one.
+    function reads the actual saved `highscores.json` (if present) and merges
+    each key's leaderboard, so the higher `value` ends up as the best.
 
     If no saved file exists for a game, the incoming scores are saved as-is.
+    Each game costs one read and at most one save.
 
     Returns a list of game names that were updated (files saved).
     """
@@ -173,49 +936,28 @@ def merge_update_highscores(scores_map, appname='cli-arcade', appauthor=None):
     if not isinstance(scores_map, dict):
         return updated_games
 
+    store = get_store(appname, appauthor)
     for game_name, incoming in scores_map.items():
         if not isinstance(incoming, dict):
             continue
 
-        hs = HighScores(game_name, default=None, appname=appname, appauthor=appauthor)
-        path = hs._path()
-
-        # load actual existing data (avoid HighScores.load() defaults)
-        existing = {}
-        if os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    if isinstance(loaded, dict):
-                        existing = loaded
-            except Exception:
-                existing = {}
+        path = store.path(game_name)
+        # load actual existing data (no HighScores.load() defaults)
+        existing = store.read(path)
+        if not isinstance(existing, dict):
+            existing = {}
 
         changed = False
         # iterate incoming keys and merge
         for key, inc_val in incoming.items():
             if isinstance(inc_val, dict) and 'value' in inc_val:
-                inc_value = inc_val.get('value')
-                # existing value
                 ex_val = existing.get(key)
                 if isinstance(ex_val, dict) and 'value' in ex_val:
-                    ex_value = ex_val.get('value')
-                    # numeric comparison when possible
-                    try:
-                        inc_num = float(inc_value)
-                        ex_num = float(ex_value)
-                    except Exception:
-                        inc_num = ex_num = None
-
-                    if inc_num is not None and ex_num is not None:
-                        if inc_num > ex_num:
-                            existing[key] = {'player': inc_val.get('player'), 'value': inc_val.get('value')}
-                            changed = True
-                    else:
-                        # fallback: if different, replace
-                        if ex_val != inc_val:
-                            existing[key] = inc_val
-                            changed = True
+                    # leaderboards are merged; the best value stays on top
+                    merged = merge_entry(ex_val, inc_val, store.top_n)
+                    if _entry_key(merged) != _entry_key(ex_val):
+                        existing[key] = merged
+                        changed = True
                 else:
                     # no existing entry -> add incoming
                     existing[key] = inc_val
@@ -228,10 +970,171 @@ def merge_update_highscores(scores_map, appname='cli-arcade', appauthor=None):
 
         if changed:
             try:
-                hs.save(existing)
-                updated_games.append(game_name)
+                if store.write(path, existing):
+                    updated_games.append(game_name)
             except Exception:
                 # ignore save failures for now
                 pass
 
     return updated_games
+
+
+class ScoreBatch:
+    """Scores from a stream of JSON lines, folded per game for one merge.
+
+    Each line is either a score event
+    ``{"game": "star_ship", "metric": "score", "player": "Ann", "value": 42}``
+    (``metric`` defaults to ``score``), a saved-scores record
+    ``{"game": "star_ship", "scores": {...}}`` as printed by `clia scores -r`,
+    or a ``{game: scores}`` map as taken by `merge_update_highscores`.
+    Numeric entries go straight into a bounded `Leaderboard` per metric,
+    so memory stays at `size` entries per metric however long the stream.
+    """
+
+    def __init__(self, size=None):
+        self.size = size
+        # game -> {metric: Leaderboard}, and game -> {key: non-numeric value}
+        self.boards = {}
+        self.other = {}
+        self.lines = 0
+        self.skipped = 0
+
+    def add(self, game, key, val):
+        """Fold one saved entry (or non-standard value) for `game`."""
+        if isinstance(val, dict) and _number(val.get('value')) is not None:
+            board = self.boards.setdefault(game, {}).get(key)
+            if board is None:
+                board = self.boards[game][key] = Leaderboard(size=self.size)
+            for e in leaderboard_entries(val):
+                board.insert(e.get('player'), e.get('value'))
+        else:
+            # non-numeric entries keep the last value seen, as merging them does
+            self.other.setdefault(game, {})[key] = val
+            self.boards.get(game, {}).pop(key, None)
+
+    def feed(self, line):
+        """Parse one line; returns False if it was skipped."""
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', 'replace')
+        if not line.strip():
+            return True
+        self.lines += 1
+        try:
+            rec = json.loads(line)
+        except Exception:
+            rec = None
+        if not isinstance(rec, dict):
+            self.skipped += 1
+            return False
+        if list(rec) == ['watermark']:
+            # trailer of `export_since` output
+            return True
+        game = rec.get('game')
+        if isinstance(game, str) and game:
+            if isinstance(rec.get('scores'), dict):
+                for key, val in rec['scores'].items():
+                    self.add(game, key, val)
+            elif _number(rec.get('value')) is not None:
+                self.add(game, rec.get('metric') or 'score', {'player': rec.get('player'), 'value': rec.get('value')})
+            else:
+                self.skipped += 1
+                return False
+            return True
+        found = False
+        for name, scores in rec.items():
+            if isinstance(scores, dict):
+                found = True
+                for key, val in scores.items():
+                    self.add(name, key, val)
+        if not found:
+            self.skipped += 1
+        return found
+
+    def extend(self, lines):
+        for line in lines:
+            self.feed(line)
+        return self
+
+    def scores_map(self):
+        """`{game: scores}` for `merge_update_highscores`."""
+        result = {}
+        for game in list(self.boards) + [g for g in self.other if g not in self.boards]:
+            scores = dict(self.other.get(game, {}))
+            for key, board in self.boards.get(game, {}).items():
+                if len(board):
+                    scores[key] = board.to_entry()
+            if scores:
+                result[game] = scores
+        return result
+
+
+def sync_score_lines(lines, appname='cli-arcade', appauthor=None):
+    """Merge a stream of JSON score lines (see `ScoreBatch`) into saved highscores.
+
+    The stream is read once and each game gets a single read-merge-write.
+    Returns the `ScoreBatch` and the list of updated games.
+    """
+    batch = ScoreBatch(get_store(appname, appauthor).top_n).extend(lines)
+    return batch, merge_update_highscores(batch.scores_map(), appname, appauthor)
+
+
+# prefix of `export_since` watermarks (bumped if their format changes)
+WATERMARK_PREFIX = 'w1.'
+
+
+def _digest(val):
+    return format(zlib.crc32(json.dumps(val, sort_keys=True, ensure_ascii=False).encode('utf-8')), '08x')
+
+
+def encode_watermark(marks):
+    """Token for a `{game: {key: digest}}` map of exported entries."""
+    raw = json.dumps(marks, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return WATERMARK_PREFIX + base64.urlsafe_b64encode(zlib.compress(raw, 9)).decode('ascii').rstrip('=')
+
+
+def decode_watermark(token):
+    """Inverse of `encode_watermark`; '' or '0' is the empty watermark.
+
+    Raises ValueError for anything else that is not a watermark.
+    """
+    if token in (None, '', '0'):
+        return {}
+    if not token.startswith(WATERMARK_PREFIX):
+        raise ValueError(f'not a watermark: {token!r}')
+    body = token[len(WATERMARK_PREFIX):]
+    try:
+        marks = json.loads(zlib.decompress(base64.urlsafe_b64decode(body + '=' * (-len(body) % 4))))
+    except Exception as e:
+        raise ValueError(f'corrupt watermark: {e}')
+    if not isinstance(marks, dict):
+        raise ValueError('corrupt watermark')
+    return marks
+
+
+def export_since(token=None, game=None, appname='cli-arcade', appauthor=None):
+    """Saved entries that changed since the export that returned `token`.
+
+    The watermark is a compressed map of a digest per game and key, so it
+    works the same with every backend and needs no state on this machine.
+    Returns `({game: {key: entry}}, new_token)`: only games with changed or
+    new keys appear, each key with its whole saved entry (leaderboards
+    included), ready for `merge_update_highscores`. Keys and games that
+    disappeared (e.g. after `clia reset`) are dropped from the watermark
+    but cannot be exported. With `game` only that game is compared; the
+    marks of the others are carried over unchanged.
+    """
+    old_marks = decode_watermark(token)
+    # compared games are rebuilt from what is saved, so games without saved
+    # scores any more lose their marks; the others are carried over
+    marks = {} if game is None else {k: v for k, v in old_marks.items() if k != game}
+    changes = {}
+    for item in get_saved_highscores(game, appname, appauthor):
+        name = item['game']
+        old = old_marks.get(name) or {}
+        new = {}
+        for key, val in item['scores'].items():
+            new[key] = _digest(val)
+            if old.get(key) != new[key]:
+                changes.setdefault(name, {})[key] = val
+        marks[name] = new
+    return changes, encode_watermark(marks)
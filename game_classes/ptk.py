@@ -4,6 +4,7 @@ import shutil
 import threading
 import queue
 import time
+from collections import deque
 
 _HAS_PROMPT_TOOLKIT = True
 try:
@@ -302,6 +303,10 @@ class _Screen:
         self._attrs[y][x] = attr
 
     def refresh(self):
+        sys.stdout.write(self._compose())
+        sys.stdout.flush()
+
+    def _compose(self):
         out_lines = []
         for y in range(self._rows):
             line = []
@@ -324,8 +329,7 @@ class _Screen:
                 line.append(self._buffer[y][x])
             line.append("\x1b[0m")
             out_lines.append("".join(line))
-        sys.stdout.write("\x1b[H" + "\n".join(out_lines))
-        sys.stdout.flush()
+        return "\x1b[H" + "\n".join(out_lines)
 
     def getch(self):
         if self._use_msvcrt:
@@ -340,6 +344,47 @@ class _Screen:
         return _map_keypress(key)
 
 
+class HeadlessScreen(_Screen):
+    """Fixed-size screen that never touches the real terminal.
+
+    Keys are read from an internal queue filled with `feed()`; `getch()`
+    returns -1 when it is empty. When `render` is true, `refresh()` still
+    composes the ANSI frame so its size can be measured (`frames`,
+    `bytes_written`), but nothing is written to stdout.
+    """
+
+    def __init__(self, cols=80, rows=24, render=True):
+        self._timeout = 0.0
+        self._rows = int(rows)
+        self._cols = int(cols)
+        self._keys = deque()
+        self.render = render
+        self.frames = 0
+        self.bytes_written = 0
+        self.clear()
+
+    def _refresh_size(self):
+        return None
+
+    def stop(self):
+        return None
+
+    def feed(self, *keys):
+        for key in keys:
+            self._keys.append(int(key))
+
+    def refresh(self):
+        self.frames += 1
+        if self.render:
+            self.bytes_written += len(self._compose().encode("utf-8"))
+
+    def getch(self):
+        try:
+            return self._keys.popleft()
+        except IndexError:
+            return -1
+
+
 def _map_keypress(keypress):
     key = keypress.key
     if key == Keys.Left:
@@ -0,0 +1,165 @@
+"""SQLite storage for highscores (the 'sqlite' backend of `HighScoreStore`).
+
+One database holds every game. `scores` is the full history: one row per
+leaderboard entry ever saved. `best` holds each player's best value per
+(game, metric) and serves the leaderboards. Both tables are indexed on
+(game, metric, value) and on player, so a top-N or per-player query only
+walks the rows it returns, whatever the size of the history. History
+queries bounded by time use (game, metric, created).
+"""
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    player TEXT,
+    value NUMERIC NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_game_metric_value ON scores (game, metric, value);
+CREATE INDEX IF NOT EXISTS scores_game_metric_created ON scores (game, metric, created);
+CREATE INDEX IF NOT EXISTS scores_player ON scores (player, game, metric, created);
+CREATE TABLE IF NOT EXISTS best (
+    game TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    player TEXT NOT NULL,
+    value NUMERIC NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (game, metric, player)
+);
+CREATE INDEX IF NOT EXISTS best_game_metric_value ON best (game, metric, value);
+CREATE INDEX IF NOT EXISTS best_player ON best (player);
+CREATE TABLE IF NOT EXISTS extras (
+    game TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (game, key)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# keep the player's earlier row unless the new value is strictly higher
+UPSERT_BEST = """
+INSERT INTO best (game, metric, player, value, updated) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (game, metric, player) DO UPDATE SET value = excluded.value, updated = excluded.updated
+WHERE excluded.value > best.value
+"""
+
+
+class ScoreDB:
+    """Connection to the highscores database (WAL mode, one per process)."""
+
+    def __init__(self, path, timeout=5.0):
+        self.path = path
+        # transactions are explicit (BEGIN IMMEDIATE ... COMMIT)
+        self.conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        try:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        except sqlite3.DatabaseError:
+            pass
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    def data_version(self):
+        """Changes whenever another connection commits (see PRAGMA data_version)."""
+        return self.conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def transaction(self):
+        return _Transaction(self.conn)
+
+    def meta(self, key, default=None):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def record(self, game, rows, extras=None):
+        """Insert `(metric, player, value, time)` rows and `{key: json}` extras in one transaction."""
+        with self.transaction():
+            self.insert(game, rows, extras)
+
+    def insert(self, game, rows, extras=None):
+        """`record` without the transaction (for callers batching several games)."""
+        if rows:
+            self.conn.executemany(
+                'INSERT INTO scores (game, metric, player, value, created) VALUES (?, ?, ?, ?, ?)',
+                [(game, m, p, v, t) for m, p, v, t in rows])
+            self.conn.executemany(UPSERT_BEST, [(game, m, p, v, t) for m, p, v, t in rows])
+        if extras:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO extras (game, key, data) VALUES (?, ?, ?)',
+                [(game, k, d) for k, d in extras.items()])
+
+    def metrics(self, game):
+        return [r[0] for r in self.conn.execute('SELECT DISTINCT metric FROM best WHERE game = ? ORDER BY metric', (game,))]
+
+    def games(self):
+        return [r[0] for r in self.conn.execute('SELECT DISTINCT game FROM best ORDER BY game')]
+
+    def top(self, game, metric, limit, player=None, since=None):
+        """Best `(player, value, time)` per player for one metric, highest first.
+
+        With `since` (epoch seconds) only scores saved since then count,
+        taken from the history rather than the per-player bests.
+        """
+        if since is None:
+            sql = 'SELECT player, value, updated FROM best WHERE game = ? AND metric = ?'
+            args = [game, metric]
+            if player is not None:
+                sql += ' AND player = ?'
+                args.append(player)
+            sql += ' ORDER BY value DESC, updated ASC LIMIT ?'
+        else:
+            sql = 'SELECT player, MAX(value) AS best, MAX(created) FROM scores WHERE game = ? AND metric = ? AND created >= ?'
+            args = [game, metric, float(since)]
+            if player is not None:
+                sql += ' AND player = ?'
+                args.append(player)
+            sql += ' GROUP BY player ORDER BY best DESC LIMIT ?'
+        args.append(-1 if limit is None else int(limit))
+        return [tuple(r) for r in self.conn.execute(sql, args)]
+
+    def extras(self, game):
+        return {r[0]: r[1] for r in self.conn.execute('SELECT key, data FROM extras WHERE game = ?', (game,))}
+
+    def count(self, game):
+        return self.conn.execute('SELECT COUNT(*) FROM scores WHERE game = ?', (game,)).fetchone()[0]
+
+    def delete_game(self, game):
+        """Remove every row for `game`; returns the number of history rows removed."""
+        with self.transaction():
+            n = self.conn.execute('DELETE FROM scores WHERE game = ?', (game,)).rowcount
+            self.conn.execute('DELETE FROM best WHERE game = ?', (game,))
+            self.conn.execute('DELETE FROM extras WHERE game = ?', (game,))
+        return n
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+    # queue on busy_timeout instead of failing halfway through
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute('COMMIT')
+        else:
+            self.conn.execute('ROLLBACK')
+        return False
+
@@ -0,0 +1 @@
+"""ball_storm game package"""
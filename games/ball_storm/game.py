@@ -0,0 +1,113 @@
+from game_classes import ptk
+import os
+import sys
+
+try:
+  this_dir = os.path.dirname(__file__)
+  project_root = os.path.abspath(os.path.join(this_dir, '..', '..'))
+  if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+except Exception:
+  project_root = None
+
+from game_classes.highscores import HighScores
+from game_classes.game_base import GameBase
+from game_classes.menu import Menu
+from game_classes.tools import init_ptk
+from games.byte_bouncer.game import Game as ByteBouncerGame, BallField, TITLE, BASE_SPEED, SUBCELL
+
+DESCRIPTION = """Endless Byte Bouncer with hundreds of balls!
+Every missed ball drains your shield and every bounce recharges it; the storm grows with each level.
+How long can your shield hold?"""
+
+# minimum terminal size required to run this game (cols, rows)
+MIN_COLS = 70
+MIN_ROWS = 20
+# index in the game list (`clia run 5`); kept when new games are added
+MENU_ORDER = 5
+
+START_BALLS = 50
+MAX_BALLS = 500
+# extra balls in the storm per level
+BALLS_PER_LEVEL = 25
+# new balls dropped in per tick while the storm is below its size
+SPAWN_PER_TICK = 5
+SHIELD = 100
+
+class Game(ByteBouncerGame):
+    def __init__(self, stdscr, player_name='Player'):
+      self.title = TITLE
+      self.highscores = HighScores('ball_storm', {
+          'score': {'player': 'Player', 'value': 0},
+          'level': {'player': 'Player', 'value': 1},
+      })
+      GameBase.__init__(self, stdscr, player_name, 0.12, ptk.COLOR_GREEN)
+      self.init_scores([['score', 0], ['level', 1]])
+      self.width += 1
+
+      # game state
+      self.count = 0
+      self.shield = SHIELD
+      self.balls = BallField()
+      self.paddle_w = 30
+      self.paddle_x = self.width // 2 - self.paddle_w // 2
+      self.aim_assist = False
+      for _ in range(START_BALLS):
+        self.spawn_ball()
+
+    def storm_size(self):
+      return min(MAX_BALLS, START_BALLS + BALLS_PER_LEVEL * (int(self.scores['level']) - 1))
+
+    def ball_speed(self):
+      # levels come quickly in a storm: speed up gently, to at most two cells per tick
+      return min(2 * SUBCELL, int(BASE_SPEED * (1 + 0.01 * (int(self.scores['level']) - 1))))
+
+    def bounce_points(self, kind, balls):
+      # the ball count would dwarf everything else in a storm
+      return 10 * self.scores['level'] * kind
+
+    def on_miss(self, misses):
+      # no primary ball: every miss costs shield instead
+      self.balls.remove_many(misses)
+      self.shield -= len(misses)
+      if self.shield <= 0:
+        self.shield = 0
+        self.over = True
+        return False
+      return True
+
+    def step(self, now):
+      bounced = self.count
+      super().step(now)
+      if self.over:
+        return
+      self.shield = min(SHIELD, self.shield + self.count - bounced)
+      for _ in range(min(SPAWN_PER_TICK, self.storm_size() - len(self.balls))):
+        self.spawn_ball()
+
+    def draw_info(self):
+      super().draw_info()
+      try:
+        self.stdscr.addstr(len(self.title) + 7, 2, f'Balls: {len(self.balls):,}  Shield: {self.shield}', ptk.color_pair(ptk.COLOR_YELLOW))
+      except Exception:
+        pass
+
+def main(stdscr):
+  init_ptk(stdscr)
+  while True:
+    game = Game(stdscr)
+    menu = Menu(game)
+    start = menu.display()
+    if not start:
+      break
+    game.update_player_name(start)
+    game.run()
+
+if __name__ == '__main__':
+    try:
+        ptk.wrapper(main)
+    except KeyboardInterrupt:
+        try:
+            ptk.endwin()
+        except Exception:
+            pass
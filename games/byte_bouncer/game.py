@@ -1,4 +1,5 @@
 from game_classes import ptk
+import math
 import os
 import random
 import sys
@@ -15,6 +16,13 @@ from game_classes.highscores import HighScores
 from game_classes.game_base import GameBase
 from game_classes.menu import Menu
 from game_classes.tools import glyph, init_ptk, clamp
+from game_classes.bot import Policy
+from game_classes.entities import EntityColumns
+
+try:
+  import numpy as np
+except Exception:
+  np = None
 
 TITLE = [
      '  ____  _  _  ____  ____    ____   __   _  _  __ _   ___  ____  ____  ',
@@ -24,12 +32,198 @@ TITLE = [
 ]
 
 DESCRIPTION = """Bounce the ball and try to keep it from hitting the floor!
-Each successful bounce scores points, and every 5 bounces increases the level and spawns a new ball.
+Each successful bounce scores points, and every 5 bounces increases the level, speeds the balls up and spawns a new ball.
+Where the ball hits the paddle sets the angle it leaves at.
 How long can you keep them all in play?"""
 
 # minimum terminal size required to run this game (cols, rows)
 MIN_COLS = 70
 MIN_ROWS = 20
+# index in the game list (`clia run 0`); kept when new games are added
+MENU_ORDER = 0
+
+# positions and velocities are fixed-point integers in 1/SUBCELL cells
+SUBCELL = 256
+# ball speed (sub-cells per tick) at level 1: one cell per axis per tick
+BASE_SPEED = int(SUBCELL * math.sqrt(2))
+MAX_SPEED = 5 * SUBCELL
+# a paddle hit sends the ball off between these angles from vertical,
+# steeper near the paddle center
+MIN_ANGLE = math.radians(20)
+MAX_ANGLE = math.radians(65)
+
+def fold(p, v, hi):
+    """Fold position `p` back into [0, hi] off walls at 0 and hi.
+
+    Any number of reflections is resolved at once, so a fast ball can't
+    tunnel through a wall. Returns the position and the velocity `v`
+    with its sign after the reflections. A ball that ends exactly on a
+    wall always heads away from it, so the sign does not depend on how
+    many steps the move was split into.
+    """
+    period = 2 * hi
+    m = p % period
+    if m == 0:
+      return 0, abs(v)
+    if m == hi:
+      return hi, -abs(v)
+    if m > hi:
+      return period - m, -v
+    return m, v
+
+def paddle_velocity(x, vx, paddle_x, paddle_w, speed):
+    """Velocity after a paddle hit at sub-cell `x`, with magnitude `speed`."""
+    half = paddle_w * SUBCELL / 2.0
+    rel = (x + SUBCELL // 2 - paddle_x * SUBCELL - half) / half
+    rel = max(-1.0, min(1.0, rel))
+    # the side of the paddle that was hit picks the direction; dead center keeps it
+    side = -1 if rel < 0 else (1 if rel > 0 else (-1 if vx < 0 else 1))
+    angle = MIN_ANGLE + abs(rel) * (MAX_ANGLE - MIN_ANGLE)
+    return side * max(1, int(round(speed * math.sin(angle)))), -max(1, int(round(speed * math.cos(angle))))
+
+def predict_landing(x, y, vx, vy, hi, plane):
+    """Where and when a ball reaches the paddle plane, in O(1).
+
+    Takes the ball state in sub-cells and the field limits used by
+    `BallField.step` (`hi` = right wall, `plane` = paddle plane). Instead
+    of simulating tick by tick, the ceiling bounce and any number of side
+    wall reflections are folded in closed form. Returns `(ticks, x)`: the
+    landing happens during tick `ticks` (1 = the next step) at sub-cell
+    `x`, exactly as the step would compute it (paddle aside).
+    """
+    if vy == 0:
+      return None
+    if vy < 0:
+      # up to the ceiling first: the first tick that would go above 0 reflects
+      up = y // -vy + 1
+      x, vx = fold(x + up * vx, vx, hi)
+      y, vy = -(y + up * vy), -vy
+    else:
+      up = 0
+    # ticks until the move crosses the plane (at least one)
+    k = max(1, -((y - plane) // vy))
+    x0, cvx = fold(x + (k - 1) * vx, vx, hi)
+    num = max(0, plane - (y + (k - 1) * vy))
+    xc, _ = fold(x0 + cvx * num // vy, cvx, hi)
+    return up + k, xc
+
+class BallField(EntityColumns):
+    """Ball positions and velocities kept in parallel columns.
+
+    Values are fixed-point integers in 1/SUBCELL of a cell, so balls move
+    at any angle and speed without shortening the tick. With NumPy
+    installed the columns are NumPy arrays and a tick moves every ball
+    with a handful of vectorized operations; otherwise they are
+    `array('q')` columns updated in one plain loop. Slot 0 is the primary
+    ball; `spawn`, `remove` and `remove_many` come from `EntityColumns`.
+    """
+    FIELDS = ('x', 'y', 'vx', 'vy')
+
+    def positions(self):
+      """List of (x, y) cells for every ball, primary first."""
+      if self.numpy:
+        return list(zip((self.x[:self.n] // SUBCELL).tolist(), (self.y[:self.n] // SUBCELL).tolist()))
+      return [(x // SUBCELL, y // SUBCELL) for x, y in zip(self.x, self.y)]
+
+    def predict(self, width, height):
+      """`predict_landing` for every ball: a list of (ticks, cell), primary first."""
+      hi = (width - 2) * SUBCELL
+      plane = (height - 2) * SUBCELL
+      out = []
+      for x, y, vx, vy in self:
+        hit = predict_landing(x, y, vx, vy, hi, plane)
+        out.append(None if hit is None else (hit[0], hit[1] // SUBCELL))
+      return out
+
+    def land(self, x0, y0, vx, vy, hi, plane, paddle_x, paddle_w, speed):
+      """Resolve a ball whose move from (x0, y0) crosses the paddle plane.
+
+      The crossing point is found exactly, so the paddle is checked where
+      the ball actually passes it however fast it moves. Returns the new
+      `(x, y, vx, vy, kind)`: kind 1 is a paddle hit, 2 an edge hit and 0
+      a miss (the ball is then parked below the floor).
+      """
+      num = max(0, plane - y0)
+      xc, cvx = fold(x0 + vx * num // vy, vx, hi)
+      cell = xc // SUBCELL
+      if paddle_x <= cell < paddle_x + paddle_w:
+        nvx, nvy = paddle_velocity(xc, cvx, paddle_x, paddle_w, speed)
+        kind = 1
+      elif (cell == paddle_x - 1 and cvx > 0) or (cell == paddle_x + paddle_w and cvx < 0):
+        nvx, nvy = -cvx, -vy
+        kind = 2
+      else:
+        return xc, plane + 3 * SUBCELL, cvx, vy, 0
+      # spend the rest of the tick moving away from the paddle
+      rest = vy - num
+      x, nvx = fold(xc + nvx * rest // vy, nvx, hi)
+      return x, plane + nvy * rest // vy, nvx, nvy, kind
+
+    def step(self, width, height, paddle_x, paddle_w, speed=BASE_SPEED):
+      """Move every ball one tick and resolve wall and paddle collisions.
+
+      Balls reflect off the side walls and the ceiling and bounce off the
+      paddle (leaving at `speed`) on the row above it. Returns
+      `(bounces, misses)`: `bounces` lists `(slot, kind)` in slot order,
+      where kind is 1 for a paddle hit and 2 for an edge hit, and `misses`
+      lists the slots of balls that got past the paddle. Missed balls are
+      left in place for the caller to handle.
+      """
+      hi = (width - 2) * SUBCELL
+      plane = (height - 2) * SUBCELL
+      if self.numpy:
+        return self._step_numpy(hi, plane, paddle_x, paddle_w, speed)
+      xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+      bounces = []
+      misses = []
+      for i in range(self.n):
+        vx = vxs[i]
+        vy = vys[i]
+        y = ys[i] + vy
+        if vy > 0 and y >= plane:
+          x, y, vx, vy, kind = self.land(xs[i], ys[i], vx, vy, hi, plane, paddle_x, paddle_w, speed)
+          if kind:
+            bounces.append((i, kind))
+          else:
+            misses.append(i)
+        else:
+          x, vx = fold(xs[i] + vx, vx, hi)
+          if y < 0:
+            y = -y
+            vy = -vy
+        xs[i] = x
+        ys[i] = y
+        vxs[i] = vx
+        vys[i] = vy
+      return bounces, misses
+
+    def _step_numpy(self, hi, plane, paddle_x, paddle_w, speed):
+      n = self.n
+      x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+      # the few balls reaching the paddle plane are resolved one by one
+      landing = np.nonzero((vy > 0) & (y + vy >= plane))[0].tolist()
+      before = [(i, int(x[i]), int(y[i]), int(vx[i]), int(vy[i])) for i in landing]
+      # everything else: fold off the side walls, reflect off the ceiling
+      period = 2 * hi
+      m = (x + vx) % period
+      back = m > hi
+      x[:] = np.where(back, period - m, m)
+      vx[back] *= -1
+      # on a wall: head away from it (see `fold`)
+      vx[:] = np.where(m == 0, np.abs(vx), np.where(m == hi, -np.abs(vx), vx))
+      y += vy
+      up = y < 0
+      y[up] *= -1
+      vy[up] *= -1
+      bounces = []
+      misses = []
+      for i, x0, y0, vx0, vy0 in before:
+        x[i], y[i], vx[i], vy[i], kind = self.land(x0, y0, vx0, vy0, hi, plane, paddle_x, paddle_w, speed)
+        if kind:
+          bounces.append((i, kind))
+        else:
+          misses.append(i)
+      return bounces, misses
 
 class Game(GameBase):
     def __init__(self, stdscr, player_name='Player'):
@@ -44,12 +238,12 @@ class Game(GameBase):
 
       # game state
       self.count = 0
-      # multiple balls support: list of dicts with x,y,vx,vy
-      self.balls = [
-        { 'x': self.width // 2, 'y': self.height // 2, 'vx': random.choice([-1,1]), 'vy': -1 }
-      ]
+      # multiple balls support: parallel position/velocity arrays; slot 0 is the primary
+      self.balls = BallField()
+      self.balls.spawn(self.width // 2 * SUBCELL, self.height // 2 * SUBCELL, random.choice([-1,1]) * SUBCELL, -SUBCELL)
       self.paddle_w = 30
       self.paddle_x = self.width // 2 - self.paddle_w // 2
+      self.aim_assist = False
 
     def draw_info(self):
       info_x = 2
@@ -70,6 +264,7 @@ class Game(GameBase):
         self.stdscr.addstr(info_y + 9 , info_x, '→ | d     : Right')
         self.stdscr.addstr(info_y + 10, info_x, 'Backspace : Pause')
         self.stdscr.addstr(info_y + 11, info_x, 'ESC       : Quit')
+        self.stdscr.addstr(info_y + 12, info_x, 'h         : Aim Assist')
       except Exception:
         pass
 
@@ -77,13 +272,12 @@ class Game(GameBase):
       self.draw_info()
       # draw balls
       try:
-        for idx, b in enumerate(self.balls):
+        ch = glyph('CIRCLE_FILLED', 'O')
+        primary = ptk.color_pair(ptk.COLOR_MAGENTA) | ptk.A_BOLD
+        extra = ptk.color_pair(ptk.COLOR_YELLOW) | ptk.A_BOLD
+        for idx, (bx, by) in enumerate(self.balls.positions()):
           try:
-            if idx == 0:
-              attr = ptk.color_pair(ptk.COLOR_MAGENTA) | ptk.A_BOLD
-            else:
-              attr = ptk.color_pair(ptk.COLOR_YELLOW) | ptk.A_BOLD
-            self.stdscr.addch(int(b['y']), int(b['x']), glyph('CIRCLE_FILLED', 'O'), attr)
+            self.stdscr.addch(by, bx, ch, primary if idx == 0 else extra)
           except Exception:
             pass
       except Exception:
@@ -115,105 +309,129 @@ class Game(GameBase):
           self.stdscr.addch(self.height - 1, x, '=', ptk.color_pair(ptk.COLOR_GREEN) | ptk.A_BOLD)
         except Exception:
           pass
+      if getattr(self, 'aim_assist', False):
+        self.draw_aim_assist()
+
+    def draw_aim_assist(self):
+      """Mark on the floor where each ball will land; the soonest in red."""
+      marks = {}
+      for hit in self.balls.predict(self.width, self.height):
+        if hit is not None and (hit[1] not in marks or hit[0] < marks[hit[1]]):
+          marks[hit[1]] = hit[0]
+      if not marks:
+        return
+      soonest = min(marks.values())
+      for x, ticks in marks.items():
+        attr = ptk.color_pair(ptk.COLOR_RED if ticks == soonest else ptk.COLOR_YELLOW) | ptk.A_BOLD
+        try:
+          self.stdscr.addch(self.height, x, '^', attr)
+        except Exception:
+          pass
+
+    def ball_speed(self):
+      """Ball speed in sub-cells per tick for the current level."""
+      return min(MAX_SPEED, int(BASE_SPEED * (1 + 0.08 * (int(self.scores['level']) - 1))))
+
+    def spawn_ball(self):
+      """Spawn a new ball near the center top area, heading up at a random angle."""
+      speed = self.ball_speed()
+      angle = random.uniform(MIN_ANGLE, MAX_ANGLE)
+      self.balls.spawn(
+        random.randint(2, max(2, self.width-3)) * SUBCELL,
+        random.randint(2, max(2, self.height - self.height//3)) * SUBCELL,
+        random.choice([-1,1]) * max(1, int(round(speed * math.sin(angle)))),
+        -max(1, int(round(speed * math.cos(angle)))),
+      )
+
+    def bounce_points(self, kind, balls):
+      """Points for one bounce of `kind` (1 paddle, 2 edge) with `balls` in play."""
+      return 10 * self.scores['level'] * balls * kind
+
+    def on_miss(self, misses):
+      """Handle balls that reached the floor; returns False when the game is over."""
+      # if primary ball misses -> game over
+      if 0 in misses:
+        self.over = True
+        return False
+      # otherwise remove the extra balls
+      self.balls.remove_many(misses)
+      return True
 
     def step(self, now):
-      # move each ball and handle collisions
-      for i, b in enumerate(self.balls[:]):
-        b['x'] += b['vx']
-        b['y'] += b['vy']
-        # collisions with walls
-        if b['x'] < 0:
-          b['x'] = 0
-          b['vx'] *= -1
-        elif b['x'] >= self.width - 1:
-          b['x'] = self.width - 2
-          b['vx'] *= -1
-        if b['y'] < 0:
-          b['y'] = 0
-          b['vy'] *= -1
-        # bottom: check paddle
-        if b['y'] >= self.height - 1:
-          if self.paddle_x <= b['x'] < self.paddle_x + self.paddle_w:
-            # bounce
-            b['y'] = self.height - 2
-            b['vy'] *= -1
-            # normalize horizontal velocity to magnitude 1
-            if b['vx'] < 0:
-              b['vx'] = -1
-            elif b['vx'] > 0:
-              b['vx'] = 1
-            else:
-              b['vx'] = random.choice([-1, 1])
-            self.scores['score'] += 10 * self.scores['level'] * len(self.balls)
-            self.count += 1
-            # increase level every 5 successful bounces
-            if self.count % 5 == 0:
-              self.scores['level'] += 1
-              # spawn new ball near center top area
-              nb = {
-                'x': random.randint(2, max(2, self.width-3)),
-                'y': random.randint(2, max(2, self.height - self.height//3)),
-                'vx': random.choice([-1,1]),
-                'vy': -1
-              }
-              self.balls.append(nb)
-          elif b['x'] == self.paddle_x - 1 and b['vx'] > 0:
-            # edge bounce left
-            b['y'] = self.height - 1
-            b['vy'] *= -1
-            b['vx'] *= -1
-            self.scores['score'] += 10 * self.scores['level'] * len(self.balls) * 2
-            self.count += 1
-            # increase level every 5 successful bounces
-            if self.count % 5 == 0:
-              self.scores['level'] += 1
-              # spawn new ball near center top area
-              nb = {
-                'x': random.randint(2, max(2, self.width-3)),
-                'y': random.randint(2, max(2, self.height - self.height//3)),
-                'vx': random.choice([-1,1]),
-                'vy': -1
-              }
-              self.balls.append(nb)
-          elif b['x'] == self.paddle_x + self.paddle_w and b['vx'] < 0:
-            # edge bounce right
-            b['y'] = self.height - 1
-            b['vy'] *= -1
-            b['vx'] *= -1
-            self.scores['score'] += 10 * self.scores['level'] * len(self.balls) * 2
-            self.count += 1
-            # increase level every 5 successful bounces
-            if self.count % 5 == 0:
-              self.scores['level'] += 1
-              # spawn new ball near center top aread
-              nb = {
-                'x': random.randint(2, max(2, self.width-3)),
-                'y': random.randint(2, max(2, self.height - self.height//3)),
-                'vx': random.choice([-1,1]),
-                'vy': -1
-              }
-              self.balls.append(nb)
-          else:
-            b['y'] = self.height + 1
-            # if primary ball misses -> game over
-            if i == 0:
-              self.over = True
-              return
-            # otherwise remove the extra ball (it contributes to score normally)
-            try:
-              # find and remove by identity (safer if list has changed)
-              self.balls.pop(i)
-            except Exception:
-              try:
-                self.balls.remove(b)
-              except Exception:
-                pass
+      # move every ball and resolve collisions in one batch; balls spawned
+      # this tick are added afterwards so they first move on the next tick
+      bounces, misses = self.balls.step(self.width, self.height, self.paddle_x, self.paddle_w, self.ball_speed())
+      if misses and not self.on_miss(misses):
+        return
+      balls = len(self.balls)
+      spawned = 0
+      for _, kind in bounces:
+        self.scores['score'] += self.bounce_points(kind, balls + spawned)
+        self.count += 1
+        # increase level every 5 successful bounces
+        if self.count % 5 == 0:
+          self.scores['level'] += 1
+          spawned += 1
+      for _ in range(spawned):
+        self.spawn_ball()
 
     def movement(self, ch):
       if ch in (ptk.KEY_LEFT, ord('a')):
         self.paddle_x = int(clamp(self.paddle_x - 2, 0, self.width - self.paddle_w))
       elif ch in (ptk.KEY_RIGHT, ord('d')):
         self.paddle_x = int(clamp(self.paddle_x + 2, 0, self.width - self.paddle_w))
+      elif ch == ord('h'):
+        self.aim_assist = not getattr(self, 'aim_assist', False)
+
+class AutoPaddle(Policy):
+    """Bot that steers the paddle under the balls about to land.
+
+    Landings come from `predict_landing`, so a tick costs O(balls) with
+    no simulation. The primary ball is the goal, since missing it ends
+    the game; an earlier ball is caught on the way when there is still
+    time to get back. Presses at most one key per tick, like a player
+    holding an arrow key. Use with
+    `clia run <game> --bot games.byte_bouncer.game:AutoPaddle`.
+    """
+
+    @staticmethod
+    def presses(paddle_x, paddle_w, cell):
+      """Key presses needed before the paddle covers `cell` (two cells per press)."""
+      if cell < paddle_x:
+        return (paddle_x - cell + 1) // 2
+      if cell >= paddle_x + paddle_w:
+        return (cell - paddle_x - paddle_w + 2) // 2
+      return 0
+
+    def act(self, view):
+      balls = view.balls
+      # one frozen copy of each column per tick
+      xs, ys, vxs, vys = balls.x, balls.y, balls.vx, balls.vy
+      hi = (view.width - 2) * SUBCELL
+      plane = (view.height - 2) * SUBCELL
+      hits = []
+      for i in range(balls.n):
+        hit = predict_landing(xs[i], ys[i], vxs[i], vys[i], hi, plane)
+        if hit is not None:
+          hits.append((hit[0], hit[1] // SUBCELL, i))
+      if not hits:
+        return None
+      hits.sort()
+      px, pw = view.paddle_x, view.paddle_w
+      goal = next((h for h in hits if h[2] == 0), hits[0])
+      for h in hits:
+        if h[0] >= goal[0]:
+          break
+        if (self.presses(px, pw, h[1]) <= h[0]
+            and self.presses(h[1] - pw // 2, pw, goal[1]) <= goal[0] - h[0]):
+          goal = h
+          break
+      target = int(clamp(goal[1] - pw // 2, 0, view.width - pw))
+      if px < target - 1:
+        return ptk.KEY_RIGHT
+      if px > target + 1:
+        return ptk.KEY_LEFT
+      return None
 
 def main(stdscr):
   init_ptk(stdscr)
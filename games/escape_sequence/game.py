@@ -16,6 +16,7 @@ from game_classes.menu import Menu
 from game_classes.tools import init_ptk, glyph, is_enter_key
 import random
 import time
+from collections import deque
 
 TITLE = [                                                                                                                         
   ' ██████  ▄▄▄▄  ▄▄▄▄  ▄▄▄  ▄▄▄▄  ▄▄▄▄▄   ▄█████ ▄▄▄▄▄  ▄▄▄  ▄▄ ▄▄ ▄▄▄▄▄ ▄▄  ▄▄  ▄▄▄▄ ▄▄▄▄▄ ',
@@ -31,6 +32,146 @@ Can you escape the sequence?"""
 # minimum terminal size required to run this game (cols, rows)
 MIN_COLS = 100
 MIN_ROWS = 20
+# index in the game list (`clia run 1`); kept when new games are added
+MENU_ORDER = 1
+
+# obstacle columns are generated this many screens ahead at a time
+LOOKAHEAD_SCREENS = 2
+# placements tried for an obstacle before its column is left empty
+PLACEMENT_TRIES = 3
+
+class ColumnField:
+    """Scrolling play field stored as a ring buffer of columns.
+
+    Each column is an int bitmask of the rows holding an obstacle block,
+    with a parallel bitmask for discs and a count of the obstacles spawned
+    into it. Screen column x lives in slot (offset + x) % size, so moving
+    the whole field one column left is an offset bump plus clearing the
+    slot that wraps around, whatever is on screen. Columns also have an
+    absolute index (offset + x) that never repeats.
+    """
+    def __init__(self, size):
+        self.size = max(1, int(size))
+        self.offset = 0
+        self.blocks = [0] * self.size
+        self.discs = [0] * self.size
+        self.counts = [0] * self.size
+
+    def slot(self, x):
+        return (self.offset + x) % self.size
+
+    def add_obstacle(self, x, y, h):
+        s = self.slot(x)
+        self.blocks[s] |= ((1 << h) - 1) << y
+        self.counts[s] += 1
+
+    def add_disc(self, x, y):
+        self.discs[self.slot(x)] |= 1 << y
+
+    def take_discs(self, x, rows):
+        """Remove the discs in column x on the `rows` bitmask; returns how many."""
+        s = self.slot(x)
+        hit = self.discs[s] & rows
+        self.discs[s] &= ~hit
+        return bin(hit).count('1')
+
+    def blocked(self, x, rows):
+        """True if column x has an obstacle block on the `rows` bitmask."""
+        return bool(self.blocks[self.slot(x)] & rows)
+
+    def scroll(self):
+        """Move the field one column left; column 0 drops off the screen."""
+        s = self.offset % self.size
+        self.blocks[s] = 0
+        self.discs[s] = 0
+        self.counts[s] = 0
+        self.offset += 1
+
+    def count_obstacles(self, start, stop):
+        """Obstacles in absolute columns start..stop-1 still on the field."""
+        start = max(start, self.offset)
+        stop = min(stop, self.offset + self.size)
+        return sum(self.counts[a % self.size] for a in range(start, stop))
+
+    def columns(self):
+        """Yield (x, blocks, discs) for every non-empty screen column."""
+        for x in range(self.size):
+            s = (self.offset + x) % self.size
+            if self.blocks[s] or self.discs[s]:
+                yield x, self.blocks[s], self.discs[s]
+
+    def clear(self):
+        self.blocks = [0] * self.size
+        self.discs = [0] * self.size
+        self.counts = [0] * self.size
+
+class ObstacleStream:
+    """Obstacle columns generated in batches ahead of the screen.
+
+    Each queued column is an obstacle `(y, h)` or None. While a batch is
+    generated, the rows a player holding one screen column could be on
+    are tracked as a single bitmask: between ticks they may move one row
+    up or down, then every row whose three-row sprite overlaps the
+    arriving obstacle drops out. An obstacle that would leave no row
+    reachable is placed elsewhere or dropped, so a way through always
+    exists however high the spawn rate. Each column costs a few big-int
+    operations, whatever the height of the field.
+    """
+    def __init__(self, height, batch):
+        self.height = height
+        self.batch = max(1, int(batch))
+        # rows the player can stand on
+        self.valid = ((1 << height) - 1) & ~1
+        self.columns = deque()
+        self.reach = self.valid
+        self.chance = 0.0
+        self.tall = False
+
+    def spread(self, reach):
+        """Rows reachable one tick after `reach`."""
+        return (reach | reach << 1 | reach >> 1) & self.valid
+
+    def safe(self, blocks):
+        """Rows the player can stand on next to the `blocks` row bitmask."""
+        return self.valid & ~(blocks | blocks << 1 | blocks >> 1)
+
+    def reset(self, start_y, lead, chance, tall):
+        """Start a new stream for a player at `start_y`.
+
+        `lead` is how many ticks the player can move before the first
+        column reaches them.
+        """
+        self.columns.clear()
+        self.chance = chance
+        self.tall = tall
+        reach = (1 << start_y) & self.valid or self.valid
+        for _ in range(min(max(0, lead), self.height)):
+            reach = self.spread(reach)
+        self.reach = reach
+
+    def fill(self):
+        """Generate the next batch of columns."""
+        height = self.height
+        for _ in range(self.batch):
+            reach = self.spread(self.reach)
+            column = None
+            blocks = 0
+            if random.random() < self.chance:
+                for _ in range(PLACEMENT_TRIES):
+                    oy = random.randint(1, max(1, height - 2))
+                    h = random.choice([1, 2]) if self.tall else 1
+                    mask = ((1 << h) - 1) << oy
+                    if reach & self.safe(mask):
+                        column, blocks = (oy, h), mask
+                        break
+            self.reach = reach & self.safe(blocks)
+            self.columns.append(column)
+
+    def next(self):
+        """Pop the obstacle (or None) for the column entering this tick."""
+        if not self.columns:
+            self.fill()
+        return self.columns.popleft()
 
 class Game(GameBase):
     def __init__(self, stdscr, player_name='Player'):
@@ -58,8 +199,11 @@ class Game(GameBase):
         self.frame_index = 0
         self.frame_time = 0.0
 
-        # obstacles: list of dicts {x, y, w, h, passed}
-        self.obstacles = []
+        # obstacles and collectible discs: one ring-buffered column per
+        # screen column; `passed_mark` is the absolute column up to which
+        # obstacles have been scored as passed
+        self.field = ColumnField(self.width)
+        self.passed_mark = 0
         self.spawn_acc = 0.0
         self.spawn_rate = 0.12  # base chance per tick to spawn
         self.last_step = time.time()
@@ -72,12 +216,25 @@ class Game(GameBase):
         self.disc_active = False
         self.disc_duration_ticks = 8
         self.disc_timer = 0
-        # spawned disc items (collectibles moving left); keep separate from `self.discs` resource count
-        self.spawned_discs = []
+        # spawned disc items (collectibles moving left) live in `self.field`;
+        # `self.discs` is the resource count
         self.disc_bonus = 50
         # cooldown (ticks) to avoid immediate repeated disc spawns
         self.disc_spawn_cooldown_reset = 200
         self.disc_spawn_cooldown = self.disc_spawn_cooldown_reset
+        # obstacles come from a stream generated ahead and kept passable
+        self.stream = ObstacleStream(self.height, self.width * LOOKAHEAD_SCREENS)
+        self.reset_stream()
+
+    def reset_stream(self):
+        """Restart the obstacle stream for the current level and spawn rate."""
+        level = int(self.scores.get('level', 1))
+        # slightly higher spawn chance per tick with level
+        chance = min(0.5, self.spawn_rate + (level - 1) * 0.03)
+        # ticks the player can move before the first column reaches them
+        # (one spare for the tick the column spawns on)
+        lead = max(0, self.width - self.finish_line) - self.player_x - self.initial_stall - 1
+        self.stream.reset(self.player_y, lead, chance, level >= 2)
 
     def draw_info(self):
       info_x = 2
@@ -126,30 +283,24 @@ class Game(GameBase):
                         pass
         except Exception:
             pass
-        for o in list(self.obstacles):
-            ox = int(o['x'])
-            oy = int(o['y'])
-            h = int(o.get('h', 1))
-            for yy in range(h):
-                try:
-                    if 0 <= oy + yy <= self.height and 0 <= ox <= self.width:
-                        self.stdscr.addch(oy + yy, ox, obs_ch, ptk.color_pair(ptk.COLOR_RED) | ptk.A_BOLD)
-                except Exception:
-                    pass
-
-        # draw spawned discs (collectibles)
         try:
             disc_ch = glyph('CIRCLE_FILLED', 'O')
         except Exception:
             disc_ch = 'o'
-        for d in list(self.spawned_discs):
-            dx = int(d['x'])
-            dy = int(d['y'])
-            try:
-                if 0 <= dy <= self.height and 0 <= dx <= self.width:
-                    self.stdscr.addch(dy, dx, disc_ch, ptk.color_pair(ptk.COLOR_CYAN) | ptk.A_BOLD)
-            except Exception:
-                pass
+        obs_attr = ptk.color_pair(ptk.COLOR_RED) | ptk.A_BOLD
+        disc_attr = ptk.color_pair(ptk.COLOR_CYAN) | ptk.A_BOLD
+        for x, blocks, discs in self.field.columns():
+            # draw obstacles, then spawned discs (collectibles)
+            for mask, ch, attr in ((blocks, obs_ch, obs_attr), (discs, disc_ch, disc_attr)):
+                y = 0
+                while mask:
+                    if mask & 1 and y <= self.height:
+                        try:
+                            self.stdscr.addch(y, x, ch, attr)
+                        except Exception:
+                            pass
+                    mask >>= 1
+                    y += 1
 
         try:
             if getattr(self, 'disc_active', False):
@@ -209,40 +360,34 @@ class Game(GameBase):
         except Exception:
             pass
 
-        # spawn obstacles probabilistically; spawn_rate scales with level
+        # next obstacle column from the pre-generated stream; its spawn
+        # chance scales with level
         level = int(self.scores.get('level', 1))
-        # slightly higher spawn chance per tick with level
-        chance = min(0.5, self.spawn_rate + (level - 1) * 0.03)
-        if random.random() < chance:
-            # obstacle vertical placement within play area (avoid title area)
-            oy = random.randint(1, max(1, self.height - 2))
-            h = random.choice([1, 2]) if level >= 2 else 1
+        obstacle = self.stream.next()
+        if obstacle is not None:
+            oy, h = obstacle
             # spawn a few columns in from the right edge so blocks appear "in-screen"
             ox = max(0, self.width - self.finish_line)
-            self.obstacles.append({'x': ox, 'y': oy, 'h': h, 'passed': False})
+            self.field.add_obstacle(ox, oy, h)
 
         # spawn collectible discs occasionally (with cooldown to avoid clusters)
         if getattr(self, 'disc_spawn_cooldown', 0) <= 0:
             dy = random.randint(1, max(1, self.height - 2))
             dx = max(0, self.width - self.finish_line)
-            self.spawned_discs.append({'x': dx, 'y': dy})
+            self.field.add_disc(dx, dy)
             self.disc_spawn_cooldown = random.randint(500, 10000)
         else:
             self.disc_spawn_cooldown = max(0, int(self.disc_spawn_cooldown) - 1)
-        # move obstacles left
-        for o in list(self.obstacles):
-            o['x'] -= 1
-            # mark passed when they move left of player_x
-            if not o.get('passed') and o['x'] < self.player_x:
-                o['passed'] = True
+        # scroll the field left (obstacles and discs together)
+        self.field.scroll()
+        # score obstacles that are now left of the player, each exactly once:
+        # everything in absolute columns below the watermark has been counted
+        mark = self.field.offset + self.player_x
+        if mark > self.passed_mark:
+            passed = self.field.count_obstacles(self.passed_mark, mark)
+            self.passed_mark = mark
+            for _ in range(passed):
                 self.scores['score'] += 10 * (1 + (level - 1) * 0.5) * max((getattr(self, 'player_x', 1) * 0.03), 1)
-        # remove off-screen
-        self.obstacles = [o for o in self.obstacles if o['x'] >= 0]
-
-        # move spawned discs left and remove off-screen
-        for d in list(self.spawned_discs):
-            d['x'] -= 1
-        self.spawned_discs = [d for d in self.spawned_discs if d['x'] >= 0]
 
         # when obstacles pass the player, count them and increase level
         try:
@@ -256,64 +401,46 @@ class Game(GameBase):
         except Exception:
             pass
 
-        # collision detection: check if any obstacle overlaps player art
+        # collision detection: only the player's column can collide
         try:
-            player_coords = set()
+            rows = 0
             try:
                 if getattr(self, 'disc_active', False):
                     # when disc is active, collisions only at the player's center
-                    player_coords.add((self.player_y, self.player_x))
+                    rows = 1 << self.player_y
                 else:
                     # otherwise collisions include center and cells above/below (vertical slice)
                     for dy in (-1, 0, 1):
                         y = self.player_y + dy
                         # clamp to play area (don't include title rows)
                         y = max(1, min(self.height, y))
-                        player_coords.add((y, self.player_x))
+                        rows |= 1 << y
             except Exception:
-                player_coords = set()
+                rows = 0
             # collect spawned discs if overlapping player
             try:
-                for d in list(self.spawned_discs):
-                    dx = int(d['x'])
-                    dy = int(d['y'])
-                    if (dy, dx) in player_coords:
-                        try:
-                            # increase resource count (`self.discs`) up to a cap
-                            cur = int(getattr(self, 'discs', 0))
-                            cap = 25
-                            if cur < cap:
-                                try:
-                                    self.discs = cur + 1
-                                except Exception:
-                                    pass
-                            # award bonus score
-                            try:
-                                self.scores['score'] += int(getattr(self, 'disc_bonus', 50)) * level * self.player_x * 0.03
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
-                        try:
-                            self.spawned_discs.remove(d)
-                        except Exception:
-                            pass
+                for _ in range(self.field.take_discs(self.player_x, rows)):
+                    # increase resource count (`self.discs`) up to a cap
+                    cur = int(getattr(self, 'discs', 0))
+                    cap = 25
+                    if cur < cap:
+                        self.discs = cur + 1
+                    # award bonus score
+                    try:
+                        self.scores['score'] += int(getattr(self, 'disc_bonus', 50)) * level * self.player_x * 0.03
+                    except Exception:
+                        pass
             except Exception:
                 pass
 
             # obstacle collisions cause game over
-            for o in self.obstacles:
-                ox = int(o['x'])
-                oy = int(o['y'])
-                h = int(o.get('h', 1))
-                for yy in range(h):
-                    if (oy + yy, ox) in player_coords:
-                        self.over = True
-                        try:
-                            self.update_high_scores()
-                        except Exception:
-                            pass
-                        return
+            if self.field.blocked(self.player_x, rows):
+                self.over = True
+                try:
+                    self.update_high_scores()
+                except Exception:
+                    pass
+                return
         except Exception:
             pass
 
@@ -378,7 +505,7 @@ class Game(GameBase):
             pass
         # clear obstacles and reset counters
         try:
-            self.obstacles = []
+            self.field.clear()
             # reset player position to starting X and center Y
             self.player_x = self.start_player_x
             self.player_y = self.start_player_y
@@ -399,9 +526,10 @@ class Game(GameBase):
                 self.disc_active = False
                 self.disc_timer = 0
                 self.disc_spawn_cooldown = self.disc_spawn_cooldown_reset
-                self.spawned_discs = []
             except Exception:
                 pass
+            # regenerate the obstacles ahead for the new level
+            self.reset_stream()
         except Exception:
             pass
 
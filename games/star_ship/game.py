@@ -3,6 +3,7 @@ import os
 import time
 import random
 import sys
+from collections import deque
 
 try:
   this_dir = os.path.dirname(__file__)
@@ -16,6 +17,7 @@ from game_classes.highscores import HighScores
 from game_classes.game_base import GameBase
 from game_classes.menu import Menu
 from game_classes.tools import init_ptk, glyph
+from game_classes.grid import GridIndex
 
 TITLE = [
    "    ______             ______   _     ",
@@ -32,6 +34,47 @@ How long can you survive?"""
 # minimum terminal size required to run this game (cols, rows)
 MIN_COLS = 70
 MIN_ROWS = 20
+# index in the game list (`clia run 2`); kept when new games are added
+MENU_ORDER = 2
+
+class FreeCells:
+    """Set of free board cells with O(1) add, remove and uniform random pick.
+
+    Cells live in a dense list with a cell -> index map; removal swaps the
+    last cell into the freed slot.
+    """
+    def __init__(self, cells=()):
+      self.cells = []
+      self.pos = {}
+      for c in cells:
+        self.add(c)
+
+    def __len__(self):
+      return len(self.cells)
+
+    def __contains__(self, cell):
+      return cell in self.pos
+
+    def add(self, cell):
+      if cell not in self.pos:
+        self.pos[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell):
+      i = self.pos.pop(cell, None)
+      if i is None:
+        return False
+      last = self.cells.pop()
+      if i < len(self.cells):
+        self.cells[i] = last
+        self.pos[last] = i
+      return True
+
+    def choice(self):
+      """Return a uniformly random free cell, or None when the board is full."""
+      if not self.cells:
+        return None
+      return self.cells[random.randrange(len(self.cells))]
 
 class Game(GameBase):
     def __init__(self, stdscr, player_name='Player'):
@@ -43,6 +86,17 @@ class Game(GameBase):
       })
       super().__init__(stdscr, player_name, 0.12, ptk.COLOR_GREEN)
       self.init_scores([['score', 0], ['stars', 0], ['length', 0]])
+      self.init_state()
+
+    def init_state(self):
+      """Set up the ship, stars and render state for a new game."""
+      # incremental rendering: cells changed since the last frame, the info
+      # rows currently on screen, and triggers for a full repaint
+      self._dirty = set()
+      self._info = {}
+      self._full_redraw = True
+      self._screen_size = None
+      self._was_paused = False
 
       # game state
       self.special = None
@@ -51,83 +105,175 @@ class Game(GameBase):
       self.dir = (0, 1)
       # track the direction that was used for the last completed step
       self._dir_at_last_step = self.dir
-      self.stars = []
+      # stars and ship cells are grid indexes so lookups are O(1) at any
+      # length and regions can be queried; the ship body is a deque (head
+      # at index 0) mirrored by `ship_cells`
+      self.stars = GridIndex()
       cy = self.height // 2
       cx = self.width // 2
-      self.ship = [(cy, cx - i) for i in range(3)]
+      self.ship = deque((cy, cx - i) for i in range(3))
+      self.ship_cells = GridIndex(self.ship)
+      self.free = self.new_free_cells()
       self.dir = (0, 1)
       self.place_star(count=1)
 
+    def new_free_cells(self):
+      """Index of every cell not taken by the ship, a star or the special."""
+      return FreeCells(
+        (y, x) for y in range(self.height) for x in range(self.width) if (y, x) not in self.ship_cells
+      )
+
+    def special_lifetime(self):
+      """Seconds a special star stays on the board."""
+      # Lifetime scales with terminal size (width + height).
+      # Use 0.035s per column/row, clamped to a sensible range. 
+      size = getattr(self, 'width', 0) + getattr(self, 'height', 0)
+      return size * 0.035 # HIGHER = EASIER
+
     def place_star(self, count=1):
       """Place `count` yellow stars in free locations."""
-      attempts = 0
-      placed = 0
-      while placed < count and attempts < 5000:
-        y = random.randint(0, max(0, self.height - 1))
-        x = random.randint(0, max(0, self.width - 1))
-        coord = (y, x)
-        # avoid ship, existing stars, and special
-        if coord in self.ship or coord in self.stars or (self.special is not None and coord == self.special):
-          attempts += 1
-          continue
-        self.stars.append(coord)
-        self.scores['stars'] = len(self.stars)
-        placed += 1
-        attempts += 1
-      return
+      for _ in range(count):
+        coord = self.free.choice()
+        if coord is None:
+          break
+        self.free.remove(coord)
+        self.stars.add(coord)
+        self._dirty.add(coord)
+      self.scores['stars'] = len(self.stars)
 
     def place_special(self):
       """Place a single magenta special star and set its expiry."""
-      attempts = 0
-      while attempts < 2000:
-        y = random.randint(0, max(0, self.height - 1))
-        x = random.randint(0, max(0, self.width - 1))
-        coord = (y, x)
-        if coord in self.ship or coord in self.stars or (self.special is not None and coord == self.special):
-          attempts += 1
-          continue
+      coord = self.free.choice()
+      if coord is not None:
+        self.free.remove(coord)
         self.special = coord
-        # Lifetime scales with terminal size (width + height).
-        # Use 0.035s per column/row, clamped to a sensible range. 
-        size = getattr(self, 'width', 0) + getattr(self, 'height', 0)
-        lifetime = size * 0.035 # HIGHER = EASIER
-        self.special_expire = time.time() + lifetime
+        self._dirty.add(coord)
+        self.special_expire = time.time() + self.special_lifetime()
         return
-      # failed to place
+      # board is full
       self.special = None
       self.special_expire = None
       return
 
+    def expire_special(self, now):
+      """Remove the special star (freeing its cell) and schedule the next one."""
+      if self.special is not None:
+        self.free.add(self.special)
+        self._dirty.add(self.special)
+      self.special = None
+      self.special_expire = None
+      self.next_special_at = now + random.uniform(8, 18)
+
+    def info_lines(self):
+      """Title and info panel as {row: (x, text, attr)}; drawn under the play field."""
+      lines = {}
+      for i, line in enumerate(self.title):
+        lines[i] = (0, line, ptk.color_pair(self.color) | ptk.A_BOLD)
+      info_x = 2
+      info_y = len(self.title)
+
+      # high scores below title
+      new_score = ' ***NEW High Score!' if self.new_highs.get('score', False) else ''
+      lines[info_y + 0] = (info_x, f'High Score: {int(self.high_scores["score"]["value"]):,} ({self.high_scores["score"]["player"]}){new_score}', ptk.color_pair(ptk.COLOR_GREEN))
+      new_ship_length = ' ***NEW Longest Ship!' if self.new_highs.get('length', False) else ''
+      lines[info_y + 1] = (info_x, f'Longest Ship: {int(self.high_scores["length"]["value"]):,} ({self.high_scores["length"]["player"]}){new_ship_length}', ptk.color_pair(ptk.COLOR_BLUE))
+      new_stars = ' ***NEW Most Stars!' if self.new_highs.get('stars', False) else ''
+      lines[info_y + 2] = (info_x, f'Most Stars: {int(self.high_scores["stars"]["value"]):,} ({self.high_scores["stars"]["player"]}){new_stars}', ptk.color_pair(ptk.COLOR_BLUE))
+
+      # game info below title
+      lines[info_y + 4] = (info_x, f'Player: {self.player_name}', 0)
+      lines[info_y + 5] = (info_x, f'Score: {int(self.scores["score"]):,}', ptk.color_pair(ptk.COLOR_GREEN))
+      lines[info_y + 6] = (info_x, f'Ship Length: {int(self.scores["length"]):,}', ptk.color_pair(ptk.COLOR_BLUE))
+      lines[info_y + 7] = (info_x, f'Stars: {int(self.scores["stars"]):,}', ptk.color_pair(ptk.COLOR_BLUE))
+
+      lines[info_y + 9] = (info_x, '↑ | w     : Up', 0)
+      lines[info_y + 10] = (info_x, '← | a     : Left', 0)
+      lines[info_y + 11] = (info_x, '↓ | s     : Down', 0)
+      lines[info_y + 12] = (info_x, '→ | d     : Right', 0)
+      lines[info_y + 13] = (info_x, 'Backspace : Pause', 0)
+      lines[info_y + 14] = (info_x, 'ESC       : Quit', 0)
+      return lines
+
     def draw_info(self):
+      """Draw title/info rows that changed since the last frame.
+
+      Ship and star cells overlapping a redrawn row are marked dirty so
+      they are painted back on top of the text.
+      """
+      try:
+        lines = self.info_lines()
+      except Exception:
+        return
+      old = self._info
+      for y in set(lines) | set(old):
+        cur = lines.get(y)
+        prev = old.get(y)
+        if cur == prev:
+          continue
+        x, text, attr = cur if cur is not None else (prev[0], '', 0)
+        width = len(text)
+        if prev is not None and prev[0] == x:
+          width = max(width, len(prev[1]))
+        try:
+          self.stdscr.addstr(y, x, text.ljust(width), attr)
+        except Exception:
+          pass
+        if 0 <= y < self.height:
+          for cx in range(x, min(x + width, self.width)):
+            if (y, cx) in self.ship_cells or (y, cx) in self.stars or (y, cx) == self.special:
+              self._dirty.add((y, cx))
+      self._info = lines
+
+    def draw_cell(self, y, x):
+      """Paint one play-field cell from the current game state."""
+      cell = (y, x)
+      if cell in self.ship_cells:
+        if cell == self.ship[0]:
+          ch, attr = glyph('CIRCLE_FILLED'), ptk.color_pair(ptk.COLOR_GREEN) | ptk.A_BOLD
+        else:
+          ch, attr = glyph('CIRCLE_FILLED'), ptk.color_pair(ptk.COLOR_BLUE)
+      elif cell in self.stars:
+        ch, attr = '*', ptk.color_pair(ptk.COLOR_YELLOW) | ptk.A_BOLD
+      elif cell == self.special:
+        ch, attr = glyph('CIRCLE_FILLED'), ptk.color_pair(ptk.COLOR_MAGENTA) | ptk.A_BOLD
+      else:
+        # empty: show whatever title/info text lies underneath
+        ch, attr = ' ', 0
+        line = self._info.get(y)
+        if line is not None and 0 <= x - line[0] < len(line[1]):
+          ch, attr = line[1][x - line[0]], line[2]
       try:
-        info_x = 2
-        info_y = len(self.title)
-
-        # draw high scores below title
-        new_score = ' ***NEW High Score!' if self.new_highs.get('score', False) else ''
-        self.stdscr.addstr(info_y + 0, info_x, f'High Score: {int(self.high_scores["score"]["value"]):,} ({self.high_scores["score"]["player"]}){new_score}', ptk.color_pair(ptk.COLOR_GREEN))
-        new_ship_length = ' ***NEW Longest Ship!' if self.new_highs.get('length', False) else ''
-        self.stdscr.addstr(info_y + 1, info_x, f'Longest Ship: {int(self.high_scores["length"]["value"]):,} ({self.high_scores["length"]["player"]}){new_ship_length}', ptk.color_pair(ptk.COLOR_BLUE))
-        new_stars = ' ***NEW Most Stars!' if self.new_highs.get('stars', False) else ''
-        self.stdscr.addstr(info_y + 2, info_x, f'Most Stars: {int(self.high_scores["stars"]["value"]):,} ({self.high_scores["stars"]["player"]}){new_stars}', ptk.color_pair(ptk.COLOR_BLUE))
-
-        # draw game info below title
-        self.stdscr.addstr(info_y + 4, info_x, f'Player: {self.player_name}')
-        self.stdscr.addstr(info_y + 5, info_x, f'Score: {int(self.scores["score"]):,}', ptk.color_pair(ptk.COLOR_GREEN))
-        self.stdscr.addstr(info_y + 6, info_x, f'Ship Length: {int(self.scores["length"]):,}', ptk.color_pair(ptk.COLOR_BLUE))
-        self.stdscr.addstr(info_y + 7, info_x, f'Stars: {int(self.scores["stars"]):,}', ptk.color_pair(ptk.COLOR_BLUE))
-
-        self.stdscr.addstr(info_y + 9 , info_x, '↑ | w     : Up')
-        self.stdscr.addstr(info_y + 10, info_x, '← | a     : Left')
-        self.stdscr.addstr(info_y + 11, info_x, '↓ | s     : Down')
-        self.stdscr.addstr(info_y + 12, info_x, '→ | d     : Right')
-        self.stdscr.addstr(info_y + 13, info_x, 'Backspace : Pause')
-        self.stdscr.addstr(info_y + 14, info_x, 'ESC       : Quit')
+        self.stdscr.addch(y, x, ch, attr)
       except Exception:
         pass
 
+    def pre_draw(self):
+      # repaint everything on the first frame, after a resize or when the
+      # PAUSED overlay goes away; otherwise keep the previous frame
+      try:
+        size = self.stdscr.getmaxyx()
+      except Exception:
+        size = None
+      if size != self._screen_size or (self._was_paused and not self.paused):
+        self._full_redraw = True
+      self._screen_size = size
+      self._was_paused = self.paused
+      if self._full_redraw:
+        super().pre_draw()
+
     def draw(self):
+      if not self._full_redraw:
+        # incremental frame: changed info rows plus cells touched by step()
+        self.draw_info()
+        for y, x in self._dirty:
+          self.draw_cell(y, x)
+        self._dirty.clear()
+        return
+      self._full_redraw = False
+      self._dirty.clear()
+      self._info = {}
       self.draw_info()
+      self._dirty.clear()
       # draw a green floor and a right wall (similar to Byte Bouncer)
       try:
         block = glyph('BLOCK')
@@ -184,9 +330,7 @@ class Game(GameBase):
       # ensure special expires even if paused
       try:
         if getattr(self, 'special', None) is not None and getattr(self, 'special_expire', None) is not None and now >= self.special_expire:
-          self.special = None
-          self.special_expire = None
-          self.next_special_at = now + random.uniform(8, 18)
+          self.expire_special(now)
       except Exception:
         pass
 
@@ -201,11 +345,16 @@ class Game(GameBase):
         self.over = True
         return
       # self-collision
-      if (nh, nx) in self.ship:
+      if (nh, nx) in self.ship_cells:
         self.over = True
         return
       # move head
-      self.ship.insert(0, (nh, nx))
+      self.ship.appendleft((nh, nx))
+      self.ship_cells.add((nh, nx))
+      self.free.remove((nh, nx))
+      # old head is recolored as body, new head painted
+      self._dirty.add((hy, hx))
+      self._dirty.add((nh, nx))
       # remember the direction actually used for this step so input
       # handling can forbid immediate 180-degree reversals relative
       # to the last moved direction.
@@ -215,10 +364,7 @@ class Game(GameBase):
         pass
       # eating: normal yellow stars
       if (nh, nx) in self.stars:
-        try:
-          self.stars.remove((nh, nx))
-        except Exception:
-          pass
+        self.stars.discard((nh, nx))
         self.scores['score'] = int(self.scores['score']) + 10
         # maintain star by placing one new yellow
         self.place_star(count=1)
@@ -236,15 +382,16 @@ class Game(GameBase):
       else:
         # normal move: remove tail
         try:
-          self.ship.pop()
+          tail = self.ship.pop()
+          self.ship_cells.discard(tail)
+          self.free.add(tail)
+          self._dirty.add(tail)
         except Exception:
           pass
         # if special expired, clear it and schedule next
         now = time.time()
         if self.special is not None and self.special_expire is not None and now >= self.special_expire:
-          self.special = None
-          self.special_expire = None
-          self.next_special_at = now + random.uniform(8, 18)
+          self.expire_special(now)
       self.scores['length'] = len(self.ship)
 
     def movement(self, ch):
@@ -0,0 +1 @@
+"""star_ship_expanse game package"""
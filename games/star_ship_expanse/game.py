@@ -0,0 +1,246 @@
+from game_classes import ptk
+import os
+import random
+import sys
+
+try:
+  this_dir = os.path.dirname(__file__)
+  project_root = os.path.abspath(os.path.join(this_dir, '..', '..'))
+  if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+except Exception:
+  project_root = None
+
+from game_classes.highscores import HighScores
+from game_classes.game_base import GameBase
+from game_classes.menu import Menu
+from game_classes.tools import init_ptk, glyph
+from games.star_ship.game import Game as StarShipGame, TITLE
+
+DESCRIPTION = """Star Ship in a world many screens wide!
+The camera follows your ship across an expanse full of stars; the minimap in the corner shows where the stars are and where you are.
+Mind the edges of the world and your own tail."""
+
+# minimum terminal size required to run this game (cols, rows)
+MIN_COLS = 70
+MIN_ROWS = 20
+# index in the game list (`clia run 4`); kept when new games are added
+MENU_ORDER = 4
+
+# world size in screens (each axis)
+WORLD_SCALE = 8
+# one star per this many world cells
+STAR_DENSITY = 120
+
+class SparseFree:
+    """Stand-in for `FreeCells` on a mostly empty world.
+
+    Indexing every free cell of a world this size would cost far more
+    than it saves: nearly every random cell is free, so `choice` simply
+    samples until it hits one and add/remove have nothing to track.
+    """
+    def __init__(self, game, tries=64):
+      self.game = game
+      self.tries = tries
+
+    def add(self, cell):
+      pass
+
+    def remove(self, cell):
+      return True
+
+    def choice(self):
+      g = self.game
+      for _ in range(self.tries):
+        cell = (random.randrange(g.height), random.randrange(g.width))
+        if cell not in g.ship_cells and cell not in g.stars and cell != g.special:
+          return cell
+      return None
+
+class Game(StarShipGame):
+    def __init__(self, stdscr, player_name='Player'):
+      self.title = TITLE
+      self.highscores = HighScores('star_ship_expanse', {
+          'score': {'player': 'Player', 'value': 0},
+          'stars': {'player': 'Player', 'value': 1},
+          'length': {'player': 'Player', 'value': 3},
+      })
+      GameBase.__init__(self, stdscr, player_name, 0.12, ptk.COLOR_GREEN)
+      self.init_scores([['score', 0], ['stars', 0], ['length', 0]])
+      # the terminal is only the viewport; width/height become the world
+      self.view_w = self.width
+      self.view_h = self.height
+      self.width = self.view_w * WORLD_SCALE
+      self.height = self.view_h * WORLD_SCALE
+      self._minimap = None
+      self._minimap_key = None
+      self.init_state()
+      self.place_star(count=max(1, (self.width * self.height) // STAR_DENSITY - len(self.stars)))
+
+    def new_free_cells(self):
+      return SparseFree(self)
+
+    def special_lifetime(self):
+      # scale with the screen, not the world: the special must be reachable
+      return (self.view_w + self.view_h) * 0.035
+
+    def camera(self):
+      """Top-left world cell of the viewport, centered on the head and clamped to the world."""
+      hy, hx = self.ship[0] if self.ship else (self.height // 2, self.width // 2)
+      cam_y = max(0, min(self.height - self.view_h, hy - self.view_h // 2))
+      cam_x = max(0, min(self.width - self.view_w, hx - self.view_w // 2))
+      return cam_y, cam_x
+
+    def info_lines(self):
+      lines = super().info_lines()
+      hy, hx = self.ship[0] if self.ship else (0, 0)
+      lines[len(self.title) + 8] = (2, f'Position: {hx:,}, {hy:,} of {self.width:,} x {self.height:,}', ptk.color_pair(ptk.COLOR_BLUE))
+      return lines
+
+    def minimap_size(self):
+      return max(4, min(24, self.view_w // 4)), max(3, min(8, self.view_h // 3))
+
+    def minimap_counts(self):
+      """Star count per minimap cell, rebuilt only after the stars change.
+
+      Built from grid bucket sizes, so it costs one pass over non-empty
+      buckets rather than one over the stars (or the world).
+      """
+      mm_w, mm_h = self.minimap_size()
+      key = (self.stars.version, mm_w, mm_h)
+      if key == self._minimap_key:
+        return self._minimap
+      counts = [[0] * mm_w for _ in range(mm_h)]
+      s = self.stars.bucket
+      for (cy, cx), bucket in self.stars.buckets.items():
+        my = min(mm_h - 1, (cy * s) * mm_h // self.height)
+        mx = min(mm_w - 1, (cx * s) * mm_w // self.width)
+        counts[my][mx] += len(bucket)
+      self._minimap = counts
+      self._minimap_key = key
+      return counts
+
+    def draw_minimap(self, cam_y, cam_x):
+      """Framed overview of the world in the top-right corner of the viewport."""
+      mm_w, mm_h = self.minimap_size()
+      counts = self.minimap_counts()
+      # a minimap cell is "dense" above twice the average star count
+      dense = 2 * len(self.stars) / float(mm_w * mm_h) if self.stars else 1
+      x0 = self.view_w - mm_w - 2
+      frame = ptk.color_pair(ptk.COLOR_BLUE)
+      try:
+        self.stdscr.addstr(0, x0, '+' + '-' * mm_w + '+', frame)
+        self.stdscr.addstr(mm_h + 1, x0, '+' + '-' * mm_w + '+', frame)
+      except Exception:
+        pass
+      # viewport and head in minimap cells
+      vy0 = cam_y * mm_h // self.height
+      vy1 = (cam_y + self.view_h - 1) * mm_h // self.height
+      vx0 = cam_x * mm_w // self.width
+      vx1 = (cam_x + self.view_w - 1) * mm_w // self.width
+      hy, hx = self.ship[0] if self.ship else (-1, -1)
+      head = (hy * mm_h // self.height, hx * mm_w // self.width)
+      for my in range(mm_h):
+        try:
+          self.stdscr.addch(my + 1, x0, '|', frame)
+          self.stdscr.addch(my + 1, x0 + mm_w + 1, '|', frame)
+        except Exception:
+          pass
+        row = counts[my]
+        for mx in range(mm_w):
+          n = row[mx]
+          ch = ':' if n > dense else ('.' if n else ' ')
+          attr = ptk.color_pair(ptk.COLOR_YELLOW)
+          if (my, mx) == head:
+            ch, attr = '@', ptk.color_pair(ptk.COLOR_GREEN) | ptk.A_BOLD
+          elif vy0 <= my <= vy1 and vx0 <= mx <= vx1:
+            attr |= ptk.A_REVERSE
+          try:
+            self.stdscr.addch(my + 1, x0 + 1 + mx, ch, attr)
+          except Exception:
+            pass
+
+    def pre_draw(self):
+      # the camera moves every step, so every frame is a full repaint
+      GameBase.pre_draw(self)
+
+    def draw(self):
+      self._info = {}
+      self.draw_info()
+      self._dirty.clear()
+      cam_y, cam_x = self.camera()
+      vh, vw = self.view_h, self.view_w
+      try:
+        block = glyph('BLOCK')
+      except Exception:
+        block = '#'
+      # viewport frame; red where it is also the edge of the world
+      floor_attr = ptk.color_pair(ptk.COLOR_RED if cam_y + vh >= self.height else ptk.COLOR_BLUE)
+      wall_attr = ptk.color_pair(ptk.COLOR_RED if cam_x + vw >= self.width else ptk.COLOR_BLUE)
+      for fx in range(0, vw + 1):
+        try:
+          self.stdscr.addch(vh, fx, block, floor_attr)
+        except Exception:
+          pass
+      for wy in range(0, vh + 1):
+        try:
+          self.stdscr.addch(wy, vw + 1, block, wall_attr)
+        except Exception:
+          pass
+      # stars and ship: only the grid buckets under the viewport are visited
+      star_attr = ptk.color_pair(ptk.COLOR_YELLOW) | ptk.A_BOLD
+      for fy, fx in self.stars.query(cam_y, cam_x, cam_y + vh, cam_x + vw):
+        try:
+          self.stdscr.addch(fy - cam_y, fx - cam_x, '*', star_attr)
+        except Exception:
+          pass
+      if self.special is not None:
+        sy, sx = self.special
+        if cam_y <= sy < cam_y + vh and cam_x <= sx < cam_x + vw:
+          try:
+            self.stdscr.addch(sy - cam_y, sx - cam_x, glyph('CIRCLE_FILLED'), ptk.color_pair(ptk.COLOR_MAGENTA) | ptk.A_BOLD)
+          except Exception:
+            pass
+      body = ptk.color_pair(ptk.COLOR_BLUE)
+      for sy, sx in self.ship_cells.query(cam_y, cam_x, cam_y + vh, cam_x + vw):
+        try:
+          self.stdscr.addch(sy - cam_y, sx - cam_x, glyph('CIRCLE_FILLED'), body)
+        except Exception:
+          pass
+      if self.ship:
+        hy, hx = self.ship[0]
+        if cam_y <= hy < cam_y + vh and cam_x <= hx < cam_x + vw:
+          try:
+            self.stdscr.addch(hy - cam_y, hx - cam_x, glyph('CIRCLE_FILLED'), ptk.color_pair(ptk.COLOR_GREEN) | ptk.A_BOLD)
+          except Exception:
+            pass
+      self.draw_minimap(cam_y, cam_x)
+
+    def draw_game_status(self, msg):
+      # center on the viewport rather than the world
+      try:
+        py = max(0, self.view_h // 2)
+        px = max(0, (self.view_w - len(msg)) // 2)
+        self.stdscr.addstr(py, px, msg, ptk.color_pair(ptk.COLOR_RED) | ptk.A_BOLD)
+      except Exception:
+        pass
+
+def main(stdscr):
+  init_ptk(stdscr)
+  while True:
+    game = Game(stdscr)
+    menu = Menu(game)
+    start = menu.display()
+    if not start:
+      break
+    game.update_player_name(start)
+    game.run()
+
+if __name__ == '__main__':
+    try:
+        ptk.wrapper(main)
+    except KeyboardInterrupt:
+        try:
+            ptk.endwin()
+        except Exception:
+            pass
@@ -17,6 +17,7 @@ from game_classes.highscores import HighScores
 from game_classes.game_base import GameBase
 from game_classes.menu import Menu
 from game_classes.tools import init_ptk, is_enter_key
+from game_classes.bot import Policy
 
 TITLE = [
      '___________                  .__              .__    ___________           ___.   .__          ',
@@ -34,6 +35,8 @@ Don't let the pieces stack up to the top!"""
 # minimum terminal size required to run this game (cols, rows)
 MIN_COLS = 100
 MIN_ROWS = 30
+# index in the game list (`clia run 3`); kept when new games are added
+MENU_ORDER = 3
 
 SHAPES = {
   'I': [[(0,1),(1,1),(2,1),(3,1)], [(2,0),(2,1),(2,2),(2,3)]],
@@ -55,14 +58,129 @@ COLORS = {
   'L': ptk.COLOR_YELLOW,
 }
 
+# spawn column of a new piece (one right of center for the left wall)
+SPAWN_X = 9
+
+# per shape and rotation: one bitmask per block row (bit n = column n
+# of the piece) and the leftmost/rightmost block column
+ROW_MASKS = {
+  shape: [
+    (tuple(sum(1 << bx for bx, by in blocks if by == row) for row in range(4)),
+     min(bx for bx, _ in blocks), max(bx for bx, _ in blocks))
+    for blocks in rots
+  ]
+  for shape, rots in SHAPES.items()
+}
+
+# per shape and rotation: (top, bottom) block row of each block column
+# lo..hi; every tetromino column is one contiguous run of blocks
+SPANS = {
+  shape: [tuple((min(by for bx, by in blocks if bx == c), max(by for bx, by in blocks if bx == c))
+                for c in range(ROW_MASKS[shape][r][1], ROW_MASKS[shape][r][2] + 1))
+          for r, blocks in enumerate(rots)]
+  for shape, rots in SHAPES.items()
+}
+
+def shift(mask, x):
+  """Move a piece row mask to column `x`; x may be negative when the
+  piece's leftmost columns are empty."""
+  return mask << x if x >= 0 else mask >> -x
+
+class Board:
+  """Well stored as one int bitmask per row (bit x = column x).
+
+  Collision, placement and line clears are bitwise operations on the
+  row masks. `colors` is a parallel plane of shape letters (' ' empty,
+  'W' wall) that is only read for rendering. Column 0 is a permanent
+  wall. `tops` caches the topmost filled row of every column (height
+  when empty; the wall column is ignored), so landing rows need no
+  stepping. `dirty` collects the rows changed since the renderer last
+  cleared it.
+  """
+  def __init__(self, width, height):
+    self.width = width
+    self.height = height
+    self.full = (1 << width) - 1
+    self.rows = [1] * height
+    self.colors = [self.empty_row() for _ in range(height)]
+    self.tops = [height] * width
+    self.dirty = set(range(height))
+
+  def empty_row(self):
+    row = [' '] * self.width
+    row[0] = 'W'
+    return row
+
+  def __len__(self):
+    return self.height
+
+  def fits(self, masks, lo, hi, x, y):
+    """True if a piece with row `masks` (block columns lo..hi) fits at x, y."""
+    if x + lo < 0 or x + hi >= self.width:
+      return False
+    rows = self.rows
+    for i, m in enumerate(masks):
+      if m:
+        r = y + i
+        if r < 0 or r >= self.height or rows[r] & shift(m, x):
+          return False
+    return True
+
+  def landing(self, shape, rot, x, y):
+    """Row a piece at x, y comes to rest on when dropped straight down.
+
+    A max over the piece's columns of the cached surface; falls back to
+    stepping only when the piece is already under an overhang.
+    """
+    masks, lo, hi = ROW_MASKS[shape][rot]
+    tops = self.tops
+    land = min(tops[x + lo + c] - bottom - 1 for c, (_, bottom) in enumerate(SPANS[shape][rot]))
+    if land < y:
+      land = y
+      while self.fits(masks, lo, hi, x, land + 1):
+        land += 1
+    return land
+
+  def place(self, masks, x, y, shape):
+    """OR a piece into the rows and paint its cells in the color plane."""
+    for i, m in enumerate(masks):
+      r = y + i
+      if m and 0 <= r < self.height:
+        self.rows[r] |= shift(m, x) & self.full
+        self.dirty.add(r)
+        color = self.colors[r]
+        bx = 0
+        while m:
+          if m & 1 and 0 <= x + bx < self.width:
+            color[x + bx] = shape
+            if r < self.tops[x + bx] and x + bx:
+              self.tops[x + bx] = r
+          m >>= 1
+          bx += 1
+
+  def clear_lines(self):
+    """Drop full rows (wall preserved); returns the number cleared."""
+    full = self.full
+    keep = [i for i, r in enumerate(self.rows) if r != full]
+    cleared = self.height - len(keep)
+    if cleared:
+      # every row down to the lowest cleared one moves
+      lowest = max(i for i, r in enumerate(self.rows) if r == full)
+      self.dirty.update(range(lowest + 1))
+      self.rows = [1] * cleared + [self.rows[i] for i in keep]
+      self.colors = [self.empty_row() for _ in range(cleared)] + [self.colors[i] for i in keep]
+      self.tops = scan(self.rows, self.width, self.height)[0]
+    return cleared
+
 class Piece:
   def __init__(self, shape):
     self.shape = shape
     self.rots = SHAPES[shape]
+    self.masks = ROW_MASKS[shape]
     self.rot = 0
     self.blocks = self.rots[self.rot]
     # shift spawn one column right to account for permanent left wall
-    self.x = 9
+    self.x = SPAWN_X
     self.y = 0
 
   def rotate(self, board):
@@ -74,14 +192,8 @@ class Piece:
       self.blocks = self.rots[self.rot]
 
   def collides(self, board, dx=0, dy=0):
-    for bx, by in self.blocks:
-      x = self.x + bx + dx
-      y = self.y + by + dy
-      if x < 0 or x >= len(board[0]) or y < 0 or y >= len(board):
-        return True
-      if board[y][x] != ' ':
-        return True
-    return False
+    masks, lo, hi = self.masks[self.rot]
+    return not board.fits(masks, lo, hi, self.x + dx, self.y + dy)
 
   def move(self, dx, dy, board):
     if not self.collides(board, dx, dy):
@@ -90,6 +202,218 @@ class Piece:
       return True
     return False
 
+# placement search: weights for aggregate height, cleared lines, holes
+# and bumpiness (the usual hand-tuned line-clearing heuristic)
+AI_WEIGHTS = (-0.510066, 0.760666, -0.35663, -0.184483)
+
+try:
+  _popcount = int.bit_count
+except AttributeError:
+  def _popcount(v):
+    return bin(v).count('1')
+
+def scan(rows, width, height):
+  """Column surface and hole count of a board.
+
+  Returns `(tops, holes)`: `tops[c]` is the topmost filled row of column
+  c (height if empty; the wall column is ignored) and `holes` counts
+  empty cells with a filled cell above them.
+  """
+  play = ((1 << width) - 1) & ~1
+  tops = [height] * width
+  seen = 0
+  holes = 0
+  for r in range(height):
+    row = rows[r] & play
+    if not row and not seen:
+      continue
+    new = row & ~seen
+    while new:
+      low = new & -new
+      tops[low.bit_length() - 1] = r
+      new ^= low
+    holes += _popcount(seen & ~row)
+    seen |= row
+  return tops, holes
+
+def surface_stats(tops, height):
+  """(aggregate height, bumpiness) of a column surface."""
+  heights = [height - t for t in tops[1:]]
+  return sum(heights), sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+
+def score(tops, holes, lines, height, weights=AI_WEIGHTS):
+  """Heuristic value of a board from its surface (higher is better)."""
+  agg, bump = surface_stats(tops, height)
+  w_height, w_lines, w_holes, w_bump = weights
+  return w_height * agg + w_lines * lines + w_holes * holes + w_bump * bump
+
+def evaluate(rows, width, height, lines, weights=AI_WEIGHTS):
+  """Heuristic value of a board (higher is better)."""
+  tops, holes = scan(rows, width, height)
+  return score(tops, holes, lines, height, weights)
+
+def placements(rows, tops, width, height, shape, rot, x, y):
+  """Yield every (rot, x, landing y) the piece can reach and drop to.
+
+  A placement is reachable if the piece can rotate in place, slide along
+  its current row and then drop straight down. The landing row comes from
+  the column surface `tops`, not from stepping the piece down.
+  """
+  full = (1 << width) - 1
+  variants = ROW_MASKS[shape]
+  n = len(variants)
+
+  def fits(masks, lo, hi, px, py):
+    if px + lo < 0 or px + hi >= width:
+      return False
+    for i, m in enumerate(masks):
+      if m:
+        r = py + i
+        if r < 0 or r >= height or rows[r] & shift(m, px) & full:
+          return False
+    return True
+
+  for turns in range(n):
+    r = (rot + turns) % n
+    # every rotation on the way must fit too
+    if turns and not fits(*variants[r], x, y):
+      break
+    masks, lo, hi = variants[r]
+    spans = SPANS[shape][r]
+    for step in (-1, 1):
+      px = x if step < 0 else x + 1
+      while fits(masks, lo, hi, px, y):
+        land = min(tops[px + lo + c] - bottom - 1 for c, (_, bottom) in enumerate(spans))
+        if land < y:
+          # something overhangs the piece already: step it down instead
+          land = y
+          while fits(masks, lo, hi, px, land + 1):
+            land += 1
+        yield r, px, land
+        px += step
+
+def drop(rows, width, height, shape, rot, x, y):
+  """Place a piece and clear lines; returns (new rows, lines cleared)."""
+  full = (1 << width) - 1
+  new = list(rows)
+  for i, m in enumerate(ROW_MASKS[shape][rot][0]):
+    if m:
+      new[y + i] |= shift(m, x)
+  cleared = [r for r in range(y, min(y + 4, height)) if new[r] == full]
+  for r in reversed(cleared):
+    del new[r]
+  if cleared:
+    new[0:0] = [1] * len(cleared)
+  return new, len(cleared)
+
+def drop_surface(rows, tops, holes, width, shape, rot, x, y):
+  """Surface and holes after dropping a piece, without touching the rows.
+
+  Valid when the piece lands on the surface and clears no line: the
+  piece columns get new tops, and the gaps left under it become holes.
+  Returns None otherwise so the caller can fall back to `drop`.
+  """
+  full = (1 << width) - 1
+  for i, m in enumerate(ROW_MASKS[shape][rot][0]):
+    if m and (rows[y + i] | shift(m, x)) == full:
+      return None
+  lo = ROW_MASKS[shape][rot][1]
+  tops = list(tops)
+  for c, (top, bottom) in enumerate(SPANS[shape][rot]):
+    col = x + lo + c
+    gap = tops[col] - (y + bottom) - 1
+    if gap < 0:
+      return None
+    holes += gap
+    tops[col] = y + top
+  return tops, holes
+
+def drop_value(rows, tops, holes, agg, bump, width, shape, rot, x, y, lines, weights=AI_WEIGHTS):
+  """Value of the board after a drop, from the surface deltas alone.
+
+  `agg` and `bump` are the surface stats of `tops`; the new surface comes
+  from `drop_surface` and only the piece columns and their neighbours
+  are rescored. Returns None when `drop_surface` can't be used (a line
+  clears or the piece sits under an overhang).
+  """
+  after = drop_surface(rows, tops, holes, width, shape, rot, x, y)
+  if after is None:
+    return None
+  new, holes = after
+  a = x + ROW_MASKS[shape][rot][1]
+  b = a + len(SPANS[shape][rot]) - 1
+  for c in range(a, b + 1):
+    agg += tops[c] - new[c]
+  # bumpiness: only the edges touching the piece columns change
+  for e in range(max(1, a - 1), min(width - 1, b + 1)):
+    bump += abs(new[e] - new[e + 1]) - abs(tops[e] - tops[e + 1])
+  w_height, w_lines, w_holes, w_bump = weights
+  return w_height * agg + w_lines * lines + w_holes * holes + w_bump * bump
+
+def best_placement(rows, width, height, shape, rot, x, y, next_shape=None, weights=AI_WEIGHTS):
+  """Best (rot, x, y) for the current piece, looking one piece ahead.
+
+  Every reachable placement of the current piece is combined with every
+  placement of `next_shape` from its spawn position, and the pair is
+  scored on the final board. Second-piece boards are scored from the
+  surface alone unless a line clears. Returns None if the piece cannot
+  be placed.
+  """
+  best = None
+  best_score = None
+  tops, holes = scan(rows, width, height)
+  for r, px, py in placements(rows, tops, width, height, shape, rot, x, y):
+    after = drop_surface(rows, tops, holes, width, shape, r, px, py)
+    rows1, lines1 = drop(rows, width, height, shape, r, px, py)
+    tops1, holes1 = after if after is not None else scan(rows1, width, height)
+    value = None
+    if next_shape is not None:
+      agg1, bump1 = surface_stats(tops1, height)
+      for r2, px2, py2 in placements(rows1, tops1, width, height, next_shape, 0, SPAWN_X, 0):
+        v = drop_value(rows1, tops1, holes1, agg1, bump1, width, next_shape, r2, px2, py2, lines1, weights)
+        if v is None:
+          rows2, lines2 = drop(rows1, width, height, next_shape, r2, px2, py2)
+          v = evaluate(rows2, width, height, lines1 + lines2, weights)
+        if value is None or v > value:
+          value = v
+    if value is None:
+      # no lookahead (or the next piece would not fit): judge this board alone
+      value = score(tops1, holes1, lines1, height, weights) - (0 if next_shape is None else 1000)
+    if best_score is None or value > best_score:
+      best, best_score = (r, px, py), value
+  return best
+
+class PlacementBot(Policy):
+  """Bot that plays the placement found by `best_placement`.
+
+  The search runs once per piece (cached on the board and piece). Keys
+  to rotate and slide are sent together; the hard drop follows on the
+  next tick, once the piece is confirmed in place. Use with
+  `clia run <game> --bot games.terminal_tumble.game:PlacementBot`.
+  """
+
+  def __init__(self):
+    self._key = None
+    self._target = None
+
+  def act(self, view):
+    board = view.board
+    cur = view.current
+    key = (board.rows, cur.shape, view.next.shape)
+    if key != self._key:
+      self._key = key
+      self._target = best_placement(board.rows, board.width, board.height,
+                                    cur.shape, cur.rot, cur.x, cur.y, view.next.shape)
+    if self._target is None:
+      return ord(' ')
+    rot, x, _ = self._target
+    keys = [ptk.KEY_UP] * ((rot - cur.rot) % len(ROW_MASKS[cur.shape]))
+    if keys:
+      return keys
+    if x != cur.x:
+      return [ptk.KEY_LEFT if x < cur.x else ptk.KEY_RIGHT] * abs(x - cur.x)
+    return ord(' ')
+
 class Game(GameBase):
     def __init__(self, stdscr, player_name='Player'):
         self.title = TITLE
@@ -99,19 +423,27 @@ class Game(GameBase):
             'level': {'player': 'Player', 'value': 1},
         })
         super().__init__(stdscr, player_name, 0.5, ptk.COLOR_RED)
-        self.msg_height = self.height - 22
+        self.msg_height = self.height - 23
         self.init_scores([['score', 0], ['lines', 0], ['level', 1]])
 
         # game state
         # board with a permanent left wall in column 0
-        self.board = [[' ' for _ in range(20)] for _ in range(self.height - 6)]
-        for y in range(self.height - 6):
-            self.board[y][0] = 'W'
+        self.board = Board(20, self.height - 6)
         self.current = self.next_piece()
         self.next = self.next_piece()
         self.drop_timer = 0
         self.msg_log = deque(maxlen=self.msg_height)
 
+        # incremental rendering: cells the falling piece covered last
+        # frame, and triggers for a full repaint
+        self._piece_cells = set()
+        # placement hint: toggled with 'h', searched once per piece
+        self.show_hint = False
+        self._hint = (None, None)
+        self._full_redraw = True
+        self._screen_size = None
+        self._was_paused = False
+
     def push_message(self, text, color_const=ptk.COLOR_WHITE):
         try:
             self.msg_log.append((text, color_const))
@@ -128,11 +460,8 @@ class Game(GameBase):
         return Piece(random.choice(list(SHAPES.keys())))
 
     def lock_piece(self):
-        for bx, by in self.current.blocks:
-            x = self.current.x + bx
-            y = self.current.y + by
-            if 0 <= y < self.height - 6 and 0 <= x < len(self.board[0]):
-                self.board[y][x] = self.current.shape
+        masks, _, _ = self.current.masks[self.current.rot]
+        self.board.place(masks, self.current.x, self.current.y, self.current.shape)
         cleared = self.clear_lines()
         self.current = self.next
         self.next = self.next_piece()
@@ -141,17 +470,8 @@ class Game(GameBase):
         return cleared
 
     def clear_lines(self):
-        # preserve left wall when clearing rows
-        new_board = [row for row in self.board if any(c == ' ' for c in row)]
-        cleared = self.height - 6 - len(new_board)
-        for _ in range(cleared):
-            new_row = [' ' for _ in range(len(self.board[0]))]
-            new_row[0] = 'W'
-            new_board.insert(0, new_row)
-        # ensure existing rows keep the wall in column 0
-        for row in new_board:
-            row[0] = 'W'
-        self.board = new_board
+        # full rows compare equal to the all-ones mask; the wall is kept
+        cleared = self.board.clear_lines()
         if cleared:
             # update lines and level first
             self.scores['lines'] += cleared
@@ -185,8 +505,12 @@ class Game(GameBase):
         slam_mult = 0.1
         # exponential accumulation: grow slam_mult each dropped row
         # simple rule: slam_mult = slam_mult * 1.25 + 0.1
-        while self.current.move(0,1,self.board):
-            slam_mult = slam_mult * (1 + self.scores['level'] / 10.0)
+        cur = self.current
+        if not cur.collides(self.board):
+            land = self.board.landing(cur.shape, cur.rot, cur.x, cur.y)
+            for _ in range(land - cur.y):
+                slam_mult = slam_mult * (1 + self.scores['level'] / 10.0)
+            cur.y = land
         # lock_piece now returns number of cleared lines
         cleared = self.lock_piece()
         if cleared and cleared > 0:
@@ -291,15 +615,69 @@ class Game(GameBase):
         self.stdscr.addstr(info_y + 4, 43, 'SPACE | ENTER : Slam (hard drop)')
         self.stdscr.addstr(info_y + 5, 43, 'BACKSPACE     : Pause/Resume')
         self.stdscr.addstr(info_y + 6, 43, 'ESC           : Quit')
+        self.stdscr.addstr(info_y + 7, 43, 'h             : Hint')
 
-    def draw(self):
+    def draw_board_cell(self, x, y):
+        ch = self.board.colors[y][x]
+        y_off = y + len(self.title)
+        try:
+            if ch == 'W':
+                # permanent left wall
+                self.stdscr.addstr(y_off, x*2, ' |')
+            elif ch != ' ':
+                color = COLORS.get(ch, 1)
+                attr = ptk.color_pair(color)
+                if ch == 'J':
+                    attr |= ptk.A_DIM
+                self.stdscr.addstr(y_off, x*2, '[]', attr)
+            else:
+                self.stdscr.addstr(y_off, x*2, '  ')
+        except Exception:
+            pass
+
+    def piece_cells(self):
+        """Board cells covered by the falling piece."""
+        cells = set()
+        for bx, by in self.current.blocks:
+            x = self.current.x + bx
+            y = self.current.y + by
+            if 0 <= y < self.board.height and 0 <= x < self.board.width:
+                cells.add((x, y))
+        return cells
+
+    def ghost_cells(self):
+        """Board cells the falling piece would cover after a hard drop."""
+        cur = self.current
+        if cur.collides(self.board):
+            return set()
+        y = self.board.landing(cur.shape, cur.rot, cur.x, cur.y)
+        return {(cur.x + bx, y + by) for bx, by in cur.blocks}
+
+    def hint_cells(self):
+        """Board cells of the suggested placement for the falling piece."""
+        piece, cells = self._hint
+        if piece is not self.current:
+            board = self.board
+            cur = self.current
+            target = best_placement(board.rows, board.width, board.height,
+                                    cur.shape, cur.rot, cur.x, cur.y, self.next.shape)
+            cells = set()
+            if target is not None:
+                rot, x, y = target
+                for bx, by in SHAPES[cur.shape][rot]:
+                    cells.add((x + bx, y + by))
+            self._hint = (cur, cells)
+        return cells
+
+    def draw_frame(self):
+        """Roof, right border and floor around the board."""
         # draw roof (one line) above the board with a centered opening
         y_roof = len(self.title) - 1
         if y_roof >= 0:
-            open_w = min(max(0, 6), len(self.board[0]))
-            open_start = (len(self.board[0]) - open_w) // 2
+            open_w = min(max(0, 6), self.board.width)
+            open_start = (self.board.width - open_w) // 2
             open_end = open_start + open_w
-            for x in range(len(self.board[0])):
+            for x in range(self.board.width):
                 try:
                     if open_start <= x < open_end:
                         # leave opening
@@ -308,48 +686,81 @@ class Game(GameBase):
                         self.stdscr.addstr(y_roof, x*2+1, '==')
                 except Exception:
                     pass
-        # draw board with top margin
-        for y in range(self.height - 6):
-            y_off = y + y_roof + 1
-            for x in range(len(self.board[0])):
-                ch = self.board[y][x]
-                if ch == 'W':
-                    # permanent left wall
-                    self.stdscr.addstr(y_off, x*2, ' |')
-                elif ch != ' ':
-                    color = COLORS.get(ch, 1)
-                    attr = ptk.color_pair(color)
-                    if ch == 'J':
-                        attr |= ptk.A_DIM
-                    self.stdscr.addstr(y_off, x*2, '[]', attr)
-                else:
-                    self.stdscr.addstr(y_off, x*2, '  ')
-        # draw current (apply top margin)
-        for bx, by in self.current.blocks:
-            x = self.current.x + bx
-            y = self.current.y + by
-            y_off = y + len(self.title)
-            if 0 <= y < self.height - 6 and 0 <= x < len(self.board[0]):
-                color = COLORS.get(self.current.shape, 1)
-                attr = ptk.color_pair(color)
-                if self.current.shape == 'J':
-                    attr |= ptk.A_DIM
-                self.stdscr.addstr(y_off, x*2, '[]', attr)
-
         # draw borders and (shifted by top margin)
-        for y in range(self.height - 6):
+        for y in range(self.board.height):
             y_off = y + len(self.title)
-            self.stdscr.addstr(y_off, len(self.board[0])*2, '|')
+            try:
+                self.stdscr.addstr(y_off, self.board.width*2, '|')
+            except Exception:
+                pass
 
         # draw floor below the board using '='
         try:
-            floor_y = len(self.title) + self.height - 6
-            for x in range(len(self.board[0])):
+            floor_y = len(self.title) + self.board.height
+            for x in range(self.board.width):
                 self.stdscr.addstr(floor_y, x*2+1, '==')
         except Exception:
             pass
+
+    def pre_draw(self):
+        # repaint everything on the first frame, after a resize or when the
+        # PAUSED overlay goes away; otherwise keep the previous frame
+        try:
+            size = self.stdscr.getmaxyx()
+        except Exception:
+            size = None
+        if size != self._screen_size or (self._was_paused and not self.paused):
+            self._full_redraw = True
+        self._screen_size = size
+        self._was_paused = self.paused
+        if self._full_redraw:
+            super().pre_draw()
+
+    def draw(self):
+        board = self.board
+        if self._full_redraw:
+            self._full_redraw = False
+            self.draw_frame()
+            rows = range(board.height)
+            stale = ()
+        else:
+            # rows changed by lock/clear, plus where the piece was last frame
+            rows = board.dirty
+            stale = [c for c in self._piece_cells if c[1] not in rows]
+        for y in rows:
+            for x in range(board.width):
+                self.draw_board_cell(x, y)
+        board.dirty.clear()
+        for x, y in stale:
+            self.draw_board_cell(x, y)
+        color = COLORS.get(self.current.shape, 1)
+        attr = ptk.color_pair(color)
+        if self.current.shape == 'J':
+            attr |= ptk.A_DIM
+        # hint outline under the piece
+        hint = self.hint_cells() if self.show_hint else set()
+        for x, y in hint:
+            try:
+                self.stdscr.addstr(y + len(self.title), x*2, '::', ptk.color_pair(color) | ptk.A_DIM)
+            except Exception:
+                pass
+        # ghost: where the piece would land if dropped now
+        ghost = self.ghost_cells()
+        for x, y in ghost:
+            try:
+                self.stdscr.addstr(y + len(self.title), x*2, '..', ptk.color_pair(color) | ptk.A_DIM)
+            except Exception:
+                pass
+        # draw current (apply top margin)
+        cells = self.piece_cells()
+        for x, y in cells:
+            try:
+                self.stdscr.addstr(y + len(self.title), x*2, '[]', attr)
+            except Exception:
+                pass
+        self._piece_cells = cells | hint | ghost
         self.draw_info()
-    
+
     def step(self, now):
       if not self.current.move(0,1,self.board):
           self.lock_piece()
@@ -365,6 +776,8 @@ class Game(GameBase):
         self.current.rotate(self.board)
       elif is_enter_key(ch) or ch == ord(' '):
         self.hard_drop()
+      elif ch == ord('h'):
+        self.show_hint = not self.show_hint
 
 def main(stdscr):
   init_ptk(stdscr)
@@ -0,0 +1,50 @@
+import os
+import random
+
+from game_classes import ptk
+from game_classes.headless import load_game_module, new_game
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+storm = load_game_module(os.path.join(ROOT, 'games', 'ball_storm', 'game.py'))
+S = storm.SUBCELL
+
+
+def new_storm():
+    random.seed(0)
+    return new_game(storm, ptk.HeadlessScreen(120, 40))
+
+
+def test_storm_grows_to_its_size_a_few_balls_per_tick():
+    game = new_storm()
+    assert len(game.balls) == storm.START_BALLS
+    game.scores['level'] = 3
+    # a paddle as wide as the field keeps every ball in play
+    game.paddle_x, game.paddle_w = 0, game.width
+    game.step(game.tick)
+    assert len(game.balls) == storm.START_BALLS + storm.SPAWN_PER_TICK
+    for i in range(20):
+        game.step(game.tick * (i + 2))
+    assert len(game.balls) == game.storm_size() == storm.START_BALLS + 2 * storm.BALLS_PER_LEVEL
+    game.scores['level'] = 1000
+    assert game.storm_size() == storm.MAX_BALLS
+
+
+def test_misses_drain_the_shield_and_bounces_recharge_it():
+    game = new_storm()
+    game.balls = storm.BallField()
+    plane = (game.height - 2) * S
+    game.paddle_x, game.paddle_w = 50, 10
+    # three balls land off the paddle and one on it; nothing else moves
+    for cell in (5, 20, 90, 55):
+        game.balls.spawn(cell * S, plane - S // 2, 0, S)
+    game.shield = 10
+    game.step(game.tick)
+    assert game.shield == 10 - 3 + 1
+    assert game.count == 1
+    # slot 0 is no primary ball in a storm: missing it is not game over
+    assert not game.over
+    game.balls = storm.BallField()
+    game.balls.spawn(5 * S, plane - S // 2, 0, S)
+    game.shield = 1
+    game.step(game.tick * 2)
+    assert game.over and game.shield == 0
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from game_classes import batch
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+GAME = os.path.join(ROOT, 'games', 'escape_sequence', 'game.py')
+
+
+def test_run_batch_covers_every_seed_once():
+    seen = []
+    summary = batch.run_batch(GAME, 7, workers=2, chunksize=2, max_ticks=60, seed=10,
+                              cols=80, rows=24, on_result=seen.append)
+    assert sorted(r['seed'] for r in seen) == list(range(10, 17))
+    assert summary['sessions'] == 7
+    assert summary['crashes'] == 0
+    assert summary['game'] == 'escape_sequence'
+    assert summary['ticks_survived']['max'] <= 60
+
+    # the pool gives the same results as running the sessions here
+    batch._init_worker(GAME, None)
+    local = batch._run_chunk(list(range(10, 17)), 60, 80, 24)
+    assert sorted(seen, key=lambda r: r['seed']) == local
+
+
+def test_batch_stats_aggregate_and_count_crashes():
+    stats = batch.BatchStats()
+    stats.add({'ticks': 10, 'over': True, 'scores': {'score': 4}})
+    stats.add({'ticks': 30, 'over': False, 'scores': {'score': 8, 'name': 'x'}, 'bot_overruns': 2})
+    stats.add({'crashed': True, 'error': 'ValueError: boom'})
+    summary = stats.summary()
+    assert summary['sessions'] == 3
+    assert summary['crashes'] == 1
+    assert summary['games_over'] == 1
+    assert summary['bot_overruns'] == 2
+    assert summary['ticks_survived'] == {'mean': 20.0, 'min': 10, 'max': 30}
+    assert summary['scores'] == {'score': {'mean': 6.0, 'min': 4.0, 'max': 8.0}}
+    assert summary['errors'] == {'ValueError: boom': 1}
+
+
+def test_policy_must_be_importable_by_name():
+    with pytest.raises(TypeError):
+        batch.run_batch(GAME, 1, workers=1, policy=lambda view: None)
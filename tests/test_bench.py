@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import cli
+from game_classes.bench import bench_case, parse_size, run_benchmarks
+from game_classes.headless import load_game_module, run_session
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PATHS = [os.path.join(ROOT, rel) for _, rel in cli.GAMES]
+
+
+def test_parse_size():
+    assert parse_size('120X40') == (120, 40)
+    for bad in ('120', '0x40', 'axb'):
+        with pytest.raises(ValueError):
+            parse_size(bad)
+
+
+def test_games_keep_their_indices():
+    assert [name for name, _ in cli.GAMES][:6] == [
+        'Byte Bouncer', 'Escape Sequence', 'Star Ship', 'Terminal Tumble', 'Star Ship Expanse', 'Ball Storm']
+
+
+def test_resolve_game_exact_ignores_partial_names(capsys):
+    assert cli._resolve_game('bouncer') == 0
+    assert cli._resolve_game('bouncer', exact=True) is None
+    assert cli._resolve_game('BYTE BOUNCER', exact=True) == 0
+    assert cli._resolve_game('3', exact=True) == 3
+    assert 'Game not found' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('path', PATHS, ids=lambda p: os.path.basename(os.path.dirname(p)))
+def test_scripted_session_is_deterministic(path):
+    mod = load_game_module(path)
+    cols, rows = getattr(mod, 'MIN_COLS', 80), getattr(mod, 'MIN_ROWS', 24)
+    first = run_session(mod, 150, seed=7, cols=cols, rows=rows)
+    second = run_session(mod, 150, seed=7, cols=cols, rows=rows)
+    assert first['ticks'] == 150
+    for key in ('frames', 'bytes', 'games', 'scores'):
+        assert first[key] == second[key]
+
+
+def test_bench_report():
+    result = bench_case(PATHS[0], 40, 10, 20, 1)
+    assert result['ticks'] == 20
+    assert result['min_size_ok'] is False
+    report = run_benchmarks(PATHS[:1], sizes=[(80, 24)], ticks=20, isolate=False)
+    assert report['isolated'] is False
+    [row] = report['results']
+    assert 'error' not in row
+    assert row['game'] == 'byte_bouncer'
+    assert row['min_size_ok'] is True
+    assert row['frames'] == 20
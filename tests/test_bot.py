@@ -0,0 +1,101 @@
+import os
+from array import array
+from types import MappingProxyType
+
+import pytest
+
+from game_classes import ptk
+from game_classes.bot import BotDriver, GameView, Policy
+from game_classes.headless import load_game_module, new_game, resolve_policy, run_session
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def star_ship():
+    return load_game_module(os.path.join(ROOT, 'games', 'star_ship', 'game.py'))
+
+
+class Seeker(Policy):
+    """Turn toward the nearest star, using only the read-only view."""
+
+    def __init__(self):
+        self.seen = []
+
+    def act(self, view):
+        stars = view.stars
+        ship = view.ship_cells
+        self.seen.append((len(stars), len(ship), view.ship[0] in ship))
+        if not stars:
+            return None
+        hy, hx = view.ship[0]
+        sy, sx = min(stars, key=lambda c: abs(c[0] - hy) + abs(c[1] - hx))
+        if sx != hx:
+            return ptk.KEY_RIGHT if sx > hx else ptk.KEY_LEFT
+        return ptk.KEY_DOWN if sy > hy else ptk.KEY_UP
+
+
+def test_star_ship_policy_reads_cell_sets():
+    bot = Seeker()
+    stats = run_session(star_ship(), 200, seed=3, policy=bot, budget=1.0, draw=False)
+    assert stats['ticks'] == 200
+    assert bot.seen and all(n_ship >= 3 and head_in for _, n_ship, head_in in bot.seen)
+    assert any(n_stars for n_stars, _, _ in bot.seen)
+
+
+def test_game_view_is_read_only():
+    game = new_game(star_ship(), ptk.HeadlessScreen(80, 24))
+    view = GameView(game)
+    assert isinstance(view.stars, frozenset)
+    assert view.stars == frozenset(game.stars.cells)
+    assert isinstance(view.ship, tuple)
+    for name in ('step', '_dir_at_last_step'):
+        with pytest.raises(AttributeError):
+            getattr(view, name)
+    with pytest.raises(AttributeError):
+        view.scores = {}
+
+
+def test_driver_drops_overrunning_keys():
+    driver = BotDriver(lambda view: ptk.KEY_LEFT, budget=-1.0)
+    game = new_game(star_ship(), ptk.HeadlessScreen(80, 24))
+    assert driver.keys(game) == []
+    assert driver.report()['overruns'] == 1
+
+
+def test_resolve_policy():
+    assert isinstance(resolve_policy('game_classes.bot:Policy'), Policy)
+    act = resolve_policy('game_classes.bot:Policy.act')
+    assert callable(act) and not isinstance(act, Policy)
+    assert resolve_policy(None) is None
+    assert resolve_policy(test_resolve_policy) is test_resolve_policy
+    with pytest.raises(ValueError):
+        resolve_policy('game_classes.bot')
+
+
+@pytest.mark.parametrize('out, keys', [
+    (None, []),
+    (-1, []),
+    (ptk.KEY_UP, [ptk.KEY_UP]),
+    ([ptk.KEY_LEFT, None, 27, -1, ord(' ')], [ptk.KEY_LEFT, ord(' ')]),
+])
+def test_driver_normalises_keys_and_never_sends_esc(out, keys):
+    driver = BotDriver(lambda view: out, budget=1.0)
+    game = new_game(star_ship(), ptk.HeadlessScreen(80, 24))
+    assert driver.keys(game) == keys
+    assert driver.report()['calls'] == 1
+
+
+def test_game_view_freezes_nested_values():
+    class Target:
+        def __init__(self):
+            self.grid = [[1, 2], [3]]
+            self.meta = {'cells': {(0, 1)}, 'xs': array('q', [4, 5])}
+            self.child = Target.__new__(Target)
+            self.child.hp = 3
+
+    view = GameView(Target())
+    assert view.grid == ((1, 2), (3,))
+    assert isinstance(view.meta, MappingProxyType)
+    assert view.meta['cells'] == frozenset({(0, 1)})
+    assert view.meta['xs'] == (4, 5)
+    assert isinstance(view.child, GameView) and view.child.hp == 3
@@ -0,0 +1,143 @@
+import os
+import random
+import time
+
+import pytest
+
+from game_classes.headless import load_game_module
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+bb = load_game_module(os.path.join(ROOT, 'games', 'byte_bouncer', 'game.py'))
+S = bb.SUBCELL
+
+
+def simulate_landing(x, y, vx, vy, width, height):
+    """(ticks, x) at which a lone ball gets past a paddle parked off screen."""
+    field = bb.BallField(use_numpy=False)
+    field.spawn(x, y, vx, vy)
+    for ticks in range(1, 100000):
+        _, misses = field.step(width, height, -100, 1)
+        if misses:
+            return ticks, field.x[0]
+    raise AssertionError('ball never landed')
+
+
+def test_predict_landing_matches_simulation():
+    rng = random.Random(0)
+    for _ in range(3000):
+        width, height = rng.randint(10, 120), rng.randint(10, 60)
+        hi, plane = (width - 2) * S, (height - 2) * S
+        ball = (rng.randint(0, hi), rng.randint(0, plane - 1),
+                rng.randint(-5 * S, 5 * S), rng.choice([-1, 1]) * rng.randint(1, 5 * S))
+        assert bb.predict_landing(*ball, hi, plane) == simulate_landing(*ball, width, height), ball
+
+
+def test_predict_landing_through_a_wall_contact():
+    # the ball sits exactly on the left wall one tick before crossing the plane
+    ball = (133, 2755, 1051, 100)
+    assert bb.predict_landing(*ball, 8704, 6144) == simulate_landing(*ball, 70, 26) == (34, 935)
+
+
+@pytest.mark.parametrize('v', [-300, 300])
+def test_fold_heads_away_from_walls(v):
+    hi = 10 * S
+    assert bb.fold(0, v, hi) == (0, 300)
+    assert bb.fold(hi, v, hi) == (hi, -300)
+    assert bb.fold(2 * hi, v, hi) == (0, 300)
+    assert bb.fold(-5, v, hi) == (5, -v)
+
+
+@pytest.mark.skipif(bb.np is None, reason='numpy not installed')
+def test_numpy_step_matches_pure_python():
+    rng = random.Random(4)
+    width, height = 60, 30
+    a, b = bb.BallField(use_numpy=False), bb.BallField(use_numpy=True)
+    for _ in range(40):
+        ball = (rng.randint(0, (width - 2) * S), rng.randint(0, (height - 3) * S),
+                rng.randint(-4 * S, 4 * S), rng.choice([-1, 1]) * rng.randint(1, 4 * S))
+        a.spawn(*ball)
+        b.spawn(*ball)
+    for _ in range(300):
+        paddle_x = rng.randint(0, width - 10)
+        got = a.step(width, height, paddle_x, 8)
+        assert got == b.step(width, height, paddle_x, 8)
+        assert a.positions() == b.positions()
+        assert [int(v) for v in a.vx[:a.n]] == [int(v) for v in b.vx[:b.n]]
+        a.remove_many(got[1])
+        b.remove_many(got[1])
+
+
+@pytest.mark.parametrize('use_numpy', [False, pytest.param(True, marks=pytest.mark.skipif(
+    bb.np is None, reason='numpy not installed'))])
+def test_step_reports_bounces_and_misses_by_slot(use_numpy):
+    width, height = 40, 20
+    plane = (height - 2) * S
+    field = bb.BallField(use_numpy=use_numpy)
+    # each ball crosses the paddle plane this tick, at cells 5, 12 and 30
+    for cell in (5, 12, 30):
+        field.spawn(cell * S + S // 2, plane - S // 2, 0, S)
+    field.spawn(20 * S, 3 * S, 0, -S)
+    bounces, misses = field.step(width, height, 10, 4)
+    assert bounces == [(1, 1)]
+    assert misses == [0, 2]
+    # misses are left for the caller; the bounced ball heads up
+    assert len(field) == 4 and field[1][3] < 0
+    field.remove_many(misses)
+    # swap-remove: the last ball fills slot 0, the bounced one keeps slot 1
+    assert len(field) == 2
+    assert field[0][:2] == (20 * S, 2 * S)
+    assert field[1][3] < 0
+
+
+def test_ball_field_steps_500_balls_well_within_a_tick():
+    field = bb.BallField(use_numpy=False)
+    rng = random.Random(2)
+    width, height = 120, 40
+    for _ in range(500):
+        field.spawn(rng.randrange((width - 2) * S), rng.randrange((height - 3) * S),
+                    rng.randint(-S, S), rng.choice([-1, 1]) * rng.randint(S // 4, S))
+    start = time.perf_counter()
+    for _ in range(20):
+        # a paddle as wide as the field keeps every ball in play
+        field.step(width, height, 0, width)
+    assert len(field) == 500
+    assert (time.perf_counter() - start) / 20 < 0.03
+
+
+def test_fast_ball_cannot_tunnel_through_the_paddle():
+    width, height = 40, 20
+    plane = (height - 2) * S
+    field = bb.BallField(use_numpy=False)
+    # four cells down and six across per tick: starts over cell 8, ends over
+    # cell 14 and crosses the plane over cell 12, where the one-cell paddle is
+    field.spawn(8 * S, plane - 3 * S, 6 * S, 4 * S)
+    bounces, misses = field.step(width, height, 12, 1)
+    assert (bounces, misses) == ([(0, 1)], [])
+    x, y, vx, vy = field[0]
+    assert vy < 0 and y <= plane
+    # under where the ball ends the tick is too late: it already went past
+    field = bb.BallField(use_numpy=False)
+    field.spawn(8 * S, plane - 3 * S, 6 * S, 4 * S)
+    assert field.step(width, height, 14, 1) == ([], [0])
+
+
+def test_fold_keeps_any_speed_inside_the_walls():
+    hi = 30 * S
+    rng = random.Random(1)
+    for _ in range(1000):
+        x, v = rng.randint(-10 * hi, 10 * hi), rng.randint(-5 * hi, 5 * hi)
+        fx, fv = bb.fold(x, v, hi)
+        assert 0 <= fx <= hi and abs(fv) == abs(v)
+
+
+def test_paddle_sends_the_ball_off_at_speed_by_where_it_hit():
+    speed = bb.BASE_SPEED
+    left = bb.paddle_velocity(10 * S, 50, 10, 8, speed)
+    right = bb.paddle_velocity(17 * S, -50, 10, 8, speed)
+    centre = bb.paddle_velocity(14 * S - S // 2, -50, 10, 8, speed)
+    assert left[0] < 0 < right[0] and centre[0] < 0
+    for vx, vy in (left, right, centre):
+        assert vy < 0
+        assert abs((vx * vx + vy * vy) ** 0.5 - speed) <= 2
+    # edges leave at a flatter angle than the centre
+    assert abs(left[0]) > abs(centre[0])
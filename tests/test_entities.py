@@ -0,0 +1,32 @@
+import pytest
+
+from game_classes import entities
+from game_classes.entities import EntityColumns
+
+
+class Points(EntityColumns):
+    FIELDS = ('x', 'y')
+
+
+@pytest.mark.parametrize('use_numpy', [False, pytest.param(True, marks=pytest.mark.skipif(
+    entities.np is None, reason='numpy not installed'))])
+def test_swap_remove_keeps_rows_together(use_numpy):
+    pts = Points(use_numpy=use_numpy, capacity=2)
+    for i in range(40):
+        assert pts.spawn(i, -i) == i
+    assert pts.remove(5)
+    assert pts[5] == (39, -39)
+    pts.remove_many([0, 7, 37, 38])
+    assert len(pts) == 35
+    assert not pts.remove(35)
+    rows = list(pts)
+    assert all(y == -x for x, y in rows)
+    assert sorted(x for x, _ in rows) == [x for x in range(1, 40) if x not in (5, 7, 37, 38)]
+    assert pts[-1] == rows[-1]
+    with pytest.raises(IndexError):
+        pts[35]
+
+
+def test_spawn_checks_field_count():
+    with pytest.raises(TypeError):
+        Points(use_numpy=False).spawn(1)
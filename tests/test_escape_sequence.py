@@ -0,0 +1,83 @@
+import os
+import random
+
+import pytest
+
+from game_classes.headless import load_game_module
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+es = load_game_module(os.path.join(ROOT, 'games', 'escape_sequence', 'game.py'))
+
+
+def test_column_field_matches_a_list_of_columns():
+    rng = random.Random(3)
+    size, height = 30, 20
+    field = es.ColumnField(size)
+    # screen column x -> [block rows, disc rows, obstacles, absolute index]
+    cols = [[set(), set(), 0, a] for a in range(size)]
+    for _ in range(5000):
+        op = rng.random()
+        x = rng.randrange(size)
+        if op < 0.2:
+            y, h = rng.randrange(height - 1), rng.choice([1, 2])
+            field.add_obstacle(x, y, h)
+            cols[x][0].update(range(y, y + h))
+            cols[x][2] += 1
+        elif op < 0.35:
+            y = rng.randrange(height)
+            field.add_disc(x, y)
+            cols[x][1].add(y)
+        elif op < 0.5:
+            rows = set(rng.sample(range(height), 3))
+            mask = sum(1 << r for r in rows)
+            assert field.take_discs(x, mask) == len(cols[x][1] & rows)
+            cols[x][1] -= rows
+        elif op < 0.7:
+            rows = set(rng.sample(range(height), 3))
+            assert field.blocked(x, sum(1 << r for r in rows)) == bool(cols[x][0] & rows)
+        elif op < 0.9:
+            field.scroll()
+            cols = cols[1:] + [[set(), set(), 0, cols[-1][3] + 1]]
+        else:
+            start = field.offset + rng.randint(-5, size)
+            stop = start + rng.randint(0, size)
+            assert field.count_obstacles(start, stop) == sum(c[2] for c in cols if start <= c[3] < stop)
+        expected = [(x, sum(1 << r for r in c[0]), sum(1 << r for r in c[1]))
+                    for x, c in enumerate(cols) if c[0] or c[1]]
+        assert list(field.columns()) == expected
+
+
+@pytest.mark.parametrize('height', [6, 8, 20])
+def test_obstacle_stream_always_leaves_a_way_through(height):
+    rows = set(range(1, height))
+
+    def spread(reach):
+        return {r + d for r in reach for d in (-1, 0, 1)} & rows
+
+    for seed in range(20):
+        random.seed(seed)
+        stream = es.ObstacleStream(height, 50)
+        start, lead = random.randrange(1, height), random.randint(0, 5)
+        # far denser than the game ever asks for
+        stream.reset(start, lead, 1.0, seed % 2 == 0)
+        reach = {start}
+        for _ in range(lead):
+            reach = spread(reach)
+        placed = 0
+        for _ in range(500):
+            column = stream.next()
+            reach = spread(reach)
+            if column is not None:
+                oy, h = column
+                placed += 1
+                # the player's three-row sprite must miss every block
+                reach = {r for r in reach if not set(range(r - 1, r + 2)) & set(range(oy, oy + h))}
+            assert reach, (seed, placed)
+        assert placed > 100
+
+
+def test_obstacle_stream_without_spawns_is_empty():
+    random.seed(0)
+    stream = es.ObstacleStream(20, 10)
+    stream.reset(9, 3, 0.0, True)
+    assert all(stream.next() is None for _ in range(100))
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from game_classes.grid import GridIndex
+
+
+@pytest.mark.parametrize('bucket', [1, 4, 16])
+def test_queries_match_brute_force(bucket):
+    rng = random.Random(bucket)
+    grid = GridIndex(bucket=bucket)
+    cells = {}
+    for _ in range(3000):
+        cell = (rng.randint(-20, 60), rng.randint(-20, 60))
+        op = rng.random()
+        if op < 0.5:
+            grid.add(cell, op)
+            cells[cell] = op
+        elif op < 0.7:
+            assert grid.pop(cell, 'none') == cells.pop(cell, 'none')
+        elif op < 0.85:
+            new = (rng.randint(-20, 60), rng.randint(-20, 60))
+            ok = cell in cells and (new == cell or new not in cells)
+            assert grid.move(cell, new) == ok
+            if ok:
+                cells[new] = cells.pop(cell)
+        else:
+            y0, x0 = rng.randint(-25, 60), rng.randint(-25, 60)
+            y1, x1 = y0 + rng.randint(-2, 40), x0 + rng.randint(-2, 40)
+            found = list(grid.query(y0, x0, y1, x1))
+            expected = {c for c in cells if y0 <= c[0] < y1 and x0 <= c[1] < x1}
+            assert len(found) == len(expected) and set(found) == expected
+            assert grid.any_in(y0, x0, y1, x1) == bool(expected)
+        assert grid.cells == cells
+    # no empty buckets are left behind, and every cell is in its own bucket
+    assert all(grid.buckets.values())
+    assert sum(map(len, grid.buckets.values())) == len(grid)
+    assert all(grid.key(c) == k for k, b in grid.buckets.items() for c in b)
+
+
+def test_version_changes_on_every_update():
+    grid = GridIndex([(0, 0)])
+    seen = {grid.version}
+    for update in (lambda: grid.add((1, 1)), lambda: grid.add((1, 1), 'x'),
+                   lambda: grid.move((1, 1), (2, 2)), lambda: grid.discard((0, 0)), grid.clear):
+        update()
+        assert grid.version not in seen
+        seen.add(grid.version)
+    before = grid.version
+    grid.discard((9, 9))
+    assert not grid.move((9, 9), (8, 8))
+    assert grid.version == before
+
+
+def test_behaves_like_a_set_of_cells():
+    grid = GridIndex([(1, 2), (3, 4), (1, 2)])
+    assert len(grid) == 2 and (3, 4) in grid and (4, 3) not in grid
+    assert set(grid) == {(1, 2), (3, 4)}
+    assert grid.get((1, 2)) is True and grid.get((0, 0), 5) == 5
+    grid.clear()
+    assert not grid and not grid.buckets
@@ -0,0 +1,307 @@
+import json
+import multiprocessing
+import os
+import random
+import stat
+
+import pytest
+
+from game_classes import highscores
+
+
+def use_home(monkeypatch, home, backend='json'):
+    # fresh process-wide store rooted in `home`
+    monkeypatch.setenv('HOME', str(home))
+    monkeypatch.setenv(highscores.BACKEND_ENV, backend)
+    monkeypatch.setattr(highscores, 'appdirs', None)
+    monkeypatch.setattr(highscores, '_STORES', {})
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    use_home(monkeypatch, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def hs(home):
+    return highscores.HighScores('test_game', {
+        'score': {'player': 'Player', 'value': 0},
+        'level': {'player': 'Player', 'value': 1},
+    })
+
+
+def test_untouched_metric_keeps_player_and_value(hs):
+    for value in (10, 20):
+        data = hs.load()
+        board = hs.leaderboard(data, 'score')
+        board.insert('Ann', value)
+        data['score'] = board.to_entry()
+        assert hs.save(data)
+
+    with open(hs.path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['level'] == {'player': 'Player', 'value': 1, 'top': []}
+    assert saved['score']['player'] == 'Ann'
+    assert saved['score']['value'] == 20
+    assert highscores.get_saved_highscores('test_game')[0]['scores']['level']['value'] == 1
+
+
+@pytest.mark.parametrize('size, floor', [(1, None), (5, None), (8, 10)])
+def test_leaderboard_matches_a_sorted_table(size, floor):
+    rng = random.Random(size)
+    board = highscores.Leaderboard(size=size, floor=floor)
+    table = []  # (value, seq, player), kept sorted and cut to size
+    for seq in range(3000):
+        player, value = f'p{rng.randrange(12)}', rng.randint(0, 60)
+        own = [e for e in table if e[2] == player]
+        if own:
+            changed = value > own[0][0]
+            if changed:
+                table.remove(own[0])
+        else:
+            cut = table[-1][0] if len(table) >= size else floor
+            changed = cut is None or value > cut
+        if changed:
+            table = sorted(table + [(value, seq, player)], key=lambda e: (-e[0], e[1]))[:size]
+        assert board.insert(player, value) == changed
+        assert board.entries == [(v, p) for v, _, p in table]
+    assert not board.insert('p0', 'not a number')
+
+
+def test_merge_entry_folds_legacy_entries_into_the_table():
+    legacy = {'player': 'Ann', 'value': 5}
+    incoming = {'player': 'Bob', 'value': 9, 'top': [{'player': 'Bob', 'value': 9}, {'player': 'Ann', 'value': 3}]}
+    merged = highscores.merge_entry(legacy, incoming, size=2)
+    assert merged == {'player': 'Bob', 'value': 9,
+                      'top': [{'player': 'Bob', 'value': 9}, {'player': 'Ann', 'value': 5}]}
+
+
+def test_merge_entry_of_placeholders_keeps_value():
+    placeholder = {'player': 'Player', 'value': 0, 'top': []}
+    assert highscores.merge_entry(placeholder, dict(placeholder)) == placeholder
+    assert highscores.merge_entry(None, placeholder) == placeholder
+    assert 'value' in highscores.Leaderboard(floor=5).to_entry()
+
+
+def test_snapshot_mode_follows_umask(hs):
+    umask = os.umask(0o022)
+    try:
+        assert hs.save(hs.load())
+        assert stat.S_IMODE(os.stat(hs.path).st_mode) == 0o644
+        os.chmod(hs.path, 0o640)
+        assert hs.save(hs.load())
+        assert stat.S_IMODE(os.stat(hs.path).st_mode) == 0o640
+    finally:
+        os.umask(umask)
+
+
+def test_export_since_emits_only_changed_entries(home):
+    merge = highscores.merge_update_highscores
+    merge({'byte_bouncer': {'score': {'player': 'Ann', 'value': 5}},
+           'star_ship': {'score': {'player': 'Bob', 'value': 7}}})
+    changes, mark = highscores.export_since('0')
+    assert set(changes) == {'byte_bouncer', 'star_ship'}
+    changes, mark = highscores.export_since(mark)
+    assert changes == {}
+
+    merge({'star_ship': {'score': {'player': 'Cy', 'value': 9}}})
+    changes, mark = highscores.export_since(mark)
+    assert list(changes) == ['star_ship']
+    assert changes['star_ship']['score']['player'] == 'Cy'
+
+    # a reset game leaves the watermark; re-saved scores are exported again
+    store = highscores.get_store()
+    for f in store.files(store.path('star_ship')):
+        os.remove(f)
+    changes, mark = highscores.export_since(mark)
+    assert changes == {}
+    assert 'star_ship' not in highscores.decode_watermark(mark)
+    merge({'star_ship': {'score': {'player': 'Bob', 'value': 7}}})
+    changes, _ = highscores.export_since(mark)
+    assert list(changes) == ['star_ship']
+
+
+def test_export_since_one_game_keeps_other_marks(home):
+    highscores.merge_update_highscores({'byte_bouncer': {'score': {'player': 'Ann', 'value': 5}},
+                                        'star_ship': {'score': {'player': 'Bob', 'value': 7}}})
+    _, mark = highscores.export_since('0')
+    _, mark = highscores.export_since(mark, 'byte_bouncer')
+    assert set(highscores.decode_watermark(mark)) == {'byte_bouncer', 'star_ship'}
+    assert highscores.export_since(mark)[0] == {}
+
+
+def test_export_feeds_merge_update_highscores(home, tmp_path, monkeypatch):
+    highscores.merge_update_highscores({'byte_bouncer': {'score': {'player': 'Ann', 'value': 5}}})
+    changes, _ = highscores.export_since('0')
+    use_home(monkeypatch, tmp_path / 'central')
+    assert highscores.merge_update_highscores(changes) == ['byte_bouncer']
+    assert highscores.get_saved_highscores('byte_bouncer')[0]['scores'] == changes['byte_bouncer']
+
+
+def test_invalid_watermark_is_rejected():
+    for token in ('bogus', highscores.WATERMARK_PREFIX + '!!!'):
+        with pytest.raises(ValueError):
+            highscores.decode_watermark(token)
+
+
+def test_lock_stats_add_up_across_processes(hs, monkeypatch):
+    assert hs.save(hs.load())
+    store = highscores.get_store()
+    first = store.lock_stats()
+    assert first['acquired'] >= 1
+    assert store.save_lock_stats()
+    assert store.lock_stats()['acquired'] == 0
+
+    # a later process finds the totals and adds its own at exit
+    monkeypatch.setattr(highscores, '_STORES', {})
+    store = highscores.get_store()
+    with store.lock(hs.path):
+        pass
+    second = store.lock_stats()
+    highscores._flush_stores()
+    saved = store.saved_lock_stats()
+    assert saved['acquired'] == first['acquired'] + 1
+    assert saved['contended'] == first['contended'] + second['contended']
+    assert saved['wait_max'] == max(first['wait_max'], second['wait_max'])
+    assert saved['wait_avg'] == pytest.approx(saved['wait_total'] / saved['acquired'])
+
+
+def test_store_serves_repeated_loads_from_memory(hs, monkeypatch):
+    data = hs.load()
+    data['score'] = {'player': 'Ann', 'value': 5}
+    assert hs.save(data)
+    reads = []
+    real_load = json.load
+    monkeypatch.setattr(highscores.json, 'load', lambda f: reads.append(f.name) or real_load(f))
+    other = highscores.HighScores('test_game', {'score': {'player': 'Player', 'value': 0}})
+    assert other.store is hs.store
+    for _ in range(3):
+        assert other.load()['score']['value'] == 5
+    assert reads == []
+
+    # callers get their own copies
+    other.load()['score']['value'] = 99
+    assert hs.load()['score']['value'] == 5
+
+    # a write by another process is picked up on the next load
+    with open(hs.path, 'w', encoding='utf-8') as f:
+        json.dump({'score': {'player': 'Bob', 'value': 12345}}, f)
+    assert hs.load()['score'] == {'player': 'Bob', 'value': 12345}
+    assert reads == [hs.path]
+
+
+def test_journal_group_commits_replays_and_compacts(tmp_path, monkeypatch):
+    use_home(monkeypatch, tmp_path, 'journal')
+    monkeypatch.setattr(highscores, 'JOURNAL_INTERVAL', 3600.0)
+    monkeypatch.setattr(highscores, 'COMPACT_LINES', 3 * highscores.JOURNAL_BATCH)
+    hs = highscores.HighScores('test_game', {'score': {'player': 'Player', 'value': 0}})
+    jpath = highscores.journal_path(hs.path)
+
+    def add(value):
+        data = hs.load()
+        board = hs.leaderboard(data, 'score')
+        board.insert(f'p{value}', value)
+        data['score'] = board.to_entry()
+        assert hs.save(data)
+
+    for value in range(1, highscores.JOURNAL_BATCH):
+        add(value)
+    # queued, not written, but already visible to this process
+    assert not os.path.exists(jpath)
+    assert hs.load()['score']['value'] == highscores.JOURNAL_BATCH - 1
+    add(highscores.JOURNAL_BATCH)
+    with open(jpath, encoding='utf-8') as f:
+        assert len(f.readlines()) == highscores.JOURNAL_BATCH
+
+    # another process (and the json backend) replays the journal
+    use_home(monkeypatch, tmp_path, 'json')
+    other = highscores.HighScores('test_game', {'score': {'player': 'Player', 'value': 0}})
+    assert other.load()['score']['value'] == highscores.JOURNAL_BATCH
+
+    # compaction folds the journal into the snapshot and keeps its lines as history
+    for value in range(highscores.JOURNAL_BATCH + 1, 3 * highscores.JOURNAL_BATCH + 1):
+        add(value)
+    assert not os.path.exists(jpath)
+    with open(highscores.history_path(hs.path), encoding='utf-8') as f:
+        assert len(f.readlines()) == 3 * highscores.JOURNAL_BATCH
+    with open(hs.path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['score']['value'] == 3 * highscores.JOURNAL_BATCH
+    assert len(saved['score']['top']) == 3 * highscores.JOURNAL_BATCH
+
+
+def save_players(worker, count):
+    # one process's saves; the fork carries the test's HOME and backend
+    highscores._STORES.clear()
+    hs = highscores.HighScores('test_game', {'score': {'player': 'Player', 'value': 0}})
+    for i in range(count):
+        data = hs.load()
+        board = hs.leaderboard(data, 'score')
+        board.insert(f'w{worker}-{i}', worker * 100 + i + 1)
+        data['score'] = board.to_entry()
+        hs.save(data)
+    highscores._flush_stores()
+
+
+@pytest.mark.skipif(highscores.fcntl is None, reason='needs fcntl locks')
+@pytest.mark.parametrize('backend', ['json', 'journal'])
+def test_concurrent_writers_keep_each_others_scores(tmp_path, monkeypatch, backend):
+    use_home(monkeypatch, tmp_path, backend)
+    ctx = multiprocessing.get_context('fork')
+    procs = [ctx.Process(target=save_players, args=(w, 15)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+    hs = highscores.HighScores('test_game', {'score': {'player': 'Player', 'value': 0}})
+    players = {e['player'] for e in hs.load()['score']['top']}
+    assert players == {f'w{w}-{i}' for w in range(4) for i in range(15)}
+    assert highscores.get_store().saved_lock_stats()['acquired'] >= 4
+
+
+def test_score_batch_reads_every_line_format():
+    lines = [
+        '{"game": "a", "player": "Ann", "value": 5}',
+        b'{"game": "a", "metric": "level", "player": "Ann", "value": 2}\n',
+        '{"game": "b", "scores": {"score": {"player": "Bob", "value": 9}, "theme": "dark"}}',
+        '{"a": {"score": {"player": "Cid", "value": 7, "top": [{"player": "Cid", "value": 7}]}}}',
+        '',
+        'not json',
+        '{"game": "a", "value": "high"}',
+        '{"watermark": "w1.abc"}',
+    ]
+    batch = highscores.ScoreBatch(size=10).extend(lines)
+    assert (batch.lines, batch.skipped) == (7, 2)
+    assert batch.scores_map() == {
+        'a': {'score': {'player': 'Cid', 'value': 7, 'top': [{'player': 'Cid', 'value': 7}, {'player': 'Ann', 'value': 5}]},
+              'level': {'player': 'Ann', 'value': 2, 'top': [{'player': 'Ann', 'value': 2}]}},
+        'b': {'score': {'player': 'Bob', 'value': 9, 'top': [{'player': 'Bob', 'value': 9}]}, 'theme': 'dark'},
+    }
+
+
+def test_score_batch_memory_is_bounded_by_the_board_size():
+    batch = highscores.ScoreBatch(size=3)
+    for i in range(5000):
+        batch.feed(json.dumps({'game': 'a', 'player': f'p{i}', 'value': i % 997}))
+    board = batch.boards['a']['score']
+    assert len(board) == 3 and len(board._players) == 3
+    assert [v for v, _ in board.entries] == [996, 996, 996]
+
+
+def test_sync_merges_each_game_with_one_write(home, monkeypatch):
+    hs = highscores.HighScores('a', {'score': {'player': 'Player', 'value': 0}})
+    data = hs.load()
+    data['score'] = {'player': 'Old', 'value': 50, 'top': [{'player': 'Old', 'value': 50}]}
+    assert hs.save(data)
+    store = highscores.get_store()
+    writes = []
+    real_write = store.write
+    monkeypatch.setattr(store, 'write', lambda path, data: writes.append(path) or real_write(path, data))
+    lines = (json.dumps({'game': game, 'player': f'p{i}', 'value': i}) for game in 'ab' for i in range(100))
+    batch, updated = highscores.sync_score_lines(lines)
+    assert sorted(updated) == ['a', 'b'] and len(writes) == 2
+    top = hs.load()['score']['top']
+    assert top[0] == {'player': 'p99', 'value': 99}
+    assert {'player': 'Old', 'value': 50} in top
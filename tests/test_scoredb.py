@@ -0,0 +1,64 @@
+import pytest
+
+from game_classes.scoredb import ScoreDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ScoreDB(str(tmp_path / 'scores.db'))
+    yield db
+    db.close()
+
+
+def test_best_only_rises_and_history_keeps_every_row(db):
+    db.record('g', [('score', 'ann', 10, 1.0), ('score', 'bob', 7, 1.0)])
+    db.record('g', [('score', 'ann', 4, 2.0), ('score', 'bob', 12, 3.0), ('level', 'ann', 2, 3.0)])
+    db.record('g', [('score', 'ann', 10, 4.0)])
+    assert db.top('g', 'score', 10) == [('bob', 12, 3.0), ('ann', 10, 1.0)]
+    assert db.count('g') == 6
+    assert db.metrics('g') == ['level', 'score']
+
+
+def test_top_filters_by_player_limit_and_time(db):
+    db.record('g', [('score', 'ann', 50, 1.0), ('score', 'bob', 30, 5.0),
+                    ('score', 'cid', 40, 6.0), ('score', 'ann', 20, 7.0)])
+    db.record('h', [('score', 'ann', 99, 1.0)])
+    assert db.top('g', 'score', 2) == [('ann', 50, 1.0), ('cid', 40, 6.0)]
+    assert db.top('g', 'score', None, player='bob') == [('bob', 30, 5.0)]
+    # since: the best of what was saved from then on, not the all-time best
+    assert db.top('g', 'score', 10, since=5.0) == [('cid', 40, 6.0), ('bob', 30, 5.0), ('ann', 20, 7.0)]
+    assert db.top('g', 'score', 10, player='ann', since=2.0) == [('ann', 20, 7.0)]
+
+
+def test_equal_ties_keep_the_earlier_score_first(db):
+    db.record('g', [('score', 'bob', 10, 2.0), ('score', 'ann', 10, 1.0)])
+    assert [p for p, _, _ in db.top('g', 'score', 10)] == ['ann', 'bob']
+
+
+def test_failed_transaction_leaves_nothing(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert('g', [('score', 'ann', 10, 1.0)], {'note': '"x"'})
+            raise RuntimeError('boom')
+    assert db.count('g') == 0 and db.top('g', 'score', 10) == [] and db.extras('g') == {}
+
+
+def test_delete_game_and_extras(db):
+    db.record('g', [('score', 'ann', 1, 1.0)], {'note': '"hi"'})
+    db.record('h', [('score', 'ann', 2, 1.0)])
+    assert db.extras('g') == {'note': '"hi"'}
+    assert db.delete_game('g') == 1
+    assert db.games() == ['h'] and db.extras('g') == {}
+
+
+def test_data_version_moves_when_another_connection_commits(db):
+    other = ScoreDB(db.path)
+    try:
+        before = db.data_version()
+        db.record('g', [('score', 'ann', 1, 1.0)])
+        assert db.data_version() == before
+        other.record('g', [('score', 'bob', 2, 1.0)])
+        assert db.data_version() != before
+        assert [p for p, _, _ in db.top('g', 'score', 10)] == ['bob', 'ann']
+    finally:
+        other.close()
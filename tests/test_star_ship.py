@@ -0,0 +1,113 @@
+import os
+import random
+
+from game_classes import ptk
+from game_classes.headless import load_game_module, new_game
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+ss = load_game_module(os.path.join(ROOT, 'games', 'star_ship', 'game.py'))
+KEYS = (ptk.KEY_UP, ptk.KEY_DOWN, ptk.KEY_LEFT, ptk.KEY_RIGHT)
+
+
+def play(game, ticks, seed, check):
+    """Step `game` with random turns, calling `check(game)` after every tick."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    now = 0.0
+    for _ in range(ticks):
+        if rng.random() < 0.3:
+            game.events(rng.choice(KEYS))
+        now += game.tick
+        game.step(now)
+        if game.over:
+            return
+        check(game)
+
+
+def check_ship(game):
+    ship = list(game.ship)
+    assert set(ship) == set(game.ship_cells) and len(ship) == len(game.ship_cells)
+    for (ay, ax), (by, bx) in zip(ship, ship[1:]):
+        assert abs(ay - by) + abs(ax - bx) == 1
+
+
+def test_ship_body_and_cell_index_stay_in_step():
+    longest = 0
+    for seed in range(5):
+        game = new_game(ss, ptk.HeadlessScreen(80, 24))
+        # a row of stars ahead so the ship grows as well as moves
+        for x in range(game.width // 2 + 1, game.width):
+            game.stars.add((game.height // 2, x))
+        play(game, 400, seed, check_ship)
+        longest = max(longest, len(game.ship))
+    assert longest > 10
+
+
+def test_running_into_the_body_ends_the_game():
+    game = new_game(ss, ptk.HeadlessScreen(80, 24))
+    game.ship = ss.deque([(5, 5), (5, 6), (6, 6), (6, 5), (6, 4)])
+    game.ship_cells = ss.GridIndex(game.ship)
+    game.dir = (1, 0)
+    game.step(0.0)
+    assert game.over
+    assert list(game.ship) == [(5, 5), (5, 6), (6, 6), (6, 5), (6, 4)]
+
+
+def check_free(game):
+    taken = set(game.ship_cells) | set(game.stars) | {game.special}
+    every = {(y, x) for y in range(game.height) for x in range(game.width)}
+    assert set(game.free.cells) == every - taken
+    assert len(game.free.cells) == len(game.free.pos)
+
+
+def test_free_cells_track_ship_stars_and_special():
+    for seed in range(3):
+        game = new_game(ss, ptk.HeadlessScreen(70, 20))
+        game.place_star(count=30)
+        game.next_special_at = 1.0
+        check_free(game)
+        play(game, 300, seed, check_free)
+
+
+def test_free_cells_pick_uniformly_until_empty():
+    cells = [(0, x) for x in range(4)]
+    free = ss.FreeCells(cells)
+    random.seed(1)
+    picks = [free.choice() for _ in range(4000)]
+    assert all(800 < picks.count(c) < 1200 for c in cells)
+    assert free.remove((0, 1)) and not free.remove((0, 1))
+    for c in cells:
+        free.remove(c)
+    assert len(free) == 0 and free.choice() is None
+    free.add((2, 2))
+    free.add((2, 2))
+    assert len(free) == 1 and (2, 2) in free
+
+
+def full_frame(game):
+    """What a full repaint of the current state puts on a fresh screen."""
+    screen = ptk.HeadlessScreen(*reversed(game.stdscr.getmaxyx()))
+    live = game.stdscr
+    game.stdscr = screen
+    game._full_redraw = True
+    game.pre_draw()
+    game.draw()
+    game.stdscr = live
+    return screen._buffer, screen._attrs
+
+
+def test_incremental_frames_match_full_repaints():
+    game = new_game(ss, ptk.HeadlessScreen(80, 24))
+    game.place_star(count=20)
+    game.next_special_at = 1.0
+    frames = []
+
+    def draw(game):
+        game.pre_draw()
+        game.draw()
+        frames.append(1)
+        assert (game.stdscr._buffer, game.stdscr._attrs) == full_frame(game)
+
+    draw(game)
+    play(game, 300, 2, draw)
+    assert len(frames) > 20
@@ -0,0 +1,66 @@
+import os
+import random
+
+from game_classes import ptk
+from game_classes.grid import GridIndex
+from game_classes.headless import load_game_module, new_game
+from game_classes.tools import glyph
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sx = load_game_module(os.path.join(ROOT, 'games', 'star_ship_expanse', 'game.py'))
+
+
+def expanse(cols=80, rows=24):
+    random.seed(0)
+    return new_game(sx, ptk.HeadlessScreen(cols, rows))
+
+
+def test_world_is_scaled_from_the_viewport():
+    game = expanse()
+    assert (game.width, game.height) == (game.view_w * sx.WORLD_SCALE, game.view_h * sx.WORLD_SCALE)
+    assert len(game.stars) >= game.width * game.height // sx.STAR_DENSITY - 5
+
+
+def test_camera_centres_the_head_and_stays_in_the_world():
+    game = expanse()
+    for head, cam in (((game.height // 2, game.width // 2),
+                       (game.height // 2 - game.view_h // 2, game.width // 2 - game.view_w // 2)),
+                      ((0, 0), (0, 0)),
+                      ((game.height - 1, game.width - 1), (game.height - game.view_h, game.width - game.view_w))):
+        game.ship[0] = head
+        assert game.camera() == cam
+
+
+def test_head_is_drawn_at_its_viewport_cell():
+    game = expanse()
+    # near the bottom-left corner of the world, where the camera is clamped
+    game.ship.clear()
+    game.ship.extend((game.height - 3, x) for x in (5, 4, 3))
+    game.ship_cells = GridIndex(game.ship)
+    game.pre_draw()
+    game.draw()
+    cam_y, cam_x = game.camera()
+    assert (cam_y, cam_x) == (game.height - game.view_h, 0)
+    hy, hx = game.ship[0]
+    assert game.stdscr._buffer[hy - cam_y][hx - cam_x] == glyph('CIRCLE_FILLED')
+    assert game.stdscr._attrs[hy - cam_y][hx - cam_x] == ptk.color_pair(ptk.COLOR_GREEN) | ptk.A_BOLD
+
+
+def test_sparse_free_never_picks_a_taken_cell():
+    game = expanse(70, 20)
+    free = sx.SparseFree(game, tries=1000)
+    random.seed(5)
+    for _ in range(500):
+        cell = free.choice()
+        assert cell not in game.ship_cells and cell not in game.stars and cell != game.special
+        assert 0 <= cell[0] < game.height and 0 <= cell[1] < game.width
+
+
+def test_minimap_counts_every_star_and_rebuilds_on_change():
+    game = expanse()
+    counts = game.minimap_counts()
+    assert sum(map(sum, counts)) == len(game.stars)
+    assert game.minimap_counts() is counts
+    game.place_star(count=3)
+    counts = game.minimap_counts()
+    assert sum(map(sum, counts)) == len(game.stars)
@@ -0,0 +1,225 @@
+import os
+import random
+
+from game_classes import ptk
+from game_classes.bot import BotDriver
+from game_classes.headless import load_game_module, new_game, run_session
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+tt = load_game_module(os.path.join(ROOT, 'games', 'terminal_tumble', 'game.py'))
+WIDTH, HEIGHT = 11, 20
+
+
+def cells(shape, rot, x, y):
+    return {(x + bx, y + by) for bx, by in tt.SHAPES[shape][rot]}
+
+
+def naive_fits(filled, shape, rot, x, y):
+    # column 0 is the wall
+    return all(0 < cx < WIDTH and 0 <= cy < HEIGHT and (cx, cy) not in filled
+               for cx, cy in cells(shape, rot, x, y))
+
+
+def naive_clear(filled):
+    full = [y for y in range(HEIGHT) if all((x, y) in filled for x in range(1, WIDTH))]
+    out = set()
+    for x, y in filled:
+        if y not in full:
+            out.add((x, y + sum(1 for f in full if f > y)))
+    return out, len(full)
+
+
+def as_rows(filled):
+    rows = [1] * HEIGHT
+    for x, y in filled:
+        rows[y] |= 1 << x
+    return rows
+
+
+def random_drops(seed, count):
+    """Yield (board, filled, shape, rot, x, y) for random straight drops."""
+    rng = random.Random(seed)
+    board = tt.Board(WIDTH, HEIGHT)
+    filled = set()
+    for _ in range(count):
+        shape = rng.choice(sorted(tt.SHAPES))
+        drops = []
+        for rot in range(len(tt.SHAPES[shape])):
+            for x in range(-2, WIDTH):
+                if naive_fits(filled, shape, rot, x, 0):
+                    y = 0
+                    while naive_fits(filled, shape, rot, x, y + 1):
+                        y += 1
+                    drops.append((y, rot, x))
+        if not drops:
+            board, filled = tt.Board(WIDTH, HEIGHT), set()
+            continue
+        # half the pieces go as deep as they can, so lines fill and clear
+        y, rot, x = max(drops) if rng.random() < 0.5 else rng.choice(drops)
+        yield board, filled, shape, rot, x, y
+        board.place(tt.ROW_MASKS[shape][rot][0], x, y, shape)
+        filled |= cells(shape, rot, x, y)
+        cleared = board.clear_lines()
+        filled, expected = naive_clear(filled)
+        assert cleared == expected
+        assert board.rows == as_rows(filled)
+        if any(y < 4 for _, y in filled):
+            board, filled = tt.Board(WIDTH, HEIGHT), set()
+
+
+def test_board_bitmasks_match_a_cell_model():
+    rng = random.Random(9)
+    checked = 0
+    for board, filled, shape, rot, x, y in random_drops(1, 800):
+        masks, lo, hi = tt.ROW_MASKS[shape][rot]
+        for _ in range(5):
+            px, py = rng.randint(-3, WIDTH), rng.randint(-2, HEIGHT)
+            assert board.fits(masks, lo, hi, px, py) == naive_fits(filled, shape, rot, px, py)
+            checked += 1
+    assert checked > 3000
+
+
+def test_vertical_i_against_the_wall():
+    board = tt.Board(WIDTH, HEIGHT)
+    masks, lo, hi = tt.ROW_MASKS['I'][1]
+    # the vertical I sits in its third column, so x = -1 puts it in column 1
+    assert board.fits(masks, lo, hi, -1, 0)
+    assert not board.fits(masks, lo, hi, -2, 0)
+    board.place(masks, -1, HEIGHT - 4, 'I')
+    assert all(board.rows[r] == 0b11 for r in range(HEIGHT - 4, HEIGHT))
+    assert all(board.colors[r][1] == 'I' and board.colors[r][0] == 'W' for r in range(HEIGHT - 4, HEIGHT))
+
+
+def test_clear_lines_keeps_the_wall_and_drops_rows():
+    board = tt.Board(WIDTH, HEIGHT)
+    board.rows[-1] = board.full
+    board.rows[-2] = 0b101
+    board.colors[-2][2] = 'T'
+    assert board.clear_lines() == 1
+    assert board.rows[-1] == 0b101 and board.colors[-1][2] == 'T'
+    assert board.rows[0] == 1 and board.colors[0][0] == 'W'
+
+
+def full_frame(game):
+    """What a full repaint of the current state puts on a fresh screen."""
+    screen = ptk.HeadlessScreen(*reversed(game.stdscr.getmaxyx()))
+    # the live screen's incremental state: rows to redraw, cells to erase
+    live, dirty, stale = game.stdscr, set(game.board.dirty), game._piece_cells
+    game.stdscr = screen
+    game._full_redraw = True
+    game.pre_draw()
+    game.draw()
+    game.stdscr = live
+    game.board.dirty, game._piece_cells = dirty, stale
+    return screen._buffer, screen._attrs
+
+
+def test_incremental_frames_match_full_repaints():
+    random.seed(4)
+    game = new_game(tt, ptk.HeadlessScreen(100, 30))
+    # the placement bot clears lines, so cleared rows get redrawn too
+    driver = BotDriver(tt.PlacementBot(), budget=1.0)
+    game.events(ord('h'))
+    game.pre_draw()
+    game.draw()
+    for i in range(100):
+        for key in driver.keys(game):
+            game.events(key)
+        game.step(i * game.tick)
+        if game.over:
+            break
+        expected = full_frame(game)
+        game.pre_draw()
+        game.draw()
+        assert (game.stdscr._buffer, game.stdscr._attrs) == expected, i
+    assert game.scores['lines'] >= 4
+
+
+def reachable(board, shape, rot, x, y):
+    """(rot, x) pairs the piece reaches by rotating in place, then sliding."""
+    out = set()
+    n = len(tt.SHAPES[shape])
+    for turns in range(n):
+        r = (rot + turns) % n
+        masks, lo, hi = tt.ROW_MASKS[shape][r]
+        if not board.fits(masks, lo, hi, x, y):
+            break
+        for step in (-1, 1):
+            px = x
+            while board.fits(masks, lo, hi, px, y):
+                out.add((r, px))
+                px += step
+    return out
+
+
+def test_placements_are_exactly_the_reachable_drops():
+    checked = 0
+    for board, filled, shape, rot, x, y in random_drops(3, 300):
+        tops, holes = tt.scan(board.rows, WIDTH, HEIGHT)
+        found = list(tt.placements(board.rows, tops, WIDTH, HEIGHT, shape, 0, tt.SPAWN_X // 2, 0))
+        assert len(found) == len(set(found))
+        assert {(r, px) for r, px, _ in found} == reachable(board, shape, 0, tt.SPAWN_X // 2, 0)
+        for r, px, py in found:
+            masks, lo, hi = tt.ROW_MASKS[shape][r]
+            assert board.fits(masks, lo, hi, px, py) and not board.fits(masks, lo, hi, px, py + 1)
+            checked += 1
+    assert checked > 1000
+
+
+def test_drop_value_matches_a_full_evaluation():
+    used = 0
+    for board, filled, shape, rot, x, y in random_drops(5, 300):
+        tops, holes = tt.scan(board.rows, WIDTH, HEIGHT)
+        agg, bump = tt.surface_stats(tops, HEIGHT)
+        for r, px, py in tt.placements(board.rows, tops, WIDTH, HEIGHT, shape, 0, tt.SPAWN_X // 2, 0):
+            value = tt.drop_value(board.rows, tops, holes, agg, bump, WIDTH, shape, r, px, py, 2)
+            rows, lines = tt.drop(board.rows, WIDTH, HEIGHT, shape, r, px, py)
+            if value is None:
+                continue
+            assert lines == 0
+            assert abs(value - tt.evaluate(rows, WIDTH, HEIGHT, 2)) < 1e-9
+            used += 1
+    assert used > 1000
+
+
+def test_placement_bot_clears_lines():
+    stats = run_session(tt, 150, seed=1, cols=100, rows=30, policy=tt.PlacementBot(),
+                        budget=1.0, draw=False, restart=False)
+    assert not stats['over']
+    assert stats['scores']['lines'] >= 6
+
+
+def test_cached_tops_and_landing_follow_the_board():
+    rng = random.Random(6)
+    checked = 0
+    for board, filled, shape, rot, x, y in random_drops(7, 400):
+        assert board.tops == tt.scan(board.rows, WIDTH, HEIGHT)[0]
+        # `y` came from stepping down cell by cell; start anywhere above it
+        assert board.landing(shape, rot, x, rng.randint(0, y)) == y
+        checked += 1
+    assert checked > 300
+
+
+def test_landing_under_an_overhang_steps_down():
+    board = tt.Board(WIDTH, HEIGHT)
+    # a roof over columns 1-4 at row 10, the piece already below it
+    board.place(tt.ROW_MASKS['I'][0][0], 1, 9, 'I')
+    assert board.tops[1] == 10
+    assert board.landing('O', 0, 1, 11) == HEIGHT - 2
+
+
+def test_ghost_shows_where_a_hard_drop_lands():
+    random.seed(2)
+    rng = random.Random(2)
+    game = new_game(tt, ptk.HeadlessScreen(100, 30))
+    for _ in range(15):
+        for _ in range(rng.randint(0, 6)):
+            game.movement(rng.choice((ptk.KEY_LEFT, ptk.KEY_RIGHT, ptk.KEY_UP)))
+        ghost = game.ghost_cells()
+        before, lines = list(game.board.rows), game.scores['lines']
+        game.hard_drop()
+        if game.over or game.scores['lines'] != lines:
+            break
+        added = {(x, y) for y, (old, new) in enumerate(zip(before, game.board.rows))
+                 for x in range(game.board.width) if (new & ~old) >> x & 1}
+        assert added == ghost